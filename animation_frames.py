@@ -0,0 +1,121 @@
+"""
+Precomputed animation frames for field/radius scrubbing.
+
+Builds Plotly frames for every FIELD_SLIDER_CONFIG step × radius preset in a
+single vectorized evaluation, so scrubbing and playback run in the browser.
+Frames are grouped per radius: each radius gets its own field slider and play
+button, so playback sweeps the field at a fixed radius. Frames only carry the
+off-equilibrium y-arrays (float32); x-arrays and styling are shared with the
+base traces.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import plotly.graph_objects as go
+
+from config import FIELD_SLIDER_CONFIG, DEFAULT_RADIUS_PRESETS
+from utils import create_legend_label
+
+# Vertical distance between the per-radius sliders (fraction of the plot height)
+SLIDER_SPACING = 0.14
+
+
+def field_steps(config: Dict = FIELD_SLIDER_CONFIG) -> np.ndarray:
+    """Field values (MV/m) at every slider step."""
+    steps = np.arange(config['min'], config['max'] + config['step'] / 2, config['step'])
+    return np.round(steps, 6)
+
+
+def frame_name(E_MV_m: float, r_um: float) -> str:
+    return f"E={E_MV_m:.1f}|r={r_um:g}"
+
+
+def frame_group(r_um: float) -> str:
+    """Frame group holding every field step at one radius."""
+    return f"r={r_um:g}"
+
+
+def add_field_radius_frames(fig: go.Figure, thermo_engine, records: List[Dict],
+                            field_MV_m: float,
+                            radius_presets_m: Optional[List[float]] = None,
+                            trace_class=go.Scatter) -> go.Figure:
+    """
+    Attach field × radius frames, one field slider and play button per radius, to a figure.
+
+    Args:
+        fig: Figure whose off-equilibrium traces are listed in records
+        thermo_engine: ThermodynamicEngine used for the vectorized evaluation
+        records: Off-equilibrium trace records ({'index', 'material', 'T_K', ...}),
+            T_K being the temperatures the trace was sampled at
+        field_MV_m: Current field (every slider starts at this step)
+        radius_presets_m: Radii in m (defaults to DEFAULT_RADIUS_PRESETS)
+        trace_class: Trace type of the animated traces (go.Scatter or go.Scattergl)
+
+    Returns:
+        The same figure, with frames and animation controls
+    """
+    if not records:
+        return fig
+
+    radius_presets_m = radius_presets_m or DEFAULT_RADIUS_PRESETS
+    # WebGL traces are only updated by a full redraw
+    redraw = trace_class is go.Scattergl
+    E_values = field_steps()
+    r_values_um = [r * 1e6 for r in radius_presets_m]
+
+    # One vectorized call per material covers every radius × field
+    grids = [
+        thermo_engine.calc_off_equilibrium_DG_frames(
+            [record['material']], np.asarray(record['T_K']), E_values * 1e6, np.asarray(radius_presets_m)
+        )[0].astype(np.float32)
+        for record in records
+    ]
+    trace_indices = [record['index'] for record in records]
+
+    frames = []
+    frame_settings = dict(mode='immediate', frame=dict(duration=0, redraw=redraw), transition=dict(duration=0))
+    sliders = []
+    ie_current = int(np.argmin(np.abs(E_values - field_MV_m)))
+    for ir, r in enumerate(r_values_um):
+        steps = []
+        for ie, E in enumerate(E_values):
+            name = frame_name(E, r)
+            frames.append(go.Frame(
+                name=name,
+                group=frame_group(r),
+                traces=trace_indices,
+                data=[
+                    trace_class(y=grids[m][ir, ie], name=create_legend_label(record['material'], 'off_eq', E, r))
+                    for m, record in enumerate(records)
+                ]
+            ))
+            steps.append(dict(method='animate', label=f"{E:.1f}", args=[[name], frame_settings]))
+        sliders.append(dict(
+            active=ie_current,
+            steps=steps,
+            x=0.12, len=0.88, y=-0.12 - SLIDER_SPACING * ir,
+            yanchor='top',
+            currentvalue=dict(prefix=f"r = {r:g} µm, field (MV/m): "),
+            pad=dict(t=10)
+        ))
+
+    fig.frames = frames
+
+    # Play sweeps the field at one radius (its frame group)
+    play_args = dict(frame=dict(duration=80, redraw=redraw), transition=dict(duration=0),
+                     fromcurrent=True, mode='immediate')
+    buttons = [
+        dict(label=f"▶ r = {r:g} µm", method='animate', args=[frame_group(r), play_args])
+        for r in r_values_um
+    ]
+    buttons.append(dict(label="❚❚ Pause", method='animate',
+                        args=[[None], dict(frame=dict(duration=0, redraw=redraw), mode='immediate')]))
+
+    fig.update_layout(
+        updatemenus=[dict(type='buttons', direction='down', showactive=False, buttons=buttons,
+                          x=0, y=-0.12, xanchor='left', yanchor='top')],
+        sliders=sliders,
+        margin=dict(b=120 + 70 * len(r_values_um))
+    )
+    return fig
@@ -5,53 +5,81 @@ Main application for visualizing equilibrium and off-equilibrium Ellingham diagr
 for metal oxide reduction in Plasma Flash Reactors (PFR).
 """
 
+import time
+_boot_started = time.time()
+
+import logging
+
+from startup_profile import start_import_profile, finish_import_profile, mark, startup_phases
+start_import_profile()
+
 import dash
-from dash import dcc, html, Input, Output, State, callback_context
+from dash import dcc, html, Input, Output, State, callback_context, ClientsideFunction
+from dash.exceptions import MissingCallbackContextException
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import numpy as np
-import pandas as pd
 import dash_bootstrap_components as dbc
 from typing import List, Dict, Tuple
 
 # Import our modules
-from data_loader import load_janaf_data
-from thermo_calcs import ThermodynamicEngine
-from material_selector import create_material_selector, create_material_options
+from shared_tables import SharedTables
+from dataset_registry import DatasetRegistry
+from material_selector import create_material_selector, create_material_options, MaterialOptionSets
+from animation_frames import add_field_radius_frames
+from curve_sampling import adaptive_grid, decimate_indices
+from single_flight import coalesce, single_flight_stats
+from callback_metrics import instrument_callbacks, render_metrics
+from structured_logging import configure_logging, init_request_ids, log_stats
+from request_profiler import request_profiler
+from warm_cache import WarmCache, warm_cached, snapshot_version
+from figure_payload import (
+    compact_figure, expand_figure, encode_array, record_payload, payload_stats, record_render_timing,
+    render_stats
+)
 from utils import (
     kelvin_to_celsius, celsius_to_kelvin, mv_per_m_to_v_per_m, um_to_m,
     get_color_for_oxide, get_color_for_material, get_line_style, create_legend_label,
     validate_inputs, create_temperature_ticks, create_gas_ratio_ticks,
     create_info_text, get_default_materials, get_material_display_name
 )
-from config import DEFAULT_FIELD_PRESETS, DEFAULT_RADIUS_PRESETS, DEFAULT_TEMP_RANGE, TEMP_MARKERS, GAS_RATIO_TEMPS
-
-# Import custom compound modules
-from custom_compounds import CustomCompound, CustomCompoundManager, create_compound_from_template
-from custom_compound_ui import (
-    create_custom_compound_modal, create_custom_compound_management_panel,
-    create_custom_compound_list_item, create_custom_compound_validation_alert,
-    create_custom_compound_export_data, parse_custom_compound_import_data
+from config import (
+    DEFAULT_FIELD_PRESETS, DEFAULT_RADIUS_PRESETS, DEFAULT_TEMP_RANGE, TEMP_MARKERS, GAS_RATIO_TEMPS,
+    MATERIAL_SEARCH_TOP_K, MATERIAL_BROWSE_LIMIT, GAS_RATIO_SAMPLING_TOLERANCE,
+    HIGH_VOLUME_MATERIAL_THRESHOLD, HIGH_VOLUME_MAX_POINTS
 )
 
+# Custom compound modules are imported eagerly: the layout and the option sets
+# need them at startup (the callback-only helpers are imported on first use)
+from custom_compounds import CustomCompoundManager
+from custom_compound_ui import create_custom_compound_modal, create_custom_compound_management_panel
+
+# Queued, rate-limited logging (LOG_LEVEL, LOG_FORMAT); see structured_logging
+configure_logging()
+logger = logging.getLogger(__name__)
+
 # Initialize Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "Off-Equilibrium Ellingham Diagrams"
 
+# Time every callback registered below (see /metrics) and let admins profile them (see /api/profiling)
+instrument_callbacks(app, wrappers=[request_profiler.profiled])
+
+# Correlation ID on every request's log records (X-Request-ID)
+init_request_ids(app.server)
+
 # Authentication setup
 import os
 import sys
+import glob
+import threading
 
 # Try to import dash_auth with fallback
 AUTH_AVAILABLE = False
 try:
     from dash_auth import BasicAuth
     AUTH_AVAILABLE = True
-    print("✅ dash_auth imported successfully")
 except ImportError as e:
-    print(f"❌ dash_auth import failed: {e}")
-    print("⚠️  Running without authentication for Railway compatibility")
+    logger.warning("dash_auth import failed (%s); running without authentication for Railway compatibility", e)
     AUTH_AVAILABLE = False
 
 # Environment-based credentials for security
@@ -61,32 +89,253 @@ USERNAME_PASSWORD_PAIRS = {
     os.getenv('STUDENT_USER', 'student'): os.getenv('STUDENT_PASS', 'student2025')
 }
 
+def _is_admin() -> bool:
+    """Whether the current Flask request carries the admin credentials (guards admin endpoints)."""
+    import hmac
+    from flask import request
+    admin_user = os.getenv('ADMIN_USER', 'admin')
+    credentials = request.authorization
+    return (credentials is not None and credentials.username == admin_user
+            and hmac.compare_digest(credentials.password or '', USERNAME_PASSWORD_PAIRS[admin_user]))
+
+def _is_signed_in() -> bool:
+    """Whether the current Flask request carries the credentials of any configured user."""
+    import hmac
+    from flask import request
+    credentials = request.authorization
+    if credentials is None or credentials.username not in USERNAME_PASSWORD_PAIRS:
+        return False
+    return hmac.compare_digest(credentials.password or '', USERNAME_PASSWORD_PAIRS[credentials.username])
+
+request_profiler.authorize = _is_admin
+
 # Apply authentication (if available)
 if AUTH_AVAILABLE:
     auth = BasicAuth(app, USERNAME_PASSWORD_PAIRS)
-    print("✅ Authentication enabled - App is secure")
+    logger.info("Authentication enabled")
 else:
-    print("⚠️  Running without authentication - Railway compatibility mode")
+    logger.warning("Running without authentication - Railway compatibility mode")
+
+# BasicAuth only guards the Dash routes, so the /api/* routes added below
+# check the credentials here (/health, /ready and /metrics stay public)
+API_PREFIX = '/api/'
+
+@app.server.before_request
+def require_credentials():
+    """Reject /api/* requests without the credentials of a configured user."""
+    from flask import request
+    if AUTH_AVAILABLE and request.path.startswith(API_PREFIX) and not _is_signed_in():
+        return {'error': 'credentials required'}, 401, {'WWW-Authenticate': 'Basic realm="Ellingham"'}
 
 # Add health check endpoint
 @app.server.route('/health')
 def health_check():
     """Health check endpoint for Railway deployment."""
     auth_status = 'enabled' if AUTH_AVAILABLE else 'disabled'
-    return {'status': 'healthy', 'version': '2.0.4', 'auth': auth_status, 'railway': 'compatible'}, 200
+    return {'status': 'healthy', 'version': '2.0.4', 'auth': auth_status, 'railway': 'compatible',
+            'dataset_version': datasets.version}, 200
+
+@app.server.route('/metrics')
+def metrics():
+    """Per-callback latency, CPU, payload and cache metrics in Prometheus text format."""
+    from flask import Response
+    gauges = {
+        'ellingham_warm_cache_entries': warm_cache.stats['entries'],
+        'ellingham_warm_cache_hits_total': warm_cache.stats['hits'],
+        'ellingham_warm_cache_misses_total': warm_cache.stats['misses'],
+        'ellingham_ready': 1 if app_ready.is_set() else 0,
+        'ellingham_log_dropped_total': log_stats()['dropped'],
+        'ellingham_log_suppressed_total': log_stats()['suppressed']
+    }
+    return Response(render_metrics(gauges), mimetype='text/plain; version=0.0.4')
+
+# Readiness is separate from liveness: /health answers as soon as the
+# process is up, /ready only once data is loaded and warm_up() has run
+app_ready = threading.Event()
+warm_up_report = {}
+
+@app.server.after_request
+def record_first_interactive(response):
+    """Time from process start to the first callback answered after warm-up."""
+    from flask import request
+    if (app_ready.is_set() and 'time_to_first_interactive_seconds' not in warm_up_report
+            and request.path.endswith('/_dash-update-component') and response.status_code == 200):
+        warm_up_report['time_to_first_interactive_seconds'] = round(time.time() - _boot_started, 3)
+    return response
+
+@app.server.route('/ready')
+def readiness_check():
+    """Readiness endpoint for load balancers / zero-downtime deploys."""
+    if not app_ready.is_set():
+        return {'status': 'starting', **warm_up_report}, 503
+    return {'status': 'ready', **warm_up_report}, 200
 
-# Load data with error handling
-print("Loading JANAF thermodynamic data...")
+@app.server.route('/api/profiling', methods=['GET', 'POST'])
+def profiling_endpoint():
+    """Arm profiling of the next N callbacks (POST count, mode, callback) or list stored profiles (admin only)."""
+    from flask import request
+    if not _is_admin():
+        return {'error': 'admin credentials required'}, 401
+    if request.method == 'POST':
+        params = request.get_json(silent=True) or request.values
+        try:
+            armed = request_profiler.arm(int(params.get('count', 1)), params.get('mode', 'sampling'),
+                                         params.get('callback') or None)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return {'armed': armed}, 200
+    return {'armed': request_profiler.armed(), 'profiles': request_profiler.list_profiles()}, 200
+
+@app.server.route('/api/profiling/<profile_id>')
+def profile_download(profile_id):
+    """Download a stored profile (.pstats or .folded); ?meta=1 for its metadata and inputs (admin only)."""
+    from flask import request, send_file
+    if not _is_admin():
+        return {'error': 'admin credentials required'}, 401
+    path = request_profiler.path_of(profile_id, 'meta' if request.args.get('meta') else 'data')
+    if path is None:
+        return {'error': 'profile not found'}, 404
+    return send_file(path, as_attachment=not request.args.get('meta'))
+
+def _memory_components() -> Dict:
+    """Long-lived structures measured by /api/memory (earlier entries own shared objects)."""
+    dataset = datasets.current()
+    loader = dataset.data_loader if dataset else None
+    components = {}
+    if loader is not None:
+        components['loader.raw_data'] = loader.raw_data
+        components['loader.derived'] = [loader.processed_data, loader.categories_data,
+                                        loader.compound_index, loader.search_index]
+        components['shared_tables.view'] = dataset.thermo_engine._table_view()
+    components['previous_datasets'] = [d.data_loader for d in datasets.history if d is not dataset]
+    components['warm_cache'] = warm_cache._entries
+    components['option_sets'] = material_option_sets
+    components['custom_compounds'] = custom_compound_manager
+    components['stats'] = [payload_stats(), render_stats(), warm_up_report]
+    return components
+
+@app.server.route('/api/memory')
+def memory_endpoint():
+    """Retained sizes of data, caches and compound stores plus RSS and tracing status (admin only)."""
+    from memory_report import memory_report, allocation_tracer
+    if not _is_admin():
+        return {'error': 'admin credentials required'}, 401
+    return dict(memory_report(_memory_components()), tracemalloc=allocation_tracer.status()), 200
+
+@app.server.route('/api/memory/tracemalloc', methods=['GET', 'POST'])
+def tracemalloc_endpoint():
+    """
+    Allocation tracing (admin only).
+    
+    POST action=start (frames), snapshot (label) or stop; GET with
+    from=<label>&to=<label> (and optionally limit, group_by) diffs two
+    snapshots into the top allocation sites.
+    """
+    from flask import request
+    from memory_report import allocation_tracer
+    if not _is_admin():
+        return {'error': 'admin credentials required'}, 401
+    params = request.get_json(silent=True) or request.values
+    try:
+        if request.method == 'POST':
+            action = params.get('action')
+            if action == 'start':
+                return allocation_tracer.start(int(params.get('frames', 10))), 200
+            if action == 'snapshot':
+                return {'snapshot': allocation_tracer.snapshot(params.get('label')), **allocation_tracer.status()}, 200
+            if action == 'stop':
+                return allocation_tracer.stop(), 200
+            return {'error': 'action must be start, snapshot or stop'}, 400
+        if not params.get('from') or not params.get('to'):
+            return allocation_tracer.status(), 200
+        return {'top': allocation_tracer.diff(params['from'], params['to'], int(params.get('limit', 25)),
+                                              params.get('group_by', 'lineno'))}, 200
+    except (RuntimeError, KeyError, ValueError) as e:
+        return {'error': str(e)}, 400
+
+@app.server.route('/api/scrape-progress')
+def scrape_progress():
+    """Latest snapshot of the JANAF scraper progress manifest (rate and ETA included)."""
+    from scrape_progress import read_latest
+    snapshot = read_latest()
+    if snapshot is None:
+        return {'status': 'no scrape in progress'}, 404
+    return snapshot, 200
+
+@app.server.route('/api/payload-stats')
+def payload_stats_endpoint():
+    """Serialized callback output sizes in bytes (calls, last, mean, max)."""
+    return payload_stats(), 200
+
+@app.server.route('/api/single-flight')
+def single_flight_endpoint():
+    """Callback coalescing counters (calls, computed, shared)."""
+    return single_flight_stats(), 200
+
+@app.server.route('/api/render-timings', methods=['GET', 'POST'])
+def render_timings_endpoint():
+    """Browser frame times: POST samples from assets/render_timing.js, GET the summary (signed-in users)."""
+    from flask import request
+    if request.method == 'POST':
+        record_render_timing(request.get_json(force=True, silent=True) or {})
+        return '', 204
+    return render_stats(), 200
+
+mark('imports')
+
+# Load data with error handling. data_loader and thermo_engine resolve to
+# the dataset version pinned for the current request (see dataset_registry),
+# so a new version can be swapped in without restarting
+logger.info("Loading JANAF thermodynamic data...")
+datasets = DatasetRegistry(shared_tables=SharedTables(), required_materials=get_default_materials())
 try:
-    data_loader = load_janaf_data()
-    thermo_engine = ThermodynamicEngine(data_loader)
-    print("✅ JANAF data loaded successfully")
+    datasets.activate(datasets.load())
+    logger.info("JANAF data loaded (dataset %s)", datasets.version)
 except Exception as e:
-    print(f"❌ Error loading JANAF data: {e}")
-    print("App will start with limited functionality")
-    # Create a minimal data loader for graceful degradation
-    data_loader = None
-    thermo_engine = None
+    logger.error("Error loading JANAF data: %s; the app will start with limited functionality", e)
+data_loader = datasets.proxy('data_loader')
+thermo_engine = datasets.proxy('thermo_engine')
+
+@app.server.before_request
+def pin_dataset():
+    """Pin the active dataset version for this request (in-flight requests survive a swap)."""
+    from flask import g
+    g.dataset_token = datasets.pin()
+    datasets.start_watching()
+
+@app.server.teardown_request
+def unpin_dataset(exc=None):
+    from flask import g
+    token = g.pop('dataset_token', None)
+    if token is not None:
+        datasets.unpin(token)
+
+@app.server.route('/api/datasets')
+def datasets_endpoint():
+    """Active dataset version, recent versions and reload state."""
+    return datasets.status(), 200
+
+@app.server.route('/api/datasets/reload', methods=['POST'])
+def reload_datasets():
+    """Load, validate and swap in the current data files in the background (admin only)."""
+    if not _is_admin():
+        return {'error': 'admin credentials required'}, 401
+    datasets.reload_async()
+    return {'status': 'reloading', 'active': datasets.version}, 202
+
+mark('data_load')
+
+# Warm cache of default-view results, persisted across restarts as a
+# snapshot keyed on the code, the dataset version and the app version
+from version import __version__
+_app_sources = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py')))
+
+def _warm_cache_version() -> str:
+    return snapshot_version(_app_sources, extra={'version': __version__, 'dataset': datasets.version})
+
+warm_cache = WarmCache(version=_warm_cache_version())
+
+mark('warm_cache')
 
 # Initialize custom compound manager
 custom_compound_manager = CustomCompoundManager()
@@ -95,20 +344,38 @@ custom_compound_manager = CustomCompoundManager()
 if data_loader:
     try:
         categories_data = data_loader.get_categories_data()
-        print(f"Loaded {data_loader.raw_data['metadata']['total_compounds']} compounds across {len(categories_data)} categories")
+        logger.info("Loaded %d compounds across %d categories",
+                    data_loader.raw_data['metadata']['total_compounds'], len(categories_data))
     except Exception as e:
-        print(f"❌ Error getting categories data: {e}")
+        logger.error("Error getting categories data: %s", e)
         categories_data = {}
 else:
-    print("⚠️ Using empty categories data due to data loading error")
+    logger.warning("Using empty categories data due to data loading error")
     categories_data = {}
 
+# Precompute dropdown option sets (rebuilt on data reload or custom compound changes)
+material_option_sets = MaterialOptionSets(data_loader, custom_compound_manager, MATERIAL_BROWSE_LIMIT)
+if data_loader:
+    try:
+        material_option_sets.refresh()
+    except Exception as e:
+        logger.error("Error precomputing material options: %s", e)
+
+@app.server.route('/api/material-options/<path:key>')
+def material_options_blob(key):
+    """Serve a precomputed option set ('category/<name>', 'metal/<name>' or 'metals') as JSON."""
+    from flask import Response
+    blob = material_option_sets.blob(key) if data_loader else None
+    if blob is None:
+        return {'error': f'unknown option set {key}'}, 404
+    return Response(blob, mimetype='application/json')
+
 # Get default materials (with error handling)
 try:
     default_materials = get_default_materials()
-    print(f"Default materials: {default_materials}")
+    logger.info("Default materials: %s", default_materials)
 except Exception as e:
-    print(f"❌ Error getting default materials: {e}")
+    logger.error("Error getting default materials: %s", e)
     default_materials = []
 
 # App layout
@@ -254,7 +521,9 @@ app.layout = dbc.Container([
                         id='display-options',
                         options=[
                             {"label": "Show Equilibrium Lines", "value": "equilibrium"},
-                            {"label": "Show Off-Equilibrium Lines", "value": "off_equilibrium"}
+                            {"label": "Show Off-Equilibrium Lines", "value": "off_equilibrium"},
+                            {"label": "Client-side Slider Updates", "value": "clientside"},
+                            {"label": "Animate Field/Radius", "value": "animate"}
                         ],
                         value=["equilibrium", "off_equilibrium"],
                         inline=False
@@ -354,6 +623,8 @@ app.layout = dbc.Container([
                         )
                     ], className="mt-2")
                 ], className="d-flex justify-content-end"),
+                # Coefficients for clientside ΔG_eff evaluation
+                dcc.Store(id='dg-coefficients-store'),
                 # Download components
                 dcc.Download(id="download-svg"),
                 dcc.Download(id="download-pdf")
@@ -382,6 +653,8 @@ app.layout = dbc.Container([
         create_custom_compound_modal()
 ], fluid=True)
 
+mark('layout')
+
 
 # Callbacks
 # Add client-side callback to preserve material selection
@@ -398,6 +671,18 @@ app.clientside_callback(
     prevent_initial_call=True
 )
 
+# Clientside ΔG_eff evaluation for slider scrubbing (see assets/clientside.js)
+app.clientside_callback(
+    ClientsideFunction(namespace='ellingham', function_name='updateOffEquilibrium'),
+    Output('ellingham-plot', 'figure', allow_duplicate=True),
+    [Input('field-slider', 'value'),
+     Input('radius-radio', 'value'),
+     Input('radius-custom', 'value')],
+    [State('ellingham-plot', 'figure'),
+     State('dg-coefficients-store', 'data')],
+    prevent_initial_call=True
+)
+
 @app.callback(
     Output("collapse-gas-scales", "is_open"),
     [Input("collapse-gas-scales-button", "n_clicks")],
@@ -413,38 +698,36 @@ def toggle_gas_scales_collapse(n_clicks, is_open):
     Output('material-dropdown', 'options'),
     [Input('material-category-tabs', 'active_tab'),
      Input('metal-group-dropdown', 'value'),
-     Input('material-grouping-mode', 'value')]
+     Input('material-grouping-mode', 'value'),
+     Input('material-dropdown', 'search_value')],
+    [State('material-dropdown', 'value')]
 )
-def update_material_options(active_tab, selected_metal, grouping_mode):
-    """Update dropdown options based on selected category tab or metal grouping."""
+def update_material_options(active_tab, selected_metal, grouping_mode, search_value=None, selected=None):
+    """Update dropdown options based on selected category tab, metal grouping or typed search."""
     
     try:
-        if grouping_mode == 'metal' and selected_metal:
-            # Metal grouping mode
-            from material_selector import get_materials_by_metal
-            materials = get_materials_by_metal(categories_data, selected_metal)
+        search_index = data_loader.get_search_index()
+        
+        if search_value:
+            # Typeahead: top-k matches across all compounds
+            options = search_index.options(search_index.search(search_value, k=MATERIAL_SEARCH_TOP_K))
+        elif grouping_mode == 'metal' and selected_metal:
+            # Metal grouping mode (precomputed, capped at MATERIAL_BROWSE_LIMIT)
+            options = material_option_sets.for_metal(selected_metal)
         else:
-            # Category grouping mode
+            # Category grouping mode (precomputed, capped at MATERIAL_BROWSE_LIMIT)
             if active_tab is None:
                 active_tab = 'oxides'
-            materials = data_loader.get_available_materials(category=active_tab)
+            options = material_option_sets.for_category(active_tab)
         
-        # Create options with proper formatting
-        options = []
-        for material in materials:
-            material_data = data_loader.get_material_data(material)
-            if material_data:
-                formula = material_data.get('formula', '')
-                options.append({
-                    "label": get_material_display_name(material),
-                    "value": material,
-                    "search": f"{material} {formula}".lower()
-                })
+        # Selected values must stay in the options or the dropdown drops them
+        shown = {option['value'] for option in options}
+        missing = [name for name in (selected or []) if name not in shown]
         
-        return options
+        return options + search_index.options(missing) if missing else options
         
     except Exception as e:
-        print(f"Error updating material options: {e}")
+        logger.warning("Error updating material options: %s", e)
         return []
 
 
@@ -474,9 +757,8 @@ def toggle_grouping_mode(grouping_mode):
         category_style = {'display': 'none'}
         metal_style = {'display': 'block'}
         
-        # Get metal options
-        from material_selector import create_metal_group_options
-        metal_options = create_metal_group_options(categories_data)
+        # Get metal options (precomputed)
+        metal_options = material_option_sets.metal_groups()
         
     else:
         # Show category tabs, hide metal grouping
@@ -498,8 +780,33 @@ def preserve_material_selection(grouping_mode, current_selection):
     return current_selection
 
 
+# Inputs the clientside evaluator can handle without a server round trip
+CLIENTSIDE_INPUTS = {'field-slider', 'radius-radio', 'radius-custom'}
+
+def _triggered_ids() -> set:
+    """Component ids that triggered the current callback (empty outside a callback)."""
+    try:
+        return {t['prop_id'].split('.')[0] for t in callback_context.triggered if t['prop_id'] != '.'}
+    except (MissingCallbackContextException, LookupError):
+        return set()
+
+def _dataset_key(*args, **kwargs):
+    """Key material for data-dependent callbacks: the arguments plus the request's dataset version."""
+    dataset = datasets.current()
+    return [dataset.version if dataset else None, args, kwargs]
+
+def _plot_cache_key(materials, field_MV_m, radius_radio, radius_custom, temp_range, display_options,
+                    comparison_mode, gas_scales, gas_composition, coefficient_store=None):
+    """Key material for update_plot: the store and trigger only matter in clientside mode."""
+    key = [materials, field_MV_m, radius_radio, radius_custom, temp_range, display_options,
+           comparison_mode, gas_scales, gas_composition]
+    if 'clientside' in (display_options or []):
+        key += [coefficient_store, sorted(_triggered_ids())]
+    return _dataset_key(*key)
+
 @app.callback(
-    Output('ellingham-plot', 'figure'),
+    [Output('ellingham-plot', 'figure'),
+     Output('dg-coefficients-store', 'data')],
     [Input('material-dropdown', 'value'),
      Input('field-slider', 'value'),
      Input('radius-radio', 'value'),
@@ -508,12 +815,30 @@ def preserve_material_selection(grouping_mode, current_selection):
      Input('display-options', 'value'),
      Input('comparison-mode', 'value'),
      Input('gas-scale-options', 'value'),
-     Input('gas-composition-radio', 'value')]  # New input
+     Input('gas-composition-radio', 'value')],  # New input
+    [State('dg-coefficients-store', 'data')]
 )
-def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range, display_options, comparison_mode, gas_scales, gas_composition):
-    """Update the Ellingham diagram plot."""
+@warm_cached(warm_cache, key_func=_plot_cache_key)
+@coalesce(key_func=_plot_cache_key)
+def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range, display_options, comparison_mode, gas_scales, gas_composition,
+                coefficient_store=None):
+    """Update the Ellingham diagram plot.
+    
+    In clientside mode, field/radius changes are evaluated in the browser from
+    the coefficient store; this server path remains the fallback whenever the
+    store cannot reproduce the figure (e.g. gas scales driven by ΔG_eff).
+    """
+    triggered = _triggered_ids()
+    if (coefficient_store and coefficient_store.get('enabled')
+            and 'clientside' in (display_options or [])
+            and triggered and triggered <= CLIENTSIDE_INPUTS):
+        return dash.no_update, dash.no_update
+    
     if not materials:
-        return go.Figure()
+        return compact_figure(go.Figure()), None
+    
+    clientside_records = []
+    clientside_hover = []
     
     # Get particle radius
     if radius_radio == 'custom':
@@ -526,11 +851,8 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
     r_m = um_to_m(r_um)
     T_min_K, T_max_K = temp_range
     
-    # Create temperature array
-    T_K = np.linspace(T_min_K, T_max_K, 200)
-    T_C = kelvin_to_celsius(T_K)
-    
     # Create subplot with secondary axes
+    from plotly.subplots import make_subplots
     fig = make_subplots(
         rows=1, cols=1,
         specs=[[{"secondary_y": True}]]
@@ -551,6 +873,12 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
         normalization = 'metal'  # Normalize to metal for comparison
         y_label = "ΔG (kJ/mol Metal)"
     
+    # High-volume mode: WebGL traces without spline smoothing (unsupported by
+    # Scattergl), points min/max decimated to a per-material budget, gas scales merged
+    high_volume = len(materials) >= HIGH_VOLUME_MATERIAL_THRESHOLD
+    Trace = go.Scattergl if high_volume else go.Scatter
+    line_shape = {} if high_volume else dict(shape='spline', smoothing=0.3)  # Smooth curves like professional diagrams
+    
     # Add traces for each material
     for material in materials:
         # Get material data from the new structure
@@ -563,10 +891,20 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
         if not processed_data:
             continue
             
+        # Per-material adaptive temperature grid (shared by both curves)
+        T_K = thermo_engine.sample_temperatures(material, T_min_K, T_max_K)
+        T_C = kelvin_to_celsius(T_K)
+        
         # Calculate equilibrium and off-equilibrium curves using normalized method
         DG_eq, unit = thermo_engine.calc_equilibrium_DG_normalized(material, T_K, normalization)
         DG_eff = thermo_engine.calc_off_equilibrium_DG(material, T_K, E_V_m, r_m)
         
+        if high_volume:
+            DG_eq = np.broadcast_to(np.asarray(DG_eq, dtype=float), T_K.shape)
+            DG_eff = np.broadcast_to(np.asarray(DG_eff, dtype=float), T_K.shape)
+            keep = decimate_indices(T_K, [DG_eq, DG_eff], HIGH_VOLUME_MAX_POINTS)
+            T_K, T_C, DG_eq, DG_eff = T_K[keep], T_C[keep], DG_eq[keep], DG_eff[keep]
+        
         # Get color and group using new metal-based system
         element = processed_data.get('element', 'Unknown')
         formula = material_data.get('formula', '')
@@ -575,8 +913,9 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
         
         # Add equilibrium line with professional styling
         if 'equilibrium' in display_options:
+            clientside_hover.append(len(fig.data))
             fig.add_trace(
-                go.Scatter(
+                Trace(
                     x=T_C, y=DG_eq,
                     mode='lines',
                     name=create_legend_label(material, 'equilibrium', field_MV_m, r_um),
@@ -584,8 +923,7 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
                         color=color, 
                         width=3, 
                         dash='solid',
-                        shape='spline',  # Smooth curves like professional diagrams
-                        smoothing=0.3
+                        **line_shape
                     ),
                     hovertemplate=f"<b>{material}</b><br>" +
                                  f"Formula: {formula}<br>" +
@@ -604,8 +942,12 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
         
         # Add off-equilibrium line with professional styling
         if 'off_equilibrium' in display_options:
+            coefficients = thermo_engine.get_off_equilibrium_coefficients(material)
+            if coefficients:
+                clientside_records.append(dict(coefficients, index=len(fig.data), material=material, T_K=T_K))
+            clientside_hover.append(len(fig.data))
             fig.add_trace(
-                go.Scatter(
+                Trace(
                     x=T_C, y=DG_eff,
                     mode='lines',
                     name=create_legend_label(material, 'off_eq', field_MV_m, r_um),
@@ -613,8 +955,7 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
                         color=color, 
                         width=2, 
                         dash='dash',
-                        shape='spline',  # Smooth curves
-                        smoothing=0.3
+                        **line_shape
                     ),
                     hovertemplate=f"<b>{material}</b><br>" +
                                  f"Formula: {formula}<br>" +
@@ -645,6 +986,7 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
     )
     
     # Add nomographic gas ratio scales
+    gas_ratios_depend_on_field = False
     if gas_scales and len(gas_scales) > 0 and materials:
         try:
             # Use first material for gas ratio calculation
@@ -653,54 +995,88 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
             # Calculate gas ratios based on what's being displayed
             if 'equilibrium' in display_options and 'off_equilibrium' in display_options:
                 # If both are shown, use equilibrium for gas ratios (standard practice)
-                DG_for_gas_ratios = thermo_engine.calc_equilibrium_DG(material, T_K)
+                DG_for_gas_ratios = lambda T: thermo_engine.calc_equilibrium_DG(material, T)
                 gas_ratio_label_suffix = " (Equilibrium)"
             elif 'equilibrium' in display_options:
-                DG_for_gas_ratios = thermo_engine.calc_equilibrium_DG(material, T_K)
+                DG_for_gas_ratios = lambda T: thermo_engine.calc_equilibrium_DG(material, T)
                 gas_ratio_label_suffix = " (Equilibrium)"
             elif 'off_equilibrium' in display_options:
                 # Use off-equilibrium values for gas ratios
-                DG_for_gas_ratios = thermo_engine.calc_off_equilibrium_DG(material, T_K, E_V_m, r_m)
+                DG_for_gas_ratios = lambda T: thermo_engine.calc_off_equilibrium_DG(material, T, E_V_m, r_m)
                 gas_ratio_label_suffix = " (Off-Equilibrium)"
+                gas_ratios_depend_on_field = True
             else:
                 # Default to equilibrium
-                DG_for_gas_ratios = thermo_engine.calc_equilibrium_DG(material, T_K)
+                DG_for_gas_ratios = lambda T: thermo_engine.calc_equilibrium_DG(material, T)
                 gas_ratio_label_suffix = " (Equilibrium)"
             
+            # Adaptive grid for the selected scales (they curve like 1/T)
+            def selected_ratios(T):
+                ratios = thermo_engine.calc_comprehensive_gas_ratios(T, DG_for_gas_ratios(T))
+                return [ratios[key] for key in gas_scales if key in ratios]
+            
+            T_K = adaptive_grid(selected_ratios, T_min_K, T_max_K, tol=GAS_RATIO_SAMPLING_TOLERANCE,
+                                breakpoints=thermo_engine.get_DG_breakpoints(material))
+            T_C = kelvin_to_celsius(T_K)
+            
             # Calculate all gas ratios using the appropriate DG values
-            all_ratios = thermo_engine.calc_comprehensive_gas_ratios(T_K, DG_for_gas_ratios)
+            all_ratios = thermo_engine.calc_comprehensive_gas_ratios(T_K, DG_for_gas_ratios(T_K))
             metadata = thermo_engine.get_gas_ratio_metadata()
             
-            # Add selected gas ratio traces
-            for gas_key in gas_scales:
-                if gas_key in all_ratios:
-                    gas_info = metadata[gas_key]
-                    
-                    fig.add_trace(
-                        go.Scatter(
-                            x=T_C,
-                            y=all_ratios[gas_key],
-                            mode='lines',
-                            name=gas_info['label'] + gas_ratio_label_suffix,
-                            line=dict(
-                                color=gas_info['color'],
-                                width=1.5,
-                                dash='dot',
-                                shape='spline',
-                                smoothing=0.3
+            if high_volume:
+                # All selected scales as one NaN-separated trace
+                gas_keys = [key for key in gas_scales if key in all_ratios]
+                gap = [np.nan]
+                fig.add_trace(
+                    go.Scattergl(
+                        x=np.concatenate([np.r_[T_C, gap] for _ in gas_keys]),
+                        y=np.concatenate([np.r_[all_ratios[key], gap] for key in gas_keys]),
+                        text=[metadata[key]['label'] for key in gas_keys for _ in range(len(T_C) + 1)],
+                        mode='lines',
+                        name="Gas Ratios" + gas_ratio_label_suffix,
+                        line=dict(color='rgba(90,90,90,0.8)', width=1.5, dash='dot'),
+                        connectgaps=False,
+                        yaxis='y2',
+                        hovertemplate="<b>%{text}</b><br>" +
+                                     f"Based on: {gas_ratio_label_suffix.strip(' ()')}<br>" +
+                                     "Temperature: %{x:.0f}°C<br>" +
+                                     "Log Value: %{y:.2f}<extra></extra>",
+                        showlegend=True,
+                        legendgroup='gas_ratios'
+                    ),
+                    secondary_y=True
+                )
+            else:
+                # Add selected gas ratio traces
+                for gas_key in gas_scales:
+                    if gas_key in all_ratios:
+                        gas_info = metadata[gas_key]
+                        
+                        fig.add_trace(
+                            go.Scatter(
+                                x=T_C,
+                                y=all_ratios[gas_key],
+                                mode='lines',
+                                name=gas_info['label'] + gas_ratio_label_suffix,
+                                line=dict(
+                                    color=gas_info['color'],
+                                    width=1.5,
+                                    dash='dot',
+                                    shape='spline',
+                                    smoothing=0.3
+                                ),
+                                yaxis='y2',
+                                hovertemplate=f"<b>{gas_info['label']}</b><br>" +
+                                             f"{gas_info['description']}<br>" +
+                                             f"Based on: {gas_ratio_label_suffix.strip(' ()')}<br>" +
+                                             "Temperature: %{x:.0f}°C<br>" +
+                                             "Log Value: %{y:.2f}<br>" +
+                                             f"Actual Ratio: {10**all_ratios[gas_key][0]:.1e}<extra></extra>",
+                                showlegend=True,
+                                legendgroup='gas_ratios'
                             ),
-                            yaxis='y2',
-                            hovertemplate=f"<b>{gas_info['label']}</b><br>" +
-                                         f"{gas_info['description']}<br>" +
-                                         f"Based on: {gas_ratio_label_suffix.strip(' ()')}<br>" +
-                                         "Temperature: %{x:.0f}°C<br>" +
-                                         "Log Value: %{y:.2f}<br>" +
-                                         f"Actual Ratio: {10**all_ratios[gas_key][0]:.1e}<extra></extra>",
-                            showlegend=True,
-                            legendgroup='gas_ratios'
-                        ),
-                        secondary_y=True
-                    )
+                            secondary_y=True
+                        )
             
             # Configure secondary y-axis with nomographic styling
             if fig.data:  # Only if traces were added
@@ -724,9 +1100,7 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
                 )
                 
         except Exception as e:
-            print(f"Warning: Could not add nomographic gas ratio scales: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("Could not add nomographic gas ratio scales: %s", e, exc_info=True)
     
     # Determine plot title based on display options and comparison mode
     if 'equilibrium' in display_options and 'off_equilibrium' in display_options:
@@ -803,7 +1177,7 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
     # Add temperature markers
     for T_marker in TEMP_MARKERS:
         T_marker_C = T_marker
-        if T_marker_C >= T_C.min() and T_marker_C <= T_C.max():
+        if T_marker_C >= kelvin_to_celsius(T_min_K) and T_marker_C <= kelvin_to_celsius(T_max_K):
             fig.add_vline(
                 x=T_marker_C,
                 line_dash="dot",
@@ -812,7 +1186,25 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
                 annotation_text=f"{T_marker_C}°C"
             )
     
-    return fig
+    # Precomputed field × radius frames for in-browser scrubbing/playback
+    if 'animate' in display_options and clientside_records:
+        add_field_radius_frames(fig, thermo_engine, clientside_records, field_MV_m, trace_class=Trace)
+    
+    # Coefficient records for the clientside evaluator (disabled when the
+    # figure has field-dependent parts it cannot recompute). Records and
+    # their temperature grids (as typed arrays) are only sent when enabled.
+    clientside_enabled = ('clientside' in display_options and bool(clientside_records)
+                          and not gas_ratios_depend_on_field)
+    coefficient_store = {
+        'enabled': clientside_enabled,
+        'traces': [dict(record, T_K=encode_array(record['T_K'])) for record in clientside_records]
+                  if clientside_enabled else [],
+        'hover_indices': clientside_hover if clientside_enabled else []
+    }
+    
+    figure = compact_figure(fig)
+    record_payload('update_plot', figure, coefficient_store)
+    return figure, coefficient_store
 
 
 @app.callback(
@@ -825,6 +1217,8 @@ def update_plot(materials, field_MV_m, radius_radio, radius_custom, temp_range,
      Input('gas-composition-radio', 'value'),
      Input('entry-temp-slider', 'value')]  # New input
 )
+@warm_cached(warm_cache, key_func=_dataset_key)
+@coalesce(key_func=_dataset_key)
 def update_info_panel(materials, field_MV_m, radius_radio, radius_custom, temp_range, gas_composition, entry_temp_K):
     """Update the info panel with thermodynamic analysis."""
     if not materials:
@@ -890,7 +1284,8 @@ def update_info_panel(materials, field_MV_m, radius_radio, radius_custom, temp_r
                 validation_results.append(validation)
     
     # Create info text
-    info_text = create_info_text(validation_results, gas_composition, entry_temp_K)
+    info_text = create_info_text(validation_results, gas_composition, entry_temp_K,
+                                 thermo_engine=thermo_engine)
     
     return dcc.Markdown(info_text)
 
@@ -921,13 +1316,13 @@ def export_data(n_clicks, materials, field_MV_m, radius_radio, radius_custom, te
     r_m = um_to_m(r_um)
     T_min_K, T_max_K = temp_range
     
-    # Create temperature array
-    T_K = np.linspace(T_min_K, T_max_K, 100)
-    
     # Collect data for export
     export_data = {}
     
     for material in materials:
+        if data_loader.get_material_data(material) is None:
+            continue  # Not in the dataset (no ΔG curve to export)
+        T_K = thermo_engine.sample_temperatures(material, T_min_K, T_max_K)
         DG_eq = thermo_engine.calc_equilibrium_DG(material, T_K)
         DG_eff = thermo_engine.calc_off_equilibrium_DG(material, T_K, E_V_m, r_m)
         
@@ -939,6 +1334,9 @@ def export_data(n_clicks, materials, field_MV_m, radius_radio, radius_custom, te
             'r_um': r_um
         }
     
+    if not export_data:
+        return None
+    
     # Create CSV content
     from utils import export_data_to_csv
     csv_content = export_data_to_csv(export_data, "ellingham_data.csv")
@@ -1001,6 +1399,8 @@ def update_sources_content(n_clicks):
     Output("validation-status", "children"),
     [Input("field-slider", "value"), Input("radius-radio", "value"), Input("radius-custom", "value")]
 )
+@warm_cached(warm_cache)
+@coalesce()
 def update_validation_status(field_MV_m, radius_radio, radius_custom):
     """Update validation status based on current parameters."""
     from documentation import get_confidence_indicator
@@ -1077,7 +1477,7 @@ def export_svg(n_clicks, figure):
     
     # Convert figure dict to Plotly figure object
     import plotly.graph_objects as go
-    export_figure = go.Figure(figure)
+    export_figure = expand_figure(figure)
     
     # Optimize layout for publication quality
     export_figure.update_layout(
@@ -1176,7 +1576,7 @@ def export_pdf(n_clicks, figure):
     
     # Convert figure dict to Plotly figure object
     import plotly.graph_objects as go
-    export_figure = go.Figure(figure)
+    export_figure = expand_figure(figure)
     
     # Optimize layout for PDF publication quality
     export_figure.update_layout(
@@ -1286,6 +1686,7 @@ def toggle_custom_compound_modal(add_clicks, save_clicks, cancel_clicks, is_open
 )
 def update_custom_compounds_list(search_query, category_filter, add_clicks, save_clicks):
     """Update the custom compounds list display."""
+    from custom_compound_ui import create_custom_compound_list_item
     compounds = custom_compound_manager.get_all_compounds()
     
     # Apply search filter
@@ -1334,6 +1735,7 @@ def update_custom_compounds_list(search_query, category_filter, add_clicks, save
 )
 def load_template_data(n_clicks, template_name):
     """Load template data into form fields."""
+    from custom_compounds import create_compound_from_template
     if not n_clicks or not template_name:
         return [None] * 16
     
@@ -1359,7 +1761,7 @@ def load_template_data(n_clicks, template_name):
             compound.notes
         ]
     except Exception as e:
-        print(f"Error loading template: {e}")
+        logger.warning("Error loading template: %s", e)
         return [None] * 16
 
 
@@ -1387,6 +1789,8 @@ def load_template_data(n_clicks, template_name):
 def validate_and_save_custom_compound(n_clicks, name, formula, element, category, dg_a, dg_b, dg_c, dg_d,
                                     temp_min, temp_max, mw, density, wph, source, confidence, notes):
     """Validate and save custom compound."""
+    from custom_compounds import CustomCompound
+    from custom_compound_ui import create_custom_compound_validation_alert
     if not n_clicks:
         return "", False
     
@@ -1436,6 +1840,7 @@ def validate_and_save_custom_compound(n_clicks, name, formula, element, category
 )
 def export_custom_compounds(n_clicks):
     """Export custom compounds to JSON file."""
+    from custom_compound_ui import create_custom_compound_export_data
     if not n_clicks:
         return None
     
@@ -1456,6 +1861,7 @@ def export_custom_compounds(n_clicks):
 )
 def import_custom_compounds(contents):
     """Import custom compounds from uploaded file."""
+    from custom_compound_ui import parse_custom_compound_import_data
     if not contents:
         return None
     
@@ -1487,10 +1893,85 @@ def import_custom_compounds(contents):
         return dbc.Alert(f"Import error: {str(e)}", color="danger")
 
 
+mark('callbacks')
+finish_import_profile()
+
+
+def warm_default_views():
+    """Render the default views at every preset field and radius into the warm cache and save a snapshot."""
+    fields = sorted({1.0, *(E / 1e6 for E in DEFAULT_FIELD_PRESETS)})
+    radii = sorted(r * 1e6 for r in DEFAULT_RADIUS_PRESETS)
+    with warm_cache.record():
+        for field in fields:
+            for radius in radii:
+                update_plot(default_materials, field, radius, 5.0, DEFAULT_TEMP_RANGE,
+                            ["equilibrium", "off_equilibrium"], "individual",
+                            ["H2_H2O", "CO_CO2", "pO2"], "N2_H2_25")
+                update_info_panel(default_materials, field, radius, 5.0, DEFAULT_TEMP_RANGE,
+                                  "N2_H2_25", 300)
+                update_validation_status(field, radius, 5.0)
+    warm_cache.save_snapshot()
+
+
+@datasets.on_swap
+def _drop_dataset_caches(new, old):
+    """Drop caches of the previous dataset version and re-warm the default views for the new one."""
+    warm_cache.clear()
+    warm_cache.version = _warm_cache_version()
+    material_option_sets.invalidate()
+    if app_ready.is_set():
+        threading.Thread(target=warm_default_views, name='dataset-rewarm', daemon=True).start()
+
+
+def warm_up():
+    """
+    Exercise the default views once so the first user does not pay for them.
+    
+    Builds the search index and option sets, then loads the warm cache
+    snapshot if it matches the current code and data. Otherwise renders the
+    default figure, info panel and validation status at every preset field
+    and radius (importing Plotly's validators on the way) into the warm cache
+    and saves a new snapshot. Finally marks the app ready. Under gunicorn this
+    runs in the master before forking, so workers inherit everything warmed here.
+    """
+    start = time.time()
+    steps = {}
+    
+    def step(name, func, *args):
+        t0 = time.time()
+        try:
+            func(*args)
+            steps[name] = round(time.time() - t0, 3)
+        except Exception as e:
+            logger.warning("Warm-up step %s failed: %s", name, e)
+            steps[name] = f"failed: {e}"
+    
+    if data_loader:
+        step('search_index', data_loader.get_search_index)
+        step('option_sets', material_option_sets.refresh)
+        if warm_cache.load_snapshot():
+            steps['snapshot'] = 'loaded'
+        else:
+            step('default_views', warm_default_views)
+    
+    warm_up_report.update({
+        'data_loaded': bool(data_loader),
+        'warm_up_seconds': round(time.time() - start, 3),
+        'warm_up_steps': steps,
+        'warm_cache': warm_cache.stats,
+        'startup_phases': startup_phases,
+        'time_to_ready_seconds': round(time.time() - _boot_started, 3)
+    })
+    app_ready.set()
+    logger.info("Warm-up complete in %.2fs (snapshot %s, ready %.2fs after start)",
+                warm_up_report['warm_up_seconds'], warm_cache.stats['snapshot'],
+                warm_up_report['time_to_ready_seconds'])
+
 if __name__ == '__main__':
     # Port configuration:
     # - Railway deployment: Uses PORT=8050 (set in railway.toml)
     # - Local development: Uses port 8051 (to avoid conflicts with other apps)
     port = int(os.getenv('PORT', 8051))
     debug = os.getenv('DEBUG', 'True').lower() == 'true'
+    warm_up()
     app.run(debug=debug, host='0.0.0.0', port=port)
@@ -0,0 +1,108 @@
+/*
+ * Clientside callbacks for the Ellingham diagram.
+ *
+ * updateOffEquilibrium re-evaluates the off-equilibrium curves in the
+ * browser when the field slider or particle radius changes, using the
+ * coefficient records shipped by the server in 'dg-coefficients-store'
+ * (one per trace, with the temperatures that trace was sampled at):
+ *
+ *     ΔG_eff(T) = A + B*T + C*T² - nF_kJ*E*r - W_ph
+ *
+ * When the store is empty or disabled the server callback stays in charge.
+ * Temperature grids arrive as base64 typed arrays ({dtype, bdata}, the same
+ * encoding as the compact figure payloads).
+ */
+var TYPED_ARRAYS = {
+    f8: Float64Array, f4: Float32Array, i4: Int32Array, i2: Int16Array, i1: Int8Array,
+    u4: Uint32Array, u2: Uint16Array, u1: Uint8Array
+};
+
+function decodeArray(value) {
+    if (!value || Array.isArray(value) || !value.bdata) {
+        return value;
+    }
+    var binary = atob(value.bdata);
+    var bytes = new Uint8Array(binary.length);
+    for (var i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return new TYPED_ARRAYS[value.dtype](bytes.buffer);
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    ellingham: {
+        updateOffEquilibrium: function(fieldMVm, radiusRadio, radiusCustom, figure, store) {
+            var noUpdate = window.dash_clientside.no_update;
+            if (!store || !store.enabled || !figure || !figure.data) {
+                return noUpdate;
+            }
+
+            var rUm = radiusRadio === 'custom' ? (radiusCustom || 5.0) : radiusRadio;
+            var E = fieldMVm * 1e6;
+            var r = rUm * 1e-6;
+            var fieldText = 'Field: ' + fieldMVm.toFixed(1) + ' MV/m';
+            var radiusText = 'Radius: ' + rUm.toFixed(1) + ' μm';
+
+            var data = figure.data.slice();
+
+            store.traces.forEach(function(rec) {
+                var trace = data[rec.index];
+                if (!trace) {
+                    return;
+                }
+                var T = decodeArray(rec.T_K);
+                var shift = rec.nF_kJ * E * r + rec.W_ph;
+                var y = new Array(T.length);
+                for (var i = 0; i < T.length; i++) {
+                    var t = T[i];
+                    y[i] = rec.A + rec.B * t + rec.C * t * t - shift;
+                }
+                data[rec.index] = Object.assign({}, trace, {
+                    y: y,
+                    name: rec.material + ' (E=' + fieldMVm.toFixed(1) + ' MV/m, r=' + rUm.toFixed(0) + ' µm)'
+                });
+            });
+
+            // Keep the field/radius shown in hover text in sync. Compact
+            // payloads keep the shared hovertemplate in the layout template
+            // and the per-trace parts in 'meta' (see figure_payload.py).
+            var syncText = function(text) {
+                return typeof text !== 'string' ? text : text
+                    .replace(/Field: [0-9.]+ MV\/m/, fieldText)
+                    .replace(/Radius: [0-9.]+ μm/, radiusText);
+            };
+
+            store.hover_indices.forEach(function(index) {
+                var trace = data[index];
+                if (!trace) {
+                    return;
+                }
+                var update = {};
+                if (typeof trace.hovertemplate === 'string') {
+                    update.hovertemplate = syncText(trace.hovertemplate);
+                }
+                if (Array.isArray(trace.meta)) {
+                    update.meta = trace.meta.map(syncText);
+                }
+                data[index] = Object.assign({}, trace, update);
+            });
+
+            var layout = figure.layout;
+            var template = layout && layout.template;
+            if (template && template.data) {
+                var templateData = {};
+                Object.keys(template.data).forEach(function(type) {
+                    templateData[type] = template.data[type].map(function(item) {
+                        return item.hovertemplate === undefined ? item :
+                            Object.assign({}, item, {hovertemplate: syncText(item.hovertemplate)});
+                    });
+                });
+                layout = Object.assign({}, layout, {
+                    template: Object.assign({}, template, {data: templateData})
+                });
+            }
+
+            return Object.assign({}, figure, {data: data, layout: layout});
+        }
+    }
+});
@@ -0,0 +1,63 @@
+/*
+ * Browser render timing for the Ellingham plot.
+ *
+ * Wraps Plotly.newPlot / Plotly.react once Plotly is loaded and reports how
+ * long each figure took to draw (up to the next animation frame) together
+ * with the trace count, point count and rendering mode (svg / webgl).
+ * Samples are posted to /api/render-timings and summarised there for the
+ * benchmark suite.
+ */
+(function() {
+    var ENDPOINT = '/api/render-timings';
+
+    function describe(gd) {
+        var traces = (gd && (gd._fullData || gd.data)) || [];
+        var points = 0;
+        var webgl = false;
+        traces.forEach(function(trace) {
+            var x = trace.x || trace.y;
+            points += (x && x.length) || 0;
+            if (String(trace.type || '').slice(-2) === 'gl') {
+                webgl = true;
+            }
+        });
+        return {traces: traces.length, points: points, mode: webgl ? 'webgl' : 'svg'};
+    }
+
+    function report(gd, method, ms) {
+        var sample = Object.assign({method: method, ms: ms}, describe(gd));
+        var body = JSON.stringify(sample);
+        if (navigator.sendBeacon) {
+            navigator.sendBeacon(ENDPOINT, new Blob([body], {type: 'application/json'}));
+        } else {
+            fetch(ENDPOINT, {method: 'POST', body: body, headers: {'Content-Type': 'application/json'}});
+        }
+    }
+
+    function wrap(Plotly) {
+        if (Plotly.__renderTimed) {
+            return;
+        }
+        ['newPlot', 'react'].forEach(function(method) {
+            var original = Plotly[method];
+            Plotly[method] = function(gd) {
+                var start = performance.now();
+                var result = original.apply(this, arguments);
+                Promise.resolve(result).then(function(plotted) {
+                    window.requestAnimationFrame(function() {
+                        report(plotted || gd, method, performance.now() - start);
+                    });
+                });
+                return result;
+            };
+        });
+        Plotly.__renderTimed = true;
+    }
+
+    var timer = setInterval(function() {
+        if (window.Plotly && window.Plotly.react) {
+            wrap(window.Plotly);
+            clearInterval(timer);
+        }
+    }, 100);
+})();
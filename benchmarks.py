@@ -0,0 +1,455 @@
+"""
+Benchmark suite for the loader, thermo engine and callbacks.
+
+Each benchmark times one operation per call over several samples. The
+median sample is compared against the median baseline stored for this
+machine in BENCHMARK_BASELINE_FILE; the run fails (exit status 1) when any
+benchmark is slower than its baseline by more than the threshold and by
+more than an absolute floor, and is still slower when measured again.
+Baselines are recorded over several runs and keep the slowest median, so
+the normal run-to-run spread of the machine is inside them. Callbacks are invoked headlessly with their warm
+cache and coalescing layers unwrapped, so the real work is timed.
+
+    python benchmarks.py                     # run and compare with the baselines
+    python benchmarks.py --save-baseline     # record new baselines on this machine (over BENCHMARK_BASELINE_RUNS runs)
+    python benchmarks.py -k update_plot      # only benchmarks whose name contains this
+    python benchmarks.py --server URL --server-auth user:password  # also report browser frame times from a running app
+    python benchmarks.py --golden            # also check the fast paths against the reference (golden_reference.py)
+
+Baselines are kept per machine (CPU model, core count and Python version,
+or BENCHMARK_MACHINE when set). On a machine without recorded baselines the
+results are only reported; record them with --save-baseline on each
+reference machine (or CI runner) after an intentional performance change.
+"""
+
+import os
+import sys
+import json
+import time
+import inspect
+import platform
+import statistics
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+BENCHMARK_BASELINE_FILE = os.getenv('BENCHMARK_BASELINE_FILE', 'benchmark_baselines.json')
+
+# Allowed slowdown relative to the baseline (0.25 = 25 %)
+BENCHMARK_THRESHOLD = float(os.getenv('BENCHMARK_THRESHOLD', 0.25))
+
+# Slowdowns below this many seconds per call are timer and scheduler noise,
+# whatever the ratio (benchmarks can set their own floor)
+BENCHMARK_MIN_DELTA_SECONDS = float(os.getenv('BENCHMARK_MIN_DELTA_SECONDS', 20e-6))
+
+# Full runs a baseline is recorded over (the slowest median is kept)
+BENCHMARK_BASELINE_RUNS = int(os.getenv('BENCHMARK_BASELINE_RUNS', 5))
+
+# Name under which baselines are stored (defaults to a hardware fingerprint)
+BENCHMARK_MACHINE = os.getenv('BENCHMARK_MACHINE')
+
+# 'user:password' of an app user, sent with --server requests
+BENCHMARK_SERVER_AUTH = os.getenv('BENCHMARK_SERVER_AUTH', '')
+
+SAMPLES = 5               # Timed samples per benchmark (best and median are reported)
+MIN_SAMPLE_SECONDS = 0.1  # Calls per sample are increased until a sample takes this long
+
+
+class SkipBenchmark(Exception):
+    """Raised by a benchmark setup when it cannot run in this environment."""
+
+
+_BENCHMARKS: Dict[str, Dict] = {}
+
+
+def benchmark(name: str, min_delta: float = None):
+    """
+    Register a setup function returning the zero-argument callable to time.
+
+    Args:
+        name: Benchmark name
+        min_delta: Absolute slowdown in seconds per call that is never a
+            regression (default BENCHMARK_MIN_DELTA_SECONDS)
+    """
+    def decorator(setup):
+        _BENCHMARKS[name] = {'setup': setup,
+                             'min_delta': BENCHMARK_MIN_DELTA_SECONDS if min_delta is None else min_delta}
+        return setup
+    return decorator
+
+
+class _Context:
+    """Lazily created objects shared by the benchmarks."""
+
+    def __init__(self):
+        self._app = None
+        self._materials = None
+
+    @property
+    def app(self):
+        if self._app is None:
+            import app
+            self._app = app
+        return self._app
+
+    @property
+    def loader(self):
+        return self.app.data_loader
+
+    @property
+    def engine(self):
+        return self.app.thermo_engine
+
+    def materials(self, n: int) -> List[str]:
+        """First n materials with off-equilibrium coefficients."""
+        if self._materials is None:
+            names = self.loader.get_compound_index()['names']
+            self._materials = [name for name in names if self.engine.compute_off_equilibrium_coefficients(name)]
+        if n > len(self._materials):
+            raise SkipBenchmark(f"only {len(self._materials)} materials available")
+        return self._materials[:n]
+
+    def callback(self, name: str):
+        """A callback with its caching decorators unwrapped."""
+        return inspect.unwrap(getattr(self.app, name))
+
+
+E_V_M = 1.0e6
+R_M = 5.0e-6
+T_GRID = np.linspace(300.0, 2400.0, 500)
+
+
+@benchmark('loader_cold_start')
+def _loader_cold_start(ctx):
+    from data_loader import JANAFDataLoader
+    data_file = ctx.loader.data_file
+
+    def run():
+        loader = JANAFDataLoader(data_file)
+        loader.load_raw_data()
+        loader.get_compound_index()
+    return run
+
+
+@benchmark('interpolate_DG_100k')
+def _interpolate_DG(ctx):
+    material = ctx.materials(1)[0]
+    T = np.linspace(300.0, 2400.0, 100_000)
+    return lambda: ctx.loader.interpolate_DG(material, T)
+
+
+def _off_equilibrium(n):
+    def setup(ctx):
+        materials = ctx.materials(n)
+        engine = ctx.engine
+        return lambda: [engine.calc_off_equilibrium_DG(material, T_GRID, E_V_M, R_M) for material in materials]
+    return setup
+
+
+for _n in (1, 10, 100):
+    benchmark(f'off_equilibrium_DG_{_n}_materials')(_off_equilibrium(_n))
+
+
+@benchmark('crossover_temperature_10_materials')
+def _crossover(ctx):
+    materials = ctx.materials(10)
+    return lambda: [ctx.engine.calc_crossover_temperature(material, E_V_M, R_M) for material in materials]
+
+
+@benchmark('kinetic_analysis')
+def _kinetic(ctx):
+    material = ctx.materials(1)[0]
+    T = np.linspace(800.0, 2000.0, 200)
+    return lambda: ctx.engine.calc_kinetic_analysis(material, T, E_V_M, R_M)
+
+
+@benchmark('residence_time_analysis')
+def _residence(ctx):
+    material = ctx.materials(1)[0]
+    return lambda: ctx.engine.calc_residence_time_analysis(material, 1500.0, E_V_M, R_M)
+
+
+_PLOT_ARGS = (1.0, 5.0, 5.0, [300, 2400], ["equilibrium", "off_equilibrium"], "individual",
+              ["H2_H2O", "CO_CO2", "pO2"], "N2_H2_25")
+
+
+@benchmark('update_plot_defaults')
+def _update_plot_defaults(ctx):
+    update_plot = ctx.callback('update_plot')
+    materials = ctx.app.default_materials
+    return lambda: update_plot(materials, *_PLOT_ARGS)
+
+
+@benchmark('update_plot_40_materials')
+def _update_plot_many(ctx):
+    update_plot = ctx.callback('update_plot')
+    materials = ctx.materials(40)
+    return lambda: update_plot(materials, *_PLOT_ARGS)
+
+
+@benchmark('update_info_panel_defaults', min_delta=300e-6)
+def _update_info_panel(ctx):
+    update_info_panel = ctx.callback('update_info_panel')
+    materials = ctx.app.default_materials
+    return lambda: update_info_panel(materials, 1.0, 5.0, 5.0, [300, 2400], "N2_H2_25", 300)
+
+
+@benchmark('export_csv_10_materials')
+def _export_csv(ctx):
+    export_data = ctx.callback('export_data')
+    materials = ctx.materials(10)
+    return lambda: export_data(1, materials, 1.0, 5.0, 5.0, [300, 2400])
+
+
+@benchmark('export_svg_defaults')
+def _export_svg(ctx):
+    import plotly.graph_objects as go
+    try:
+        go.Figure().to_image(format='svg')
+    except Exception as e:
+        raise SkipBenchmark(f"static image export unavailable: {str(e).strip().splitlines()[0]}")
+    figure, _ = ctx.callback('update_plot')(ctx.app.default_materials, *_PLOT_ARGS)
+    export_svg = ctx.callback('export_svg')
+    return lambda: export_svg(1, figure)
+
+
+def _isolated_logger(name: str, level: int, rate_limit: float):
+    """A non-propagating logger writing through its own queue handler to os.devnull."""
+    import logging
+    from structured_logging import make_queue_handler
+    logger = logging.getLogger(f'benchmarks.{name}')
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(level)
+    handler, _ = make_queue_handler(open(os.devnull, 'w'), rate_limit=rate_limit)
+    logger.addHandler(handler)
+    return logger
+
+
+# Logging overhead is gated on absolute cost per call: ratios of sub-microsecond
+# timings are mostly noise, but a disabled debug call must stay near zero
+@benchmark('log_debug_disabled', min_delta=1e-6)
+def _log_debug_disabled(ctx):
+    import logging
+    logger = _isolated_logger('disabled', logging.INFO, 60)
+    return lambda: logger.debug("Coefficients for %s at %s V/m", 'Fe2O3', E_V_M)
+
+
+@benchmark('log_warning_rate_limited', min_delta=25e-6)
+def _log_warning_rate_limited(ctx):
+    import logging
+    logger = _isolated_logger('rate_limited', logging.INFO, 3600)
+    return lambda: logger.warning("No Henry's constant for %r", 'Fe2O3')
+
+
+@benchmark('log_info_queued', min_delta=25e-6)
+def _log_info_queued(ctx):
+    import logging
+    logger = _isolated_logger('queued', logging.INFO, 0)
+    return lambda: logger.info("Coefficients for %s at %s V/m", 'Fe2O3', E_V_M)
+
+
+def time_callable(func: Callable, samples: int = SAMPLES) -> Dict:
+    """Median / min seconds per call of func (timeit-style calibration)."""
+    func()  # Warm-up (imports, lazy indexes)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_SECONDS or number >= 1_000_000:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(MIN_SAMPLE_SECONDS / elapsed) + 1))
+    per_call = [elapsed / number]
+    for _ in range(samples - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        per_call.append((time.perf_counter() - start) / number)
+    return {'median_s': statistics.median(per_call), 'min_s': min(per_call), 'number': number}
+
+
+def run_benchmarks(pattern: Optional[str] = None, names: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """Run the (matching or named) benchmarks; skipped ones report their reason."""
+    ctx = _Context()
+    results = {}
+    for name, entry in _BENCHMARKS.items():
+        if (pattern and pattern not in name) or (names is not None and name not in names):
+            continue
+        try:
+            results[name] = time_callable(entry['setup'](ctx))
+        except SkipBenchmark as e:
+            results[name] = {'skipped': str(e)}
+    return results
+
+
+def machine_info() -> Dict:
+    """Hardware and interpreter details that baselines are only valid for."""
+    processor = platform.processor() or platform.machine()
+    try:
+        with open('/proc/cpuinfo', 'r', encoding='utf-8') as f:
+            processor = next(line.split(':', 1)[1].strip() for line in f if line.startswith('model name'))
+    except (OSError, StopIteration):
+        pass
+    return {'python': '.'.join(platform.python_version_tuple()[:2]), 'machine': platform.machine(),
+            'processor': processor, 'cpus': os.cpu_count()}
+
+
+def machine_key(info: Optional[Dict] = None) -> str:
+    """Name of this machine's baseline set."""
+    if BENCHMARK_MACHINE:
+        return BENCHMARK_MACHINE
+    info = info or machine_info()
+    return f"{info['machine']} | {info['processor']} | {info['cpus']} cpu | py{info['python']}"
+
+
+def load_baselines(path: str = BENCHMARK_BASELINE_FILE) -> Dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def machine_baselines(baselines: Dict, machine: Optional[str] = None) -> Dict[str, Dict]:
+    """Baselines recorded on this (or the named) machine."""
+    return baselines.get('machines', {}).get(machine or machine_key(), {}).get('benchmarks', {})
+
+
+def merge_runs(runs: List[Dict[str, Dict]]) -> Dict[str, Dict]:
+    """Combine several runs into baselines: the slowest median and the fastest sample of each benchmark."""
+    merged = {}
+    for name in runs[0]:
+        timed = [run[name] for run in runs if 'median_s' in run.get(name, {})]
+        if not timed:
+            merged[name] = runs[0][name]
+            continue
+        merged[name] = {'median_s': max(result['median_s'] for result in timed),
+                        'min_s': min(result['min_s'] for result in timed), 'runs': len(timed)}
+    return merged
+
+
+def save_baselines(results: Dict[str, Dict], path: str = BENCHMARK_BASELINE_FILE):
+    """Merge results into this machine's baselines (skipped benchmarks are left untouched)."""
+    baselines = load_baselines(path)
+    info = machine_info()
+    entry = baselines.setdefault('machines', {}).setdefault(machine_key(info), {})
+    entry['info'] = info
+    for name, result in results.items():
+        if 'median_s' in result:
+            entry.setdefault('benchmarks', {})[name] = {
+                'min_s': result['min_s'], 'median_s': result['median_s'], 'recorded': time.strftime('%Y-%m-%d')
+            }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(results: Dict[str, Dict], baselines: Dict, threshold: float = BENCHMARK_THRESHOLD) -> List[str]:
+    """
+    Print a results table against this machine's baselines.
+
+    A benchmark regresses when its median is slower than the baseline
+    median by more than the threshold and by more than its absolute floor
+    (min_delta).
+
+    Returns:
+        Names of benchmarks that regressed
+    """
+    regressions = []
+    stored = machine_baselines(baselines)
+    if not stored:
+        print(f"No baselines recorded for {machine_key()}: reporting only (record them with --save-baseline)\n")
+    print(f"{'benchmark':40s} {'best':>12s} {'median':>12s} {'baseline':>12s} {'ratio':>7s}  (median / baseline median)")
+    for name, result in results.items():
+        if 'skipped' in result:
+            print(f"{name:40s} {'skipped':>12s}  ({result['skipped']})")
+            continue
+        best, median = result['min_s'], result['median_s']
+        baseline = stored.get(name, {}).get('median_s')
+        if baseline is None:
+            print(f"{name:40s} {best * 1000:10.3f}ms {median * 1000:10.3f}ms {'—':>12s}")
+            continue
+        ratio = median / baseline
+        flag = ''
+        min_delta = _BENCHMARKS[name]['min_delta'] if name in _BENCHMARKS else BENCHMARK_MIN_DELTA_SECONDS
+        if ratio > 1 + threshold and median - baseline > min_delta:
+            regressions.append(name)
+            flag = '  ❌ regression'
+        print(f"{name:40s} {best * 1000:10.3f}ms {median * 1000:10.3f}ms {baseline * 1000:10.3f}ms {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def report_render_stats(server: str, auth: str = BENCHMARK_SERVER_AUTH):
+    """Print browser frame times collected by a running app (/api/render-timings)."""
+    import base64
+    from urllib.request import Request, urlopen
+    headers = {'Authorization': 'Basic ' + base64.b64encode(auth.encode('utf-8')).decode('ascii')} if auth else {}
+    try:
+        with urlopen(Request(f"{server.rstrip('/')}/api/render-timings", headers=headers), timeout=10) as response:
+            stats = json.load(response)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not fetch render timings from {server}: {e}")
+        return
+    print(f"\nBrowser frame times from {server}:")
+    if not stats:
+        print("  (no samples yet)")
+    for key, summary in sorted(stats.items()):
+        print(f"  {key:20s} n={summary['count']:<5d} p50 {summary['p50_ms']:8.1f}ms  "
+              f"p95 {summary['p95_ms']:8.1f}ms  max {summary['max_ms']:8.1f}ms")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the loader, thermo engine and callbacks")
+    parser.add_argument('-k', dest='pattern', help="Only run benchmarks whose name contains this")
+    parser.add_argument('--save-baseline', action='store_true', help="Record the results as the new baselines")
+    parser.add_argument('--threshold', type=float, default=BENCHMARK_THRESHOLD,
+                        help="Allowed slowdown vs. baseline (fraction)")
+    parser.add_argument('--baseline-file', default=BENCHMARK_BASELINE_FILE)
+    parser.add_argument('--runs', type=int, default=BENCHMARK_BASELINE_RUNS,
+                        help="Full runs --save-baseline records over (the slowest median is kept)")
+    parser.add_argument('--server', help="URL of a running app to report browser frame times from")
+    parser.add_argument('--server-auth', default=BENCHMARK_SERVER_AUTH,
+                        help="user:password for --server (default: BENCHMARK_SERVER_AUTH)")
+    parser.add_argument('--golden', action='store_true',
+                        help="Also compare the fast paths with the reference engine (fails on drift)")
+    parser.add_argument('--golden-cases', type=int, help="Randomized cases for --golden")
+    args = parser.parse_args()
+
+    if args.save_baseline:
+        results = merge_runs([run_benchmarks(args.pattern) for _ in range(max(1, args.runs))])
+    else:
+        results = run_benchmarks(args.pattern)
+    print()
+    baselines = load_baselines(args.baseline_file)
+    regressions = compare(results, baselines, args.threshold)
+    if regressions and not args.save_baseline:
+        # A regression has to reproduce: keep the faster of two measurements
+        print(f"\nRe-measuring {len(regressions)} benchmark(s)...\n")
+        for name, result in run_benchmarks(names=regressions).items():
+            if result.get('median_s', float('inf')) < results[name]['median_s']:
+                results[name] = result
+        regressions = compare({name: results[name] for name in regressions}, baselines, args.threshold)
+    if args.server:
+        report_render_stats(args.server, args.server_auth)
+    drifted = []
+    if args.golden:
+        import golden_reference
+        print()
+        drifted = golden_reference.print_report(
+            golden_reference.run_checks(args.golden_cases or golden_reference.GOLDEN_CASES))
+
+    if args.save_baseline:
+        save_baselines(results, args.baseline_file)
+        print(f"\n✅ Baselines saved to {args.baseline_file}")
+    elif regressions or drifted:
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) regressed more than {args.threshold:.0%}: {', '.join(regressions)}")
+        if drifted:
+            print(f"\n❌ {len(drifted)} fast path(s) outside tolerance: {', '.join(drifted)}")
+        sys.exit(1)
+    else:
+        print("\n✅ No regressions")
@@ -0,0 +1,200 @@
+"""
+Per-callback instrumentation exported in Prometheus text format.
+
+instrument_callbacks(app) makes every later @app.callback record, per
+callback, wall time, CPU time, response payload bytes and the cache outcome
+(warm-cache hit/miss, single-flight shared) as histograms and counters.
+render_metrics() returns them in the Prometheus exposition format for the
+/metrics route. Metrics are per process: under gunicorn each scrape sees
+the worker that answered it.
+
+Set CALLBACK_METRICS=0 to register callbacks unwrapped (no overhead).
+"""
+
+import os
+import time
+import functools
+import threading
+from typing import Dict, List, Optional, Tuple
+
+CALLBACK_METRICS = os.getenv('CALLBACK_METRICS', '1').lower() not in ('0', 'false', 'no')
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PAYLOAD_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+METRIC_PREFIX = 'ellingham_callback'
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)."""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> List[str]:
+        out = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            out.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+        out.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        out.append(f'{name}_sum{{{labels}}} {self.sum:.6g}')
+        out.append(f'{name}_count{{{labels}}} {self.count}')
+        return out
+
+
+_lock = threading.Lock()
+_local = threading.local()
+_wall: Dict[str, Histogram] = {}
+_cpu: Dict[str, Histogram] = {}
+_payload: Dict[str, Histogram] = {}
+_cache: Dict[Tuple[str, str], int] = {}
+_errors: Dict[str, int] = {}
+
+
+def record_cache_event(outcome: str):
+    """Note the cache outcome ('hit', 'miss', 'shared') of the callback running in this thread."""
+    if getattr(_local, 'callback', None) is not None:
+        _local.cache = outcome
+
+
+def _observe(table: Dict[str, Histogram], name: str, buckets, value: float):
+    histogram = table.get(name)
+    if histogram is None:
+        histogram = table.setdefault(name, Histogram(buckets))
+    histogram.observe(value)
+
+
+def instrumented(func, name: Optional[str] = None):
+    """Wrap a callback function to record its timings and cache outcome."""
+    from dash.exceptions import PreventUpdate
+
+    callback_name = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _local.callback = callback_name
+        _local.cache = None
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except PreventUpdate:
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            with _lock:
+                _observe(_wall, callback_name, LATENCY_BUCKETS, wall)
+                _observe(_cpu, callback_name, LATENCY_BUCKETS, cpu)
+                key = (callback_name, _local.cache or 'none')
+                _cache[key] = _cache.get(key, 0) + 1
+                if failed:
+                    _errors[callback_name] = _errors.get(callback_name, 0) + 1
+            # The payload size is recorded from the response by observe_response()
+            _local.pending = callback_name
+            _local.callback = None
+
+    return wrapper
+
+
+def observe_response(response):
+    """Flask after_request hook: attribute the response size to the callback it answered."""
+    name = getattr(_local, 'pending', None)
+    if name is not None:
+        _local.pending = None
+        if not response.direct_passthrough:
+            size = response.calculate_content_length()
+            if size is None:
+                size = len(response.get_data())
+            with _lock:
+                _observe(_payload, name, PAYLOAD_BUCKETS, size)
+    return response
+
+
+def instrument_callbacks(app, wrappers=()):
+    """
+    Instrument every callback registered on the Dash app from now on.
+
+    Dash stores the wrapped function; the decorated name keeps referring to
+    the plain function, so direct calls (e.g. warm-up) are not counted.
+
+    Args:
+        app: Dash app
+        wrappers: Additional decorators applied inside the metrics wrapper
+            (e.g. the request profiler); applied even when metrics are off
+    """
+    if not CALLBACK_METRICS and not wrappers:
+        return
+    original = app.callback
+
+    @functools.wraps(original)
+    def callback(*args, **kwargs):
+        register = original(*args, **kwargs)
+
+        def decorator(func):
+            wrapped = func
+            for wrapper in wrappers:
+                wrapped = wrapper(wrapped)
+            register(instrumented(wrapped) if CALLBACK_METRICS else wrapped)
+            return func
+
+        return decorator
+
+    app.callback = callback
+    if CALLBACK_METRICS:
+        app.server.after_request(observe_response)
+
+
+def _labels(**labels) -> str:
+    return ','.join(f'{key}="{str(value).replace(chr(34), chr(39))}"' for key, value in labels.items())
+
+
+def render_metrics(extra_gauges: Optional[Dict[str, float]] = None) -> str:
+    """
+    All metrics in Prometheus text exposition format.
+
+    Args:
+        extra_gauges: Additional gauge name -> value pairs (names are used as-is)
+    """
+    lines = []
+    with _lock:
+        for metric, table, help_text in (
+                ('duration_seconds', _wall, 'Callback wall time'),
+                ('cpu_seconds', _cpu, 'Callback CPU time of the serving thread'),
+                ('payload_bytes', _payload, 'Callback response size')):
+            name = f"{METRIC_PREFIX}_{metric}"
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for callback_name, histogram in sorted(table.items()):
+                lines += histogram.lines(name, _labels(callback=callback_name))
+
+        name = f"{METRIC_PREFIX}_cache_total"
+        lines += [f"# HELP {name} Callback invocations by cache outcome", f"# TYPE {name} counter"]
+        for (callback_name, outcome), count in sorted(_cache.items()):
+            lines.append(f"{name}{{{_labels(callback=callback_name, result=outcome)}}} {count}")
+
+        name = f"{METRIC_PREFIX}_errors_total"
+        lines += [f"# HELP {name} Callbacks that raised", f"# TYPE {name} counter"]
+        for callback_name, count in sorted(_errors.items()):
+            lines.append(f"{name}{{{_labels(callback=callback_name)}}} {count}")
+
+    for name, value in (extra_gauges or {}).items():
+        lines += [f"# TYPE {name} gauge", f"{name} {value:.6g}"]
+    return '\n'.join(lines) + '\n'
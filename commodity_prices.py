@@ -7,9 +7,12 @@ of reduction processes in the Ellingham diagram application.
 
 from typing import Dict, Optional, List
 import json
+import logging
 from datetime import datetime
 import os
 
+logger = logging.getLogger(__name__)
+
 
 class CommodityPriceManager:
     """Manage commodity price data from multiple sources."""
@@ -24,13 +27,13 @@ class CommodityPriceManager:
         try:
             with open(self.price_file, 'r') as f:
                 self.prices = json.load(f)
-            print(f"Loaded commodity prices from {self.price_file}")
+            logger.info("Loaded commodity prices from %s", self.price_file)
         except FileNotFoundError:
-            print(f"Price file {self.price_file} not found, creating with default prices")
+            logger.warning("Price file %s not found, creating with default prices", self.price_file)
             self.prices = self._get_default_prices()
             self.save_prices()
         except json.JSONDecodeError as e:
-            print(f"Error parsing price file: {e}")
+            logger.error("Error parsing price file %s: %s", self.price_file, e)
             self.prices = self._get_default_prices()
             self.save_prices()
     
@@ -39,9 +42,9 @@ class CommodityPriceManager:
         try:
             with open(self.price_file, 'w') as f:
                 json.dump(self.prices, f, indent=2)
-            print(f"Saved commodity prices to {self.price_file}")
+            logger.debug("Saved commodity prices to %s", self.price_file)
         except Exception as e:
-            print(f"Error saving prices: {e}")
+            logger.error("Error saving prices to %s: %s", self.price_file, e)
     
     def _get_default_prices(self) -> Dict:
         """Default commodity prices (USD/kg)."""
@@ -0,0 +1,225 @@
+"""
+Composition-based compound categorization and lookup index.
+
+Parses JANAF formulas (e.g. 'O2Ti', 'C0.98Nb', 'Ti+') into element
+compositions, assigns each compound a category from that composition, and
+builds integer-coded inverted indexes (element, category, non-metal) that are
+stored in the preprocessed database so the app can filter with array lookups.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Category order used across the app (tabs, tables and integer codes)
+CATEGORY_ORDER = [
+    'oxides', 'carbides', 'nitrides', 'halides', 'hydrides',
+    'sulfides', 'phosphides', 'pure_elements', 'other'
+]
+CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORY_ORDER)}
+
+# Elements that act as the anion / non-metal partner in a compound.
+# Everything else (including B and Si) is treated as the "metal" side.
+HALOGENS = frozenset({'F', 'Cl', 'Br', 'I'})
+NONMETALS = frozenset({
+    'H', 'D', 'T', 'C', 'N', 'O', 'S', 'Se', 'P',
+    'He', 'Ne', 'Ar', 'Kr', 'Xe', 'Rn'
+}) | HALOGENS
+
+INDEX_VERSION = 1
+
+_FORMULA_TOKEN = re.compile(r'([A-Z][a-z]?)(\d*\.?\d*)')
+
+# Name keywords, only used when a formula cannot be parsed
+_NAME_KEYWORDS = [
+    ('oxides', ('oxide',)),
+    ('carbides', ('carbide',)),
+    ('nitrides', ('nitride',)),
+    ('halides', ('fluoride', 'chloride', 'bromide', 'iodide')),
+    ('hydrides', ('hydride',)),
+    ('sulfides', ('sulfide',)),
+    ('phosphides', ('phosphide',)),
+]
+
+
+@lru_cache(maxsize=None)
+def _parse_formula_cached(formula: str) -> Tuple[Tuple[str, float], ...]:
+    composition: Dict[str, float] = {}
+    # Drop ionic charge suffixes such as 'Ti+', 'CO2-'
+    body = formula.strip().rstrip('+-')
+    for symbol, count in _FORMULA_TOKEN.findall(body):
+        composition[symbol] = composition.get(symbol, 0.0) + (float(count) if count else 1.0)
+    return tuple(composition.items())
+
+
+def parse_formula(formula: str) -> Dict[str, float]:
+    """
+    Parse a JANAF formula into an element composition.
+
+    Args:
+        formula: Formula string, e.g. 'O2Ti', 'C3Al4', 'N0.465V'
+
+    Returns:
+        Dictionary mapping element symbol to stoichiometric count
+        (empty if nothing could be parsed)
+    """
+    if not formula:
+        return {}
+    return dict(_parse_formula_cached(formula))
+
+
+def classify_composition(composition: Dict[str, float], name: str = '') -> str:
+    """
+    Assign a category from a parsed composition.
+
+    Precedence follows the original preprocessing rules: oxides, carbides,
+    nitrides, halides, hydrides, sulfides, phosphides, pure elements, other.
+
+    Args:
+        composition: Element composition from parse_formula()
+        name: Compound name, used only if the composition is empty
+
+    Returns:
+        Category name from CATEGORY_ORDER
+    """
+    if not composition:
+        name_lower = name.lower()
+        for category, keywords in _NAME_KEYWORDS:
+            if any(keyword in name_lower for keyword in keywords):
+                return category
+        return 'other'
+
+    elements = composition.keys()
+    has_metal = any(element not in NONMETALS for element in elements)
+
+    if has_metal and 'O' in elements:
+        return 'oxides'
+    if has_metal and 'C' in elements:
+        return 'carbides'
+    if has_metal and 'N' in elements:
+        return 'nitrides'
+    if any(element in HALOGENS for element in elements):
+        return 'halides'
+    if 'H' in elements and len(composition) > 1:
+        return 'hydrides'
+    if has_metal and 'S' in elements:
+        return 'sulfides'
+    if has_metal and 'P' in elements:
+        return 'phosphides'
+    if len(composition) == 1:
+        return 'pure_elements'
+    return 'other'
+
+
+def categorize_formula(formula: str, name: str = '') -> str:
+    """Convenience wrapper: parse a formula and return its category."""
+    return classify_composition(parse_formula(formula), name)
+
+
+def is_metal(symbol: str) -> bool:
+    """Check whether an element symbol is on the metal side of a compound."""
+    return symbol not in NONMETALS
+
+
+def build_compound_index(tables: Dict) -> Dict:
+    """
+    Build integer-coded inverted indexes from Ellingham tables.
+
+    One row is created per (category, compound name) pair, in CATEGORY_ORDER
+    and table order, so category lookups reproduce the order of the tables.
+
+    Args:
+        tables: Ellingham tables with one dict of entries per category
+
+    Returns:
+        Dictionary with:
+        - names: row -> compound name
+        - category_codes: int8 array of CATEGORY_CODES per row
+        - elements: sorted element symbols (element code = position)
+        - composition_ptr / composition_codes / composition_counts:
+          CSR encoding of each row's composition
+        - by_element, by_category, by_nonmetal: key -> int32 row array
+    """
+    names: List[str] = []
+    category_codes: List[int] = []
+    compositions: List[Dict[str, float]] = []
+
+    for category in CATEGORY_ORDER:
+        for name, entry in tables.get(category, {}).items():
+            names.append(name)
+            category_codes.append(CATEGORY_CODES[category])
+            compositions.append(parse_formula(entry.get('formula', '')))
+
+    elements = sorted({symbol for composition in compositions for symbol in composition})
+    element_codes = {symbol: code for code, symbol in enumerate(elements)}
+
+    ptr = np.zeros(len(names) + 1, dtype=np.int32)
+    codes: List[int] = []
+    counts: List[float] = []
+    element_rows: Dict[str, List[int]] = {symbol: [] for symbol in elements}
+
+    for row, composition in enumerate(compositions):
+        for symbol, count in composition.items():
+            codes.append(element_codes[symbol])
+            counts.append(count)
+            element_rows[symbol].append(row)
+        ptr[row + 1] = len(codes)
+
+    category_array = np.asarray(category_codes, dtype=np.int8)
+
+    by_category = {
+        category: np.flatnonzero(category_array == code).astype(np.int32)
+        for category, code in CATEGORY_CODES.items()
+    }
+    by_element = {
+        symbol: np.asarray(rows, dtype=np.int32) for symbol, rows in element_rows.items()
+    }
+    by_nonmetal = {
+        symbol: rows for symbol, rows in by_element.items() if symbol in NONMETALS
+    }
+
+    return {
+        'version': INDEX_VERSION,
+        'names': names,
+        'categories': list(CATEGORY_ORDER),
+        'category_codes': category_array,
+        'elements': elements,
+        'composition_ptr': ptr,
+        'composition_codes': np.asarray(codes, dtype=np.int16),
+        'composition_counts': np.asarray(counts, dtype=np.float32),
+        'by_element': by_element,
+        'by_category': by_category,
+        'by_nonmetal': by_nonmetal,
+    }
+
+
+def lookup_names(index: Dict, rows: Optional[np.ndarray]) -> List[str]:
+    """
+    Resolve index rows to compound names, dropping duplicate names.
+
+    Args:
+        index: Compound index from build_compound_index()
+        rows: Row array from one of the inverted indexes (or None)
+
+    Returns:
+        List of unique compound names in row order
+    """
+    if rows is None or len(rows) == 0:
+        return []
+    names = index['names']
+    return list(dict.fromkeys(names[row] for row in rows))
+
+
+def rows_for_elements(index: Dict, symbols: Iterable[str]) -> np.ndarray:
+    """Union of rows containing any of the given elements."""
+    arrays = [index['by_element'][symbol] for symbol in symbols if symbol in index['by_element']]
+    if not arrays:
+        return np.zeros(0, dtype=np.int32)
+    return np.unique(np.concatenate(arrays))
+
+
+def metal_symbols(index: Dict) -> List[str]:
+    """Element symbols in the index that sit on the metal side."""
+    return [symbol for symbol in index['elements'] if is_metal(symbol)]
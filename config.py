@@ -55,6 +55,25 @@ DEFAULT_TEMP_RANGE = [300, 2400]  # K
 # UI Configuration
 TEMP_MARKERS = [800, 1000, 1200]  # °C for annotations
 GAS_RATIO_TEMPS = [1000, 1200, 1500]  # °C for gas ratio scales
+MATERIAL_SEARCH_TOP_K = 50  # Typeahead matches returned per keystroke
+MATERIAL_BROWSE_LIMIT = 300  # Options sent per tab/metal before search is needed
+
+# Figure payload configuration (see figure_payload.py)
+PAYLOAD_FLOAT_RTOL = 1e-6  # Max float32 rounding error relative to the array's largest value
+PAYLOAD_MIN_ARRAY_LENGTH = 8  # Shorter lists are sent as plain JSON
+PAYLOAD_SIZE_LOGGING = False  # Log the serialized size of every figure callback
+
+# Adaptive curve sampling (see curve_sampling.py)
+SAMPLING_TOLERANCE = 0.05  # Max linear interpolation error, kJ/mol
+GAS_RATIO_SAMPLING_TOLERANCE = 0.005  # Max interpolation error of gas ratio scales (log units)
+SAMPLING_MIN_POINTS = 5  # Initial uniform grid
+SAMPLING_MAX_POINTS = 400  # Hard cap per curve
+SAMPLING_MAX_STEP_K = 100.0  # Largest spacing, keeps hover resolution
+
+# High-volume rendering
+HIGH_VOLUME_MATERIAL_THRESHOLD = 40  # Switch to WebGL (Scattergl) traces at this many materials
+HIGH_VOLUME_MAX_POINTS = 48  # Per-material point budget for min/max decimation
+HIGH_VOLUME_DECIMATION_RTOL = 0.01  # Max decimation error relative to the curve's largest |ΔG|
 
 # Color palette by metal element with grouped families
 COLOR_PALETTE = {
@@ -109,7 +128,7 @@ LINE_STYLES = {
 }
 
 # File paths
-DATA_FILE = 'Flash_JANAF_Master_ext_Tgrid_Gf.pkl'
+DATA_FILE = 'janaf_ellingham_tables.pkl'  # JANAF Ellingham tables loaded (and watched) by the app
 
 # Industrial processing parameters
 TUBE_LENGTH = 0.30  # m (30 cm)
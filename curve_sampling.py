@@ -0,0 +1,123 @@
+"""
+Adaptive temperature sampling for plotted and exported curves.
+
+Instead of a fixed linspace, sample points are added only where linear
+interpolation between neighbours misses the curve by more than a tolerance,
+plus at known breakpoints (fit validity limits, phase transitions, segment
+boundaries of piecewise fits). A quadratic ΔG fit needs a handful of points;
+curves with sharp transitions get points concentrated around them.
+"""
+
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+
+from config import SAMPLING_TOLERANCE, SAMPLING_MIN_POINTS, SAMPLING_MAX_POINTS, SAMPLING_MAX_STEP_K
+
+
+def adaptive_grid(curves: Callable[[np.ndarray], np.ndarray], T_min: float, T_max: float,
+                  tol: float = SAMPLING_TOLERANCE, breakpoints: Optional[Iterable[float]] = None,
+                  min_points: int = SAMPLING_MIN_POINTS, max_points: int = SAMPLING_MAX_POINTS,
+                  max_step: Optional[float] = SAMPLING_MAX_STEP_K) -> np.ndarray:
+    """
+    Choose sample temperatures for one or more curves within a tolerance.
+
+    Each pass evaluates the curves at interval midpoints and splits every
+    interval whose chord misses the midpoint by more than tol (for a
+    quadratic this midpoint error is exactly the maximum error).
+
+    Args:
+        curves: Vectorized function T -> values, shape (n_T,) or (n_curves, n_T)
+        T_min, T_max: Temperature range
+        tol: Maximum interpolation error, in the curves' units
+        breakpoints: Temperatures that must be sampled (ignored outside the range)
+        min_points: Points in the initial uniform grid
+        max_points: Hard cap on the number of points
+        max_step: Largest allowed spacing (keeps hover resolution), None for no limit
+
+    Returns:
+        Sorted temperature array
+    """
+    if T_max <= T_min:
+        return np.array([float(T_min)])
+
+    n_initial = max(min_points, 2)
+    if max_step:
+        n_initial = max(n_initial, int(np.ceil((T_max - T_min) / max_step)) + 1)
+    T = np.linspace(T_min, T_max, min(n_initial, max_points))
+    if breakpoints is not None:
+        inside = [float(t) for t in breakpoints if T_min < t < T_max]
+        T = np.union1d(T, inside)
+
+    def evaluate(points):
+        values = np.asarray(curves(points), dtype=float)
+        if values.ndim == 0:
+            # Constant fallback curves return a scalar
+            values = np.full(len(points), float(values))
+        return np.atleast_2d(values)
+
+    values = evaluate(T)
+    min_width = (T_max - T_min) * 1e-6
+
+    while len(T) < max_points:
+        mid = (T[:-1] + T[1:]) / 2
+        mid_values = evaluate(mid)
+        chord = (values[:, :-1] + values[:, 1:]) / 2
+        with np.errstate(invalid='ignore'):
+            error = np.abs(mid_values - chord)
+        error = np.where(np.isfinite(error), error, 0.0).max(axis=0)
+
+        split = (error > tol) & (np.diff(T) > min_width)
+        if not split.any():
+            break
+
+        # Refine the worst intervals first when the cap would be exceeded
+        budget = max_points - len(T)
+        split_idx = np.flatnonzero(split)
+        if len(split_idx) > budget:
+            split_idx = split_idx[np.argsort(error[split_idx])[::-1][:budget]]
+            split_idx.sort()
+
+        T = np.insert(T, split_idx + 1, mid[split_idx])
+        values = np.insert(values, split_idx + 1, mid_values[:, split_idx], axis=1)
+
+    return T
+
+
+def decimate_indices(T: np.ndarray, curves, max_points: int) -> np.ndarray:
+    """
+    Indices that keep each curve's shape within a point budget.
+
+    Splits the temperature range into columns and keeps the first, last,
+    minimum and maximum point of every curve in each column (min/max
+    decimation), so peaks and steps survive. The number of columns is
+    chosen so that at most max_points indices are kept.
+
+    Args:
+        T: Sorted temperature array
+        curves: Array or list of arrays sampled at T
+        max_points: Point budget for the shared grid
+
+    Returns:
+        Sorted index array into T
+    """
+    T = np.asarray(T, dtype=float)
+    if len(T) <= max_points:
+        return np.arange(len(T))
+
+    values = np.atleast_2d(np.asarray(curves, dtype=float))
+    # First and last point plus a minimum and maximum per curve in each column
+    n_buckets = max(1, max_points // (2 + 2 * len(values)))
+    span = T[-1] - T[0]
+    bucket = np.minimum(((T - T[0]) / span * n_buckets).astype(int), n_buckets - 1)
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(T)]
+
+    keep = [starts, ends - 1]
+    for row in values:
+        # Buckets are contiguous, so sorting by (bucket, value) puts each
+        # bucket's minimum at its start offset
+        finite = np.isfinite(row)
+        keep.append(np.lexsort((np.where(finite, row, np.inf), bucket))[starts])
+        keep.append(np.lexsort((np.where(finite, -row, np.inf), bucket))[starts])
+    return np.unique(np.concatenate(keep))
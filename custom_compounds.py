@@ -7,11 +7,14 @@ for the Off-Equilibrium Ellingham Diagram application.
 
 import json
 import os
+import logging
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 import numpy as np
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class CustomCompound:
     """Data structure for custom compounds with thermodynamic parameters."""
@@ -110,6 +113,8 @@ class CustomCompoundManager:
     def __init__(self, database_file: str = "custom_compounds.json"):
         self.database_file = database_file
         self.compounds: Dict[str, CustomCompound] = {}
+        # Bumped on every change so dependent caches know when to rebuild
+        self.version = 0
         self.load_database()
     
     def load_database(self) -> None:
@@ -122,13 +127,14 @@ class CustomCompoundManager:
                 for name, compound_data in data.items():
                     self.compounds[name] = CustomCompound.from_dict(compound_data)
                 
-                print(f"Loaded {len(self.compounds)} custom compounds from {self.database_file}")
+                self.version += 1
+                logger.info("Loaded %d custom compounds from %s", len(self.compounds), self.database_file)
                 
             except Exception as e:
-                print(f"Error loading custom compounds database: {e}")
+                logger.error("Error loading custom compounds database %s: %s", self.database_file, e)
                 self.compounds = {}
         else:
-            print(f"Custom compounds database {self.database_file} not found. Starting with empty database.")
+            logger.info("Custom compounds database %s not found. Starting with empty database.", self.database_file)
             self.compounds = {}
     
     def save_database(self) -> None:
@@ -139,10 +145,10 @@ class CustomCompoundManager:
             with open(self.database_file, 'w') as f:
                 json.dump(data, f, indent=2)
             
-            print(f"Saved {len(self.compounds)} custom compounds to {self.database_file}")
+            logger.debug("Saved %d custom compounds to %s", len(self.compounds), self.database_file)
             
         except Exception as e:
-            print(f"Error saving custom compounds database: {e}")
+            logger.error("Error saving custom compounds database %s: %s", self.database_file, e)
     
     def add_compound(self, compound: CustomCompound) -> bool:
         """
@@ -162,13 +168,14 @@ class CustomCompoundManager:
             compound.last_modified = datetime.now().isoformat()
             
             self.compounds[compound.name] = compound
+            self.version += 1
             self.save_database()
             
-            print(f"Added custom compound: {compound.name}")
+            logger.info("Added custom compound: %s", compound.name)
             return True
             
         except Exception as e:
-            print(f"Error adding custom compound {compound.name}: {e}")
+            logger.warning("Error adding custom compound %s: %s", compound.name, e)
             return False
     
     def update_compound(self, name: str, compound: CustomCompound) -> bool:
@@ -183,7 +190,7 @@ class CustomCompoundManager:
             True if successful, False otherwise
         """
         if name not in self.compounds:
-            print(f"Compound {name} not found for update")
+            logger.warning("Compound %s not found for update", name)
             return False
         
         try:
@@ -194,13 +201,14 @@ class CustomCompoundManager:
             compound.last_modified = datetime.now().isoformat()
             
             self.compounds[name] = compound
+            self.version += 1
             self.save_database()
             
-            print(f"Updated custom compound: {compound.name}")
+            logger.info("Updated custom compound: %s", compound.name)
             return True
             
         except Exception as e:
-            print(f"Error updating custom compound {compound.name}: {e}")
+            logger.warning("Error updating custom compound %s: %s", compound.name, e)
             return False
     
     def delete_compound(self, name: str) -> bool:
@@ -214,18 +222,19 @@ class CustomCompoundManager:
             True if successful, False otherwise
         """
         if name not in self.compounds:
-            print(f"Compound {name} not found for deletion")
+            logger.warning("Compound %s not found for deletion", name)
             return False
         
         try:
             del self.compounds[name]
+            self.version += 1
             self.save_database()
             
-            print(f"Deleted custom compound: {name}")
+            logger.info("Deleted custom compound: %s", name)
             return True
             
         except Exception as e:
-            print(f"Error deleting custom compound {name}: {e}")
+            logger.warning("Error deleting custom compound %s: %s", name, e)
             return False
     
     def get_compound(self, name: str) -> Optional[CustomCompound]:
@@ -3,36 +3,47 @@ Data loader for JANAF thermodynamic data from pickle file.
 Processes raw data into structured format for Ellingham diagram calculations.
 """
 
-import pandas as pd
 import numpy as np
 import pickle
+import logging
 import warnings
 from typing import Dict, List, Tuple, Optional
 import re
 from config import DATA_FILE
+from compound_index import CATEGORY_ORDER, build_compound_index, lookup_names
 
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
 
 class JANAFDataLoader:
     """Loads and processes JANAF thermodynamic data for Ellingham diagrams."""
     
-    def __init__(self, data_file: str = "janaf_ellingham_tables.pkl"):
+    def __init__(self, data_file: str = DATA_FILE):
         self.data_file = data_file
         self.raw_data = None
         self.processed_data = {}
         self.oxide_species = []
         self.categories_data = {}
+        self.compound_index = None
+        self.search_index = None
+        # Incremented on every (re)load so derived caches can detect stale data
+        self.generation = 0
         
     def load_raw_data(self) -> Dict:
         """Load pre-computed JANAF data from pickle file."""
         try:
             with open(self.data_file, 'rb') as f:
                 self.raw_data = pickle.load(f)
-            print(f"Successfully loaded comprehensive JANAF database: {self.raw_data['metadata']['total_compounds']} compounds")
+            self.compound_index = None
+            self.search_index = None
+            self.generation += 1
+            logger.info("Loaded JANAF database %s: %d compounds", self.data_file,
+                        self.raw_data['metadata']['total_compounds'])
             return self.raw_data
         except Exception as e:
-            print(f"Error loading pickle file: {e}")
+            logger.error("Error loading pickle file %s: %s", self.data_file, e)
             raise
     
     def identify_oxide_species(self) -> List[str]:
@@ -81,9 +92,8 @@ class JANAFDataLoader:
                 oxides.append(oxide)
         
         self.oxide_species = sorted(oxides)
-        print(f"Identified {len(self.oxide_species)} oxide species:")
-        for oxide in self.oxide_species:
-            print(f"  - {oxide}")
+        logger.info("Identified %d oxide species", len(self.oxide_species))
+        logger.debug("Oxide species: %s", self.oxide_species)
             
         return self.oxide_species
     
@@ -239,7 +249,7 @@ class JANAFDataLoader:
         species_data = self.raw_data[self.raw_data['species'] == species_name].copy()
         
         if species_data.empty:
-            print(f"Warning: No data found for {species_name}")
+            logger.warning("No data found for %s", species_name)
             return {}
             
         # Clean data - try both Gibbs free energy columns, then calculate from H and S
@@ -259,13 +269,13 @@ class JANAFDataLoader:
                 species_data['T_K'] * species_data['S_J_per_molK'] / 1000
             )
             delta_f_G_col = 'delta_f_G_kJ_per_mol'
-            print(f"✓ Calculated Gibbs free energy from H and S for {species_name}")
+            logger.debug("Calculated Gibbs free energy from H and S for %s", species_name)
         else:
-            print(f"Warning: No Gibbs free energy data found for {species_name}")
+            logger.warning("No Gibbs free energy data found for %s", species_name)
             return {}
         
         if species_data.empty:
-            print(f"Warning: No valid Gibbs free energy data for {species_name}")
+            logger.warning("No valid Gibbs free energy data for %s", species_name)
             return {}
         
         # Extract temperature and Gibbs free energy
@@ -388,7 +398,7 @@ class JANAFDataLoader:
         if not self.oxide_species:
             self.identify_oxide_species()
             
-        print("Processing thermodynamic data for all oxides...")
+        logger.info("Processing thermodynamic data for all oxides")
         
         for species in self.oxide_species:
             try:
@@ -397,13 +407,13 @@ class JANAFDataLoader:
                     # Create a clean key for the species
                     clean_key = self._create_clean_key(species)
                     self.processed_data[clean_key] = processed
-                    print(f"✓ Processed {species}")
+                    logger.debug("Processed %s", species)
                 else:
-                    print(f"✗ Failed to process {species}")
+                    logger.warning("Failed to process %s", species)
             except Exception as e:
-                print(f"✗ Error processing {species}: {e}")
+                logger.warning("Error processing %s: %s", species, e)
         
-        print(f"\nSuccessfully processed {len(self.processed_data)} oxides")
+        logger.info("Processed %d oxides", len(self.processed_data))
         return self.processed_data
     
     def _create_clean_key(self, species_name: str) -> str:
@@ -447,18 +457,69 @@ class JANAFDataLoader:
         if self.raw_data is None:
             self.load_raw_data()
         
+        index = self.get_compound_index()
         if category:
-            if category in self.raw_data:
-                return list(self.raw_data[category].keys())
-            else:
-                return []
+            return lookup_names(index, index['by_category'].get(category))
         else:
             # Return all materials from all categories
-            all_materials = []
-            for cat in ['oxides', 'carbides', 'nitrides', 'halides', 'hydrides', 'sulfides', 'phosphides', 'pure_elements', 'other']:
-                if cat in self.raw_data:
-                    all_materials.extend(list(self.raw_data[cat].keys()))
-            return all_materials
+            return list(index['names'])
+    
+    def get_compound_index(self) -> Dict:
+        """
+        Get the composition index used for fast category/element filtering.
+        
+        Uses the index stored by the preprocessor when present, otherwise
+        builds it once from the loaded tables.
+        
+        Returns:
+            Compound index dictionary (see compound_index.build_compound_index)
+        """
+        if self.raw_data is None:
+            self.load_raw_data()
+        
+        if self.compound_index is None:
+            self.compound_index = self.raw_data.get('compound_index') or build_compound_index(self.raw_data)
+        return self.compound_index
+    
+    def get_search_index(self):
+        """
+        Get the typeahead search index over names, formulas, elements and aliases.
+        
+        Returns:
+            MaterialSearchIndex (built once per data load)
+        """
+        if self.search_index is None:
+            from material_search import build_material_search_index
+            from material_selector import METAL_NAMES_BY_SYMBOL
+            from utils import get_material_display_name
+            
+            if self.raw_data is None:
+                self.load_raw_data()
+            self.search_index = build_material_search_index(
+                self.raw_data, CATEGORY_ORDER,
+                label_for=get_material_display_name,
+                metal_names=METAL_NAMES_BY_SYMBOL
+            )
+        return self.search_index
+    
+    def get_materials_by_element(self, symbol: str, category: str = None) -> List[str]:
+        """
+        Get materials containing an element, optionally within one category.
+        
+        Args:
+            symbol: Element symbol (e.g. 'Ti', 'O')
+            category: Optional category filter
+        
+        Returns:
+            List of material names
+        """
+        index = self.get_compound_index()
+        rows = index['by_element'].get(symbol)
+        if rows is None:
+            return []
+        if category:
+            rows = np.intersect1d(rows, index['by_category'].get(category, []), assume_unique=True)
+        return lookup_names(index, rows)
     
     def get_categories_data(self) -> Dict[str, List[Dict]]:
         """
@@ -471,7 +532,7 @@ class JANAFDataLoader:
             self.load_raw_data()
         
         categories_data = {}
-        for category in ['oxides', 'carbides', 'nitrides', 'halides', 'hydrides', 'sulfides', 'phosphides', 'pure_elements', 'other']:
+        for category in CATEGORY_ORDER:
             if category in self.raw_data:
                 materials = []
                 for name, data in self.raw_data[category].items():
@@ -503,7 +564,7 @@ class JANAFDataLoader:
             return self.raw_data['compound_lookup'][material_name]
         
         # Fallback: search all categories
-        for category in ['oxides', 'carbides', 'nitrides', 'halides', 'hydrides', 'sulfides', 'phosphides', 'pure_elements', 'other']:
+        for category in CATEGORY_ORDER:
             if category in self.raw_data and material_name in self.raw_data[category]:
                 return self.raw_data[category][material_name]
         
@@ -0,0 +1,376 @@
+"""
+Versioned dataset registry with hot swapping.
+
+A dataset version is the JANAF Ellingham tables plus the commodity price
+file, identified by a hash of their contents. New versions are loaded and
+validated in a background thread and then swapped in with a single
+reference assignment: requests that start afterwards see the new version,
+while requests already running stay pinned to the version they started on
+(see pin()/unpin() and DatasetProxy).
+
+The app keeps using its module-level data_loader / thermo_engine names;
+they are DatasetProxy objects that resolve to the pinned or active version.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+import contextvars
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from config import DATA_FILE
+from data_loader import JANAFDataLoader
+from thermo_calcs import ThermodynamicEngine
+
+logger = logging.getLogger(__name__)
+
+PRICE_FILE = os.getenv('COMMODITY_PRICE_FILE', 'commodity_prices.json')
+
+# Seconds between checks of the data files for changes (0 disables watching)
+DATASET_WATCH_INTERVAL = float(os.getenv('DATASET_WATCH_INTERVAL', 30))
+
+# A new version may not lose more than this fraction of the active version's compounds
+DATASET_MIN_COMPOUND_RATIO = 0.9
+
+# Previous versions kept for /api/datasets (and in-flight requests)
+KEEP_VERSIONS = 3
+
+_pinned: contextvars.ContextVar = contextvars.ContextVar('pinned_dataset', default=None)
+
+
+def file_digest(path: str) -> Optional[str]:
+    """SHA-1 of a file's contents, or None if it does not exist."""
+    try:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class DatasetError(Exception):
+    """Raised when a dataset version fails to load or validate."""
+
+
+class Dataset:
+    """One loaded, validated dataset version."""
+
+    def __init__(self, version: str, data_loader: JANAFDataLoader, thermo_engine: ThermodynamicEngine,
+                 files: Dict[str, Optional[str]], price_file: Optional[str] = None):
+        self.version = version
+        self.data_loader = data_loader
+        self.thermo_engine = thermo_engine
+        self.files = files
+        self.price_file = price_file
+        self.loaded_at = time.time()
+        self._prices = None
+
+    @property
+    def prices(self):
+        """CommodityPriceManager for this version's price file (loaded on first use)."""
+        if self._prices is None:
+            from commodity_prices import CommodityPriceManager
+            self._prices = CommodityPriceManager(self.price_file)
+        return self._prices
+
+    def describe(self) -> Dict:
+        return {
+            'version': self.version,
+            'loaded_at': self.loaded_at,
+            'total_compounds': self.data_loader.raw_data['metadata']['total_compounds'],
+            'files': self.files
+        }
+
+
+class DatasetRegistry:
+    """Holds the active dataset version and swaps in new ones."""
+
+    def __init__(self, data_file: str = DATA_FILE, price_file: str = PRICE_FILE,
+                 shared_tables=None, required_materials: Optional[List[str]] = None):
+        """
+        Args:
+            data_file: JANAF Ellingham tables pickle
+            price_file: Commodity price JSON file
+            shared_tables: Optional SharedTables to publish each activated version to
+            required_materials: Materials a new version must keep if the active one has them
+        """
+        self.data_file = data_file
+        self.price_file = price_file
+        self.shared_tables = shared_tables
+        self.required_materials = list(required_materials or [])
+        self.active: Optional[Dataset] = None
+        self.history: List[Dataset] = []
+        self.state = {'status': 'empty', 'error': None, 'checked_at': None}
+        self._on_swap: List[Callable[[Dataset, Optional[Dataset]], None]] = []
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()  # One reload at a time (watcher and POST /api/datasets/reload)
+        self._watch_pid = None
+        self._file_stats = None
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.active.version if self.active else None
+
+    def on_swap(self, hook: Callable[[Dataset, Optional[Dataset]], None]):
+        """Register hook(new, old) run after every swap (e.g. to drop caches)."""
+        self._on_swap.append(hook)
+        return hook
+
+    # ------------------------------------------------------------------
+    # Loading and validation
+
+    def _version_of(self, files: Dict[str, Optional[str]]) -> str:
+        digest = hashlib.sha1(json.dumps(files, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()[:12]
+
+    def load(self) -> Dataset:
+        """
+        Load and validate the current data files as a new Dataset (not yet active).
+
+        Raises:
+            DatasetError: If the files cannot be loaded or fail validation
+        """
+        files = {'data': file_digest(self.data_file), 'prices': file_digest(self.price_file)}
+        if files['data'] is None:
+            raise DatasetError(f"Data file {self.data_file} not found")
+
+        try:
+            loader = JANAFDataLoader(self.data_file)
+            loader.load_raw_data()
+        except Exception as e:
+            raise DatasetError(f"Could not load {self.data_file}: {e}") from e
+        with self._lock:
+            # Keeps generation-keyed caches (e.g. option sets) from mistaking
+            # the new loader for the old one
+            self._generation += 1
+            loader.generation = self._generation
+
+        engine = ThermodynamicEngine(loader)
+        dataset = Dataset(self._version_of(files), loader, engine, files, self.price_file)
+        errors = self.validate(dataset)
+        if errors:
+            raise DatasetError(f"Dataset {dataset.version} failed validation: " + '; '.join(errors[:5]))
+        return dataset
+
+    def validate(self, dataset: Dataset) -> List[str]:
+        """
+        Check a dataset before it is activated.
+
+        Returns:
+            List of problems (empty if the dataset is usable)
+        """
+        errors = []
+        loader = dataset.data_loader
+        try:
+            total = int(loader.raw_data['metadata']['total_compounds'])
+            names = loader.get_compound_index()['names']
+        except Exception as e:
+            return [f"malformed tables: {e}"]
+
+        if total <= 0 or not names:
+            errors.append("no compounds")
+        if self.active is not None:
+            active_loader = self.active.data_loader
+            active_total = active_loader.raw_data['metadata']['total_compounds']
+            if total < DATASET_MIN_COMPOUND_RATIO * active_total:
+                errors.append(f"{total} compounds, active version has {active_total}")
+            # A new version must keep the required materials the active one provides
+            missing = [name for name in self.required_materials
+                       if active_loader.get_material_data(name) is not None and loader.get_material_data(name) is None]
+            if missing:
+                errors.append(f"missing materials: {', '.join(missing)}")
+
+        T_check = np.array([298.15, 1000.0, 2000.0])
+        bad = []
+        for name in names:
+            record = dataset.thermo_engine.compute_off_equilibrium_coefficients(name)
+            if record is None:
+                continue
+            A, B, C = record['A'], record['B'], record['C']
+            if not np.all(np.isfinite(A + B * T_check + C * T_check**2)):
+                bad.append(name)
+        if bad:
+            errors.append(f"non-finite ΔG fits: {', '.join(bad[:5])}")
+
+        if dataset.files.get('prices') is not None:
+            try:
+                with open(dataset.price_file, 'r') as f:
+                    if not isinstance(json.load(f), dict):
+                        errors.append("price file is not a JSON object")
+            except (OSError, ValueError) as e:
+                errors.append(f"price file unreadable: {e}")
+        return errors
+
+    # ------------------------------------------------------------------
+    # Activation
+
+    def activate(self, dataset: Dataset):
+        """Publish shared tables for the dataset and make it the active version."""
+        if self.shared_tables is not None:
+            try:
+                view = self.shared_tables.view()
+                if view is None or view.meta.get('dataset_version') != dataset.version:
+                    # Another worker may already have published this version
+                    from shared_tables import build_tables
+                    self.shared_tables.publish(
+                        build_tables(dataset.data_loader, dataset.thermo_engine),
+                        {'dataset_version': dataset.version,
+                         'total_compounds': dataset.data_loader.raw_data['metadata']['total_compounds']})
+                dataset.thermo_engine.dataset_version = dataset.version
+                dataset.thermo_engine.shared_tables = self.shared_tables
+            except Exception as e:
+                logger.warning("Shared tables unavailable, using in-process data: %s", e)
+
+        with self._lock:
+            previous = self.active
+            # New requests pick this up; pinned in-flight requests keep the old object
+            self.active = dataset
+            self.history = ([dataset] + [d for d in self.history if d is not dataset])[:KEEP_VERSIONS]
+            self._file_stats = self._stat_files()
+        self.state.update(status='active', error=None)
+
+        for hook in self._on_swap:
+            try:
+                hook(dataset, previous)
+            except Exception as e:
+                logger.warning("Dataset swap hook %s failed: %s", getattr(hook, '__name__', hook), e)
+        if previous is not None:
+            logger.info("Dataset swapped %s -> %s", previous.version, dataset.version)
+
+    def reload(self) -> bool:
+        """
+        Load, validate and activate the current files (blocking).
+
+        A reload already running in this process makes this a no-op. After a
+        failure the watcher does not retry until the files change again.
+
+        Returns:
+            True if a new version was activated
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            logger.info("Dataset reload already running")
+            return False
+        try:
+            self.state.update(status='loading', checked_at=time.time())
+            stats = self._stat_files()
+            try:
+                files = {'data': file_digest(self.data_file), 'prices': file_digest(self.price_file)}
+                if self.active is not None and self._version_of(files) == self.active.version:
+                    with self._lock:
+                        self._file_stats = stats
+                    self.state.update(status='active')
+                    return False
+                dataset = self.load()
+            except DatasetError as e:
+                # The active version keeps serving
+                with self._lock:
+                    self._file_stats = stats
+                self.state.update(status='failed', error=str(e))
+                logger.error("Dataset reload failed: %s", e)
+                return False
+            self.activate(dataset)
+            return True
+        finally:
+            self._reload_lock.release()
+
+    def reload_async(self) -> threading.Thread:
+        """Reload in a background thread."""
+        thread = threading.Thread(target=self.reload, name='dataset-reload', daemon=True)
+        thread.start()
+        return thread
+
+    # ------------------------------------------------------------------
+    # File watching
+
+    def _stat_files(self):
+        stats = []
+        for path in (self.data_file, self.price_file):
+            try:
+                stat = os.stat(path)
+                stats.append((stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                stats.append(None)
+        return stats
+
+    def start_watching(self, interval: float = DATASET_WATCH_INTERVAL):
+        """
+        Poll the data files and reload when they change.
+
+        Safe to call on every request: starts one watcher per process (a
+        watcher started before a fork does not survive in the children).
+        """
+        if interval <= 0 or self._watch_pid == os.getpid():
+            return
+        with self._lock:
+            if self._watch_pid == os.getpid():
+                return
+            self._watch_pid = os.getpid()
+
+        def watch():
+            while True:
+                time.sleep(interval)
+                if self._stat_files() != self._file_stats:
+                    self.reload()
+
+        threading.Thread(target=watch, name='dataset-watch', daemon=True).start()
+
+    # ------------------------------------------------------------------
+    # Request pinning
+
+    def pin(self):
+        """Pin the active version for the current request; returns a token for unpin()."""
+        return _pinned.set(self.active)
+
+    def unpin(self, token):
+        _pinned.reset(token)
+
+    def current(self) -> Optional[Dataset]:
+        """Dataset pinned for this request, else the active one."""
+        return _pinned.get() or self.active
+
+    def proxy(self, attribute: str) -> 'DatasetProxy':
+        return DatasetProxy(self, attribute)
+
+    def status(self) -> Dict:
+        return {
+            'active': self.active.describe() if self.active else None,
+            'history': [dataset.describe() for dataset in self.history[1:]],
+            **self.state
+        }
+
+
+class DatasetProxy:
+    """Forwards attribute access to one attribute of the current dataset."""
+
+    __slots__ = ('_registry', '_attribute')
+
+    def __init__(self, registry: DatasetRegistry, attribute: str):
+        object.__setattr__(self, '_registry', registry)
+        object.__setattr__(self, '_attribute', attribute)
+
+    def _target(self):
+        dataset = self._registry.current()
+        return getattr(dataset, self._attribute) if dataset is not None else None
+
+    def __getattr__(self, name):
+        target = self._target()
+        if target is None:
+            raise AttributeError(f"No dataset loaded (accessing {self._attribute}.{name})")
+        return getattr(target, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._target(), name, value)
+
+    def __bool__(self):
+        return self._target() is not None
+
+    def __repr__(self):
+        return f"<DatasetProxy {self._attribute} -> {self._target()!r}>"
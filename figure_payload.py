@@ -0,0 +1,329 @@
+"""
+Compact figure payloads for Dash callbacks.
+
+Figures leave the server as plain dictionaries with:
+- numeric arrays encoded as base64 typed arrays (Plotly's {'dtype', 'bdata'}
+  spec), downcast to float32 when the rounding error is negligible
+- per-trace hovertemplates reduced to one shared template plus a short
+  per-trace 'meta' list holding only the parts that differ
+
+Serialized sizes are recorded per callback and exposed via payload_stats();
+browser render times reported by assets/render_timing.js via render_stats().
+"""
+
+import re
+import time
+import base64
+import logging
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+import numpy as np
+import plotly.graph_objects as go
+
+from config import PAYLOAD_FLOAT_RTOL, PAYLOAD_MIN_ARRAY_LENGTH, PAYLOAD_SIZE_LOGGING
+
+_TYPED_ARRAY_CODES = {
+    np.dtype('float64'): 'f8', np.dtype('float32'): 'f4',
+    np.dtype('int32'): 'i4', np.dtype('int16'): 'i2', np.dtype('int8'): 'i1',
+    np.dtype('uint32'): 'u4', np.dtype('uint16'): 'u2', np.dtype('uint8'): 'u1'
+}
+
+# Attributes that are not data arrays even if they hold lists of numbers
+_SKIP_KEYS = {'range', 'domain', 'dash', 'tickvals', 'selectedpoints', 'traces'}
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r'%\{[^}]*\}|<extra>.*?</extra>')
+
+
+def is_typed_array(value) -> bool:
+    return isinstance(value, dict) and 'bdata' in value and 'dtype' in value
+
+
+def decode_typed_array(value) -> np.ndarray:
+    """Inverse of encode_array (also accepts plain lists)."""
+    if not is_typed_array(value):
+        return np.asarray(value)
+    data = np.frombuffer(base64.b64decode(value['bdata']), dtype=np.dtype(value['dtype']).newbyteorder('<'))
+    return data.reshape(value['shape']) if 'shape' in value else data
+
+
+def _as_numeric_array(value) -> Optional[np.ndarray]:
+    if isinstance(value, np.ndarray):
+        array = value
+    elif is_typed_array(value):
+        array = decode_typed_array(value)
+    elif isinstance(value, (list, tuple)) and len(value) >= PAYLOAD_MIN_ARRAY_LENGTH:
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value):
+            return None
+        array = np.asarray(value)
+    else:
+        return None
+    if array.dtype.kind not in 'fiu' or array.ndim != 1:
+        return None
+    return array
+
+
+def encode_array(array: np.ndarray, rtol: float = PAYLOAD_FLOAT_RTOL) -> Dict:
+    """
+    Encode a 1-D numeric array as a base64 typed array.
+
+    Floats are downcast to float32 when every value round-trips within
+    rtol of the array's largest magnitude.
+    """
+    array = np.asarray(array)
+    if array.dtype.kind == 'f':
+        array = array.astype(np.float64, copy=False)
+        single = array.astype(np.float32)
+        finite = np.isfinite(array)
+        scale = np.max(np.abs(array[finite])) if finite.any() else 0.0
+        if scale < np.finfo(np.float32).max and (
+                not finite.any() or np.max(np.abs(single[finite] - array[finite])) <= rtol * scale):
+            array = single
+    elif array.dtype.kind in 'iu':
+        if array.size and array.min() >= np.iinfo(np.int32).min and array.max() <= np.iinfo(np.int32).max:
+            array = array.astype(np.int32)
+    dtype = array.dtype
+    if dtype not in _TYPED_ARRAY_CODES:
+        array = array.astype(np.float64)
+        dtype = array.dtype
+    return {'dtype': _TYPED_ARRAY_CODES[dtype],
+            'bdata': base64.b64encode(array.astype(dtype.newbyteorder('<')).tobytes()).decode('ascii')}
+
+
+def _encode_arrays(node):
+    """Recursively replace numeric arrays in a trace/frame dictionary."""
+    if isinstance(node, dict):
+        if is_typed_array(node):
+            array = _as_numeric_array(node)
+            return encode_array(array) if array is not None else node
+        out = {}
+        for key, value in node.items():
+            if key in _SKIP_KEYS:
+                out[key] = value
+                continue
+            array = _as_numeric_array(value)
+            out[key] = encode_array(array) if array is not None else _encode_arrays(value)
+        return out
+    if isinstance(node, list):
+        return [_encode_arrays(item) for item in node]
+    return node
+
+
+def _decode_arrays(node):
+    if is_typed_array(node):
+        return decode_typed_array(node)
+    if isinstance(node, dict):
+        return {key: _decode_arrays(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_decode_arrays(item) for item in node]
+    return node
+
+
+def _split_hovertemplate(template: str):
+    return _PLACEHOLDER.split(template), tuple(_PLACEHOLDER.findall(template))
+
+
+def _share_hovertemplates(traces: List[Dict]):
+    """
+    Replace the most common hovertemplate shape with one shared template.
+
+    Traces whose templates have the same placeholders share a skeleton; the
+    literal text that differs between them moves into each trace's 'meta'
+    and is referenced as %{meta[i]}.
+
+    Returns:
+        (shared template or None, ids of the traces now using it)
+    """
+    candidates = [t for t in traces if isinstance(t.get('hovertemplate'), str) and 'meta' not in t]
+    if len(candidates) < 2:
+        return None, set()
+
+    split = [_split_hovertemplate(t['hovertemplate']) for t in candidates]
+    shape, count = Counter(placeholders for _, placeholders in split).most_common(1)[0]
+    if count < 2:
+        return None, set()
+
+    group = [(trace, literals) for trace, (literals, placeholders) in zip(candidates, split) if placeholders == shape]
+    n_literals = len(group[0][1])
+    varying = [j for j in range(n_literals) if len({literals[j] for _, literals in group}) > 1]
+
+    parts = []
+    for j in range(n_literals):
+        parts.append(f"%{{meta[{varying.index(j)}]}}" if j in varying else group[0][1][j])
+        if j < len(shape):
+            parts.append(shape[j])
+
+    for trace, literals in group:
+        del trace['hovertemplate']
+        if varying:
+            trace['meta'] = [literals[j] for j in varying]
+    return ''.join(parts), {id(trace) for trace, _ in group}
+
+
+def compact_figure(figure) -> Dict:
+    """
+    Convert a figure into a compact payload dictionary.
+
+    Args:
+        figure: go.Figure or figure dictionary
+
+    Returns:
+        Figure dictionary suitable as a dcc.Graph 'figure' output
+    """
+    fig_dict = figure.to_plotly_json() if isinstance(figure, go.Figure) else dict(figure)
+    data = _encode_arrays(list(fig_dict.get('data', [])))
+    layout = dict(fig_dict.get('layout', {}))
+
+    template = dict(layout.get('template') or {})
+    template_data = dict(template.get('data') or {})
+
+    by_type: Dict[str, List[Dict]] = {}
+    for trace in data:
+        by_type.setdefault(trace.get('type', 'scatter'), []).append(trace)
+
+    for trace_type, traces in by_type.items():
+        existing = template_data.get(trace_type) or [{}]
+        if len(existing) > 1:
+            # Template items are applied cyclically; sharing needs a single item
+            continue
+        item = dict(existing[0])
+        if 'hovertemplate' in item:
+            continue
+        shared_hover, sharing = _share_hovertemplates(traces)
+        if shared_hover is not None:
+            item['hovertemplate'] = shared_hover
+            # Traces outside the group must not inherit the shared template
+            for trace in traces:
+                if id(trace) not in sharing:
+                    trace.setdefault('hovertemplate', '')
+            template_data[trace_type] = [item]
+
+    if template_data:
+        template['data'] = template_data
+        layout['template'] = template
+
+    compact = dict(fig_dict, data=data, layout=layout)
+    if fig_dict.get('frames'):
+        compact['frames'] = _encode_arrays(list(fig_dict['frames']))
+    return compact
+
+
+def expand_figure(figure: Dict) -> go.Figure:
+    """
+    Rebuild a go.Figure from a compact payload (e.g. the figure State of an export callback).
+
+    Shared hovertemplates are written back onto the traces so that
+    exporters that ignore templated data see complete traces.
+    """
+    figure = dict(figure)
+    layout = dict(figure.get('layout', {}))
+    template = dict(layout.get('template') or {})
+    template_data = dict(template.get('data') or {})
+    data = []
+    for trace in figure.get('data', []):
+        trace = dict(trace)
+        items = template_data.get(trace.get('type', 'scatter')) or [{}]
+        shared = items[0] if len(items) == 1 else {}
+        if 'hovertemplate' not in trace and 'hovertemplate' in shared:
+            meta = trace.get('meta') or []
+            trace['hovertemplate'] = re.sub(r'%\{meta\[(\d+)\]\}', lambda m: str(meta[int(m.group(1))]),
+                                            shared['hovertemplate'])
+            trace.pop('meta', None)
+        data.append(_decode_arrays(trace))
+    for trace_type, items in template_data.items():
+        if len(items) == 1:
+            template_data[trace_type] = [{k: v for k, v in items[0].items() if k != 'hovertemplate'}]
+    template['data'] = template_data
+    layout['template'] = template
+    return go.Figure(data=data, layout=layout, frames=_decode_arrays(figure.get('frames') or []))
+
+
+# ---------------------------------------------------------------------------
+# Per-callback payload size reporting
+
+_stats_lock = threading.Lock()
+_payload_stats: Dict[str, Dict] = {}
+
+
+def serialized_size(payload) -> int:
+    """Size in bytes of a callback output as Dash will send it."""
+    from plotly.io.json import to_json_plotly
+    return len(to_json_plotly(payload).encode('utf-8'))
+
+
+def record_payload(callback_name: str, *outputs):
+    """Record the serialized size of one callback's outputs."""
+    size = sum(serialized_size(output) for output in outputs if output is not None)
+    with _stats_lock:
+        entry = _payload_stats.setdefault(callback_name, {'calls': 0, 'total_bytes': 0, 'max_bytes': 0})
+        entry['calls'] += 1
+        entry['total_bytes'] += size
+        entry['max_bytes'] = max(entry['max_bytes'], size)
+        entry['last_bytes'] = size
+        entry['last_time'] = time.time()
+    if PAYLOAD_SIZE_LOGGING:
+        logger.info("%s: %.1f KB", callback_name, size / 1024)
+    return size
+
+
+def payload_stats() -> Dict[str, Dict]:
+    """Snapshot of per-callback payload sizes (bytes)."""
+    with _stats_lock:
+        return {
+            name: dict(entry, mean_bytes=entry['total_bytes'] / entry['calls'])
+            for name, entry in _payload_stats.items()
+        }
+
+
+# ---------------------------------------------------------------------------
+# Browser render timings (posted by assets/render_timing.js)
+
+_render_samples: Dict[str, List[float]] = {}
+_RENDER_SAMPLE_LIMIT = 500
+_RENDER_MODES = ('svg', 'webgl')
+_RENDER_TRACE_BUCKETS = (5, 20, 50, 100)  # Upper bounds; larger counts share one '>100' bucket
+_RENDER_MAX_KEYS = len(_RENDER_MODES) * (len(_RENDER_TRACE_BUCKETS) + 1)
+
+
+def _trace_bucket(traces: int) -> str:
+    for bound in _RENDER_TRACE_BUCKETS:
+        if traces <= bound:
+            return f"<={bound}"
+    return f">{_RENDER_TRACE_BUCKETS[-1]}"
+
+
+def record_render_timing(sample: Dict):
+    """Store one browser render time, grouped by mode and trace-count bucket (anything else is dropped)."""
+    try:
+        ms = float(sample['ms'])
+        mode = sample.get('mode', 'svg')
+        traces = int(sample.get('traces', 0))
+    except (KeyError, TypeError, ValueError):
+        return
+    if mode not in _RENDER_MODES or not np.isfinite(ms) or ms < 0:
+        return
+    key = f"{mode}/{_trace_bucket(traces)}"
+    with _stats_lock:
+        if key not in _render_samples and len(_render_samples) >= _RENDER_MAX_KEYS:
+            return
+        samples = _render_samples.setdefault(key, [])
+        samples.append(ms)
+        del samples[:-_RENDER_SAMPLE_LIMIT]
+
+
+def render_stats() -> Dict[str, Dict]:
+    """Frame time summary (ms) per 'mode/traces' key (e.g. 'svg/<=20')."""
+    with _stats_lock:
+        snapshot = {key: list(samples) for key, samples in _render_samples.items()}
+    return {
+        key: {
+            'count': len(samples),
+            'p50_ms': float(np.percentile(samples, 50)),
+            'p95_ms': float(np.percentile(samples, 95)),
+            'max_ms': float(np.max(samples))
+        }
+        for key, samples in snapshot.items() if samples
+    }
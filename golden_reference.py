@@ -0,0 +1,325 @@
+"""
+Golden-reference checks for the fast evaluation paths.
+
+The reference is ThermodynamicEngine without shared tables, evaluated point
+by point the way the original callbacks did (calc_off_equilibrium_DG,
+calc_crossover_temperature on its 1000-point grid, calc_comprehensive_gas_ratios).
+Every fast path is evaluated on the same randomized cases of (material,
+temperatures, field E, radius r, gas ratio scale) and compared with a
+tolerance: exact-formula paths must agree to rounding, approximating paths
+(adaptive sampling, high-volume decimation, float32 payloads, the 10 K
+crossover grid) within the tolerance they were designed for.
+
+    python golden_reference.py                  # 200 cases, all fast paths
+    python golden_reference.py --cases 2000 --seed 7
+    python golden_reference.py -k sampling      # only paths whose name contains this
+    python benchmarks.py --golden               # the same checks after the benchmarks
+
+Exits with status 1 if any fast path exceeds its tolerance.
+"""
+
+import os
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config import (DEFAULT_TEMP_RANGE, SAMPLING_TOLERANCE, GAS_RATIO_SAMPLING_TOLERANCE,
+                    PAYLOAD_FLOAT_RTOL, REACTOR_DESIGN, HIGH_VOLUME_MAX_POINTS, HIGH_VOLUME_DECIMATION_RTOL)
+
+GOLDEN_CASES = int(os.getenv('GOLDEN_CASES', 200))
+GOLDEN_SEED = int(os.getenv('GOLDEN_SEED', 0))
+
+POINTS_PER_CASE = 64
+RADIUS_RANGE_UM = (0.1, 100.0)
+UNKNOWN_MATERIAL = 'Unobtainium Oxide'  # Fast paths must return NaN/None like the reference
+UNKNOWN_SHARE = 0.05
+
+# Rounding slack for paths that evaluate the same closed form in a different order
+FORMULA_RTOL = 1e-12
+FORMULA_ATOL = 1e-9  # kJ/mol
+
+_FAST_PATHS: Dict[str, Dict] = {}
+
+
+def fast_path(name: str, atol: float = FORMULA_ATOL, rtol: float = FORMULA_RTOL, relative_to: str = 'value'):
+    """
+    Register a check returning (reference, fast) arrays for one case.
+
+    Args:
+        name: Fast path name
+        atol, rtol: Allowed |fast - reference| <= atol + rtol * scale
+        relative_to: 'value' (scale = |reference| per point) or 'max'
+            (scale = max |reference| of the case, for per-array tolerances)
+    """
+    def decorator(check):
+        _FAST_PATHS[name] = {'check': check, 'atol': atol, 'rtol': rtol, 'relative_to': relative_to,
+                             'description': (check.__doc__ or '').strip().splitlines()[0]}
+        return check
+    return decorator
+
+
+class _Context:
+    """Reference engine and engines with the fast paths attached."""
+
+    def __init__(self, data_loader=None):
+        from data_loader import JANAFDataLoader
+        from thermo_calcs import ThermodynamicEngine
+        if data_loader is None:
+            data_loader = JANAFDataLoader()
+            data_loader.load_raw_data()
+        self.loader = data_loader
+        self.reference = ThermodynamicEngine(data_loader)
+        self._tables_dir = None
+        self._tables_engine = None
+
+    @property
+    def tables_engine(self):
+        """Engine reading coefficients and ΔG° grids from freshly published shared tables."""
+        if self._tables_engine is None:
+            from shared_tables import SharedTables, build_tables
+            from thermo_calcs import ThermodynamicEngine
+            self._tables_dir = tempfile.TemporaryDirectory(prefix='golden_tables_')
+            tables = SharedTables(root=self._tables_dir.name)
+            tables.publish(build_tables(self.loader, self.reference))
+            self._tables_engine = ThermodynamicEngine(self.loader, shared_tables=tables)
+        return self._tables_engine
+
+    def close(self):
+        if self._tables_dir is not None:
+            self._tables_dir.cleanup()
+
+    def off_equilibrium_DG(self, case: Dict, T: Optional[np.ndarray] = None) -> np.ndarray:
+        T = case['T_K'] if T is None else T
+        return self.reference.calc_off_equilibrium_DG(case['material'], T, case['E_V_m'], case['r_m'])
+
+
+def generate_cases(materials: List[str], gas_scales: List[str], n: int = GOLDEN_CASES,
+                   seed: int = GOLDEN_SEED) -> List[Dict]:
+    """
+    Randomized evaluation cases.
+
+    Args:
+        materials: Material names to draw from (an unknown name is mixed in)
+        gas_scales: Gas ratio scale keys to draw from
+        n: Number of cases
+        seed: Random seed
+
+    Returns:
+        List of dicts with material, T_K (sorted, including the range limits),
+        E_V_m, r_m and gas
+    """
+    rng = np.random.default_rng(seed)
+    E_min, E_max = REACTOR_DESIGN['field_range_mv_m']
+    cases = []
+    for _ in range(n):
+        material = UNKNOWN_MATERIAL if rng.random() < UNKNOWN_SHARE else str(rng.choice(materials))
+        T_min = rng.uniform(DEFAULT_TEMP_RANGE[0], DEFAULT_TEMP_RANGE[1] - 100.0)
+        T_max = rng.uniform(T_min + 50.0, DEFAULT_TEMP_RANGE[1])
+        T_K = np.sort(np.r_[T_min, T_max, rng.uniform(T_min, T_max, POINTS_PER_CASE - 2)])
+        # Zero field now and then (the equilibrium limit)
+        E_MV_m = 0.0 if rng.random() < 0.05 else rng.uniform(E_min, E_max)
+        r_um = float(np.exp(rng.uniform(*np.log(RADIUS_RANGE_UM))))
+        cases.append({'material': material, 'T_K': T_K, 'E_V_m': E_MV_m * 1e6, 'r_m': r_um * 1e-6,
+                      'gas': str(rng.choice(gas_scales))})
+    return cases
+
+
+def _shifted_quadratic(record: Optional[Dict], case: Dict) -> np.ndarray:
+    """ΔG_eff from a coefficient record, as assets/clientside.js evaluates it."""
+    T = case['T_K']
+    if record is None:
+        return np.full_like(T, np.nan)
+    shift = record['nF_kJ'] * case['E_V_m'] * case['r_m'] + record['W_ph']
+    return record['A'] + record['B'] * T + record['C'] * T * T - shift
+
+
+@fast_path('clientside_coefficients')
+def _clientside(ctx, case):
+    """Coefficient records evaluated by the clientside slider callback."""
+    record = ctx.reference.get_off_equilibrium_coefficients(case['material'])
+    return ctx.off_equilibrium_DG(case), _shifted_quadratic(record, case)
+
+
+@fast_path('shared_tables_coefficients')
+def _shared_coefficients(ctx, case):
+    """Coefficient records read from the shared memory-mapped tables."""
+    record = ctx.tables_engine.get_off_equilibrium_coefficients(case['material'])
+    return ctx.off_equilibrium_DG(case), _shifted_quadratic(record, case)
+
+
+@fast_path('off_equilibrium_frames')
+def _frames(ctx, case):
+    """Vectorized ΔG_eff over materials × radii × fields (animation frames)."""
+    frames = ctx.tables_engine.calc_off_equilibrium_DG_frames(
+        [case['material']], case['T_K'], np.array([case['E_V_m']]), np.array([case['r_m']]))
+    return ctx.off_equilibrium_DG(case), frames[0, 0, 0]
+
+
+@fast_path('crossover_temperature_grid', atol=1.0, rtol=0.0)
+def _crossover(ctx, case):
+    """ΔG_eff = 0 crossover from the shared 10 K ΔG° grid (K)."""
+    def as_array(value):
+        return np.array([np.nan if value is None else float(value)])
+    args = (case['material'], case['E_V_m'], case['r_m'])
+    return (as_array(ctx.reference.calc_crossover_temperature(*args)),
+            as_array(ctx.tables_engine.calc_crossover_temperature(*args)))
+
+
+@fast_path('adaptive_sampling', atol=SAMPLING_TOLERANCE * (1 + 1e-6), rtol=0.0)
+def _adaptive_sampling(ctx, case):
+    """ΔG_eff interpolated linearly between adaptively sampled temperatures."""
+    T = case['T_K']
+    T_s = ctx.reference.sample_temperatures(case['material'], T[0], T[-1])
+    # Constant-fallback materials evaluate to a scalar
+    sampled = np.broadcast_to(ctx.off_equilibrium_DG(case, T_s), T_s.shape)
+    return ctx.off_equilibrium_DG(case), np.interp(T, T_s, sampled)
+
+
+@fast_path('gas_ratio_sampling', atol=GAS_RATIO_SAMPLING_TOLERANCE * (1 + 1e-6), rtol=0.0)
+def _gas_ratio_sampling(ctx, case):
+    """Gas ratio scale interpolated between adaptively sampled temperatures."""
+    from curve_sampling import adaptive_grid
+    engine, gas, T = ctx.reference, case['gas'], case['T_K']
+
+    def ratio(points):
+        return engine.calc_comprehensive_gas_ratios(points, ctx.off_equilibrium_DG(case, points))[gas]
+
+    T_s = adaptive_grid(ratio, T[0], T[-1], tol=GAS_RATIO_SAMPLING_TOLERANCE,
+                        breakpoints=engine.get_DG_breakpoints(case['material']))
+    return ratio(T), np.interp(T, T_s, ratio(T_s))
+
+
+@fast_path('high_volume_decimation', atol=0.0, rtol=HIGH_VOLUME_DECIMATION_RTOL, relative_to='max')
+def _decimation(ctx, case):
+    """ΔG_eff min/max decimated to the high-volume point budget, interpolated back."""
+    from curve_sampling import decimate_indices
+    T = case['T_K']
+    reference = ctx.off_equilibrium_DG(case)
+    curve = np.broadcast_to(np.asarray(reference, dtype=float), T.shape)
+    keep = decimate_indices(T, [curve], HIGH_VOLUME_MAX_POINTS)
+    assert len(keep) <= HIGH_VOLUME_MAX_POINTS
+    return curve, np.interp(T, T[keep], curve[keep])
+
+
+@fast_path('payload_compaction', atol=0.0, rtol=PAYLOAD_FLOAT_RTOL * (1 + 1e-6), relative_to='max')
+def _payload(ctx, case):
+    """ΔG_eff after the typed-array encoding of figure payloads."""
+    from figure_payload import encode_array, decode_typed_array
+    reference = ctx.off_equilibrium_DG(case)
+    return reference, decode_typed_array(encode_array(reference)).astype(np.float64)
+
+
+def compare(reference, fast, atol: float, rtol: float, relative_to: str = 'value') -> Dict:
+    """
+    Tolerance-aware comparison of two arrays.
+
+    NaN must appear at the same points in both (unknown materials, missing
+    crossovers); other points must satisfy |fast - reference| <= atol + rtol * scale.
+
+    Returns:
+        Dict with points, failures, max_abs and max_rel (relative to |reference|)
+    """
+    reference = np.broadcast_to(np.asarray(reference, dtype=float), np.shape(fast))
+    fast = np.asarray(fast, dtype=float)
+    ref_nan, fast_nan = np.isnan(reference), np.isnan(fast)
+    both = ~ref_nan & ~fast_nan
+    error = np.abs(fast[both] - reference[both])
+    magnitude = np.abs(reference[both])
+    if relative_to == 'max':
+        scale = magnitude.max() if magnitude.size else 0.0
+    else:
+        scale = magnitude
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative = np.where(magnitude > 0, error / magnitude, np.where(error > 0, np.inf, 0.0))
+    failures = int(np.count_nonzero(error > atol + rtol * scale)) + int(np.count_nonzero(ref_nan != fast_nan))
+    return {
+        'points': int(reference.size),
+        'failures': failures,
+        'max_abs': float(error.max()) if error.size else 0.0,
+        'max_rel': float(relative.max()) if relative.size else 0.0
+    }
+
+
+def run_checks(n_cases: int = GOLDEN_CASES, seed: int = GOLDEN_SEED, pattern: Optional[str] = None,
+               data_loader=None) -> Dict[str, Dict]:
+    """
+    Evaluate every (matching) fast path against the reference.
+
+    Args:
+        n_cases: Number of randomized cases
+        seed: Random seed
+        pattern: Only check fast paths whose name contains this
+        data_loader: Loaded JANAFDataLoader to reuse (loaded from disk if None)
+
+    Returns:
+        Fast path name -> summary (cases, points, failures, max_abs, max_rel,
+        worst case, tolerances)
+    """
+    ctx = _Context(data_loader)
+    try:
+        materials = ctx.loader.get_compound_index()['names']
+        cases = generate_cases(materials, list(ctx.reference.get_gas_ratio_metadata()), n_cases, seed)
+        results = {}
+        for name, spec in _FAST_PATHS.items():
+            if pattern and pattern not in name:
+                continue
+            summary = {'cases': 0, 'points': 0, 'failures': 0, 'max_abs': 0.0, 'max_rel': 0.0, 'worst': None,
+                       'atol': spec['atol'], 'rtol': spec['rtol'], 'description': spec['description']}
+            worst_key = None
+            for case in cases:
+                outcome = compare(*spec['check'](ctx, case), spec['atol'], spec['rtol'], spec['relative_to'])
+                summary['cases'] += 1
+                summary['points'] += outcome['points']
+                summary['failures'] += outcome['failures']
+                summary['max_abs'] = max(summary['max_abs'], outcome['max_abs'])
+                summary['max_rel'] = max(summary['max_rel'], outcome['max_rel'])
+                # Worst case: failing cases first, then by absolute error
+                key = (outcome['failures'] > 0, outcome['max_abs'])
+                if worst_key is None or key > worst_key:
+                    worst_key = key
+                    summary['worst'] = {'material': case['material'],
+                                        'T_range_K': [float(case['T_K'][0]), float(case['T_K'][-1])],
+                                        'E_MV_m': case['E_V_m'] / 1e6, 'r_um': case['r_m'] * 1e6, 'gas': case['gas']}
+            results[name] = summary
+        return results
+    finally:
+        ctx.close()
+
+
+def print_report(results: Dict[str, Dict]) -> List[str]:
+    """
+    Print max absolute / relative error per fast path.
+
+    Returns:
+        Names of fast paths with points outside their tolerance
+    """
+    failed = []
+    print(f"{'fast path':30s} {'points':>8s} {'max abs':>11s} {'max rel':>11s} {'atol':>9s} {'rtol':>9s} {'fails':>6s}")
+    for name, summary in results.items():
+        flag = ''
+        if summary['failures']:
+            failed.append(name)
+            worst = summary['worst'] or {}
+            flag = (f"  ❌ e.g. {worst.get('material')} at E={worst.get('E_MV_m', 0):.2f} MV/m, "
+                    f"r={worst.get('r_um', 0):.2f} µm, {worst.get('gas')}")
+        print(f"{name:30s} {summary['points']:8d} {summary['max_abs']:11.3e} {summary['max_rel']:11.3e} "
+              f"{summary['atol']:9.1e} {summary['rtol']:9.1e} {summary['failures']:6d}{flag}")
+    return failed
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare the fast evaluation paths with ThermodynamicEngine")
+    parser.add_argument('--cases', type=int, default=GOLDEN_CASES, help="Number of randomized cases")
+    parser.add_argument('--seed', type=int, default=GOLDEN_SEED)
+    parser.add_argument('-k', dest='pattern', help="Only check fast paths whose name contains this")
+    args = parser.parse_args()
+
+    failed = print_report(run_checks(args.cases, args.seed, args.pattern))
+    if failed:
+        print(f"\n❌ {len(failed)} fast path(s) outside tolerance: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✅ All fast paths match the reference")
@@ -0,0 +1,46 @@
+"""
+gunicorn configuration for the Ellingham diagram app.
+
+Workers and threads are derived from the CPUs available to the container
+and can be overridden with WEB_CONCURRENCY / GUNICORN_THREADS.
+"""
+
+import os
+
+
+def _available_cpus() -> int:
+    try:
+        # Honours container CPU sets, unlike os.cpu_count()
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+cpus = _available_cpus()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8050')}"
+
+# Data is loaded once in the master and shared with the forked workers
+preload_app = True
+
+# Callbacks are NumPy-heavy but hold the GIL for their Python parts, so use
+# processes for parallelism and a few threads per worker to overlap I/O
+workers = int(os.getenv('WEB_CONCURRENCY', min(2 * cpus + 1, int(os.getenv('MAX_WORKERS', 8)))))
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers occasionally to bound memory growth
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = 200
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+def when_ready(server):
+    server.log.info(f"Serving with {workers} workers x {threads} threads ({cpus} CPUs)")
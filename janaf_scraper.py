@@ -10,33 +10,336 @@ import pandas as pd
 import numpy as np
 import time
 import re
+import os
+import gzip
+import json
+import hashlib
 import pickle
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 import logging
 
+from scrape_progress import ProgressManifest
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# HTTP statuses worth retrying (rate limited / transient server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter shared by all scraper workers"""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum burst size (defaults to max(1, rate))
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until tokens are available; returns the time spent waiting"""
+        if self.rate <= 0:
+            return 0.0
+        
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class CheckpointJournal:
+    """
+    Append-only JSON-lines journal of finished compounds.
+    
+    Each line records one compound page (keyed by its table URL) together with
+    the extracted data, so an interrupted scrape can resume without refetching
+    completed entries. Pages that could not be fetched are not journaled and
+    are retried on the next run.
+    """
+    
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        self._load()
+    
+    def _load(self):
+        if not os.path.exists(self.filename):
+            return
+        
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-write
+                    logger.warning(f"Skipping unreadable journal line in {self.filename}")
+                    continue
+                self.entries[entry['key']] = entry
+        
+        logger.info(f"Resuming from journal {self.filename}: {len(self.entries)} compounds already done")
+    
+    def is_done(self, key: str) -> bool:
+        return key in self.entries
+    
+    def append(self, key: str, element: str, record: Optional[Dict]):
+        """Durably record a finished compound (record is None when the page had no table)"""
+        entry = {
+            'key': key,
+            'element': element,
+            'status': 'ok' if record else 'empty',
+            'record': record
+        }
+        line = json.dumps(entry) + '\n'
+        with self._lock:
+            with open(self.filename, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries[key] = entry
+    
+    def records_for(self, element: str) -> List[Dict]:
+        return [entry['record'] for entry in self.entries.values()
+                if entry['element'] == element and entry['record']]
+
+
+class ResponseCache:
+    """
+    Persistent on-disk HTTP response cache keyed by page.
+    
+    The scraper keys pages by their path relative to its tables root (see
+    JANAFScraper.cache_key), so a cache filled from the live site or from a
+    local --serve-dir server on any port replays for the other.
+    
+    Each page is stored as a gzip-compressed body plus a small JSON metadata
+    file holding the status, content type and validators (ETag /
+    Last-Modified) used for conditional revalidation.
+    
+    Modes:
+        'revalidate': send If-None-Match / If-Modified-Since and reuse the
+                      cached body on 304 (or if the server is unreachable)
+        'offline':    replay cached responses only, never touch the network
+    """
+    
+    MODES = ('revalidate', 'offline')
+    
+    def __init__(self, cache_dir: str = "janaf_http_cache", mode: str = 'revalidate'):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cache mode '{mode}', expected one of {self.MODES}")
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _paths(self, key: str) -> Tuple[str, str]:
+        key = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + '.json', base + '.body.gz'
+    
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return cached metadata (with 'body') for a page key, or None"""
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with gzip.open(body_path, 'rb') as f:
+                meta['body'] = f.read()
+            return meta
+        except (OSError, ValueError):
+            return None
+    
+    def put(self, key: str, response: requests.Response):
+        """Store a 200 response body and its validators"""
+        meta_path, body_path = self._paths(key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        meta = {
+            'url': response.url,
+            'key': key,
+            'status_code': response.status_code,
+            'content_type': response.headers.get('Content-Type'),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time()
+        }
+        # Write to temp files and rename so concurrent readers never see partial entries
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(body_path + suffix, 'wb', compresslevel=6) as f:
+            f.write(response.content)
+        with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(body_path + suffix, body_path)
+        os.replace(meta_path + suffix, meta_path)
+        self._count('stores')
+    
+    def conditional_headers(self, entry: Dict) -> Dict[str, str]:
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    @staticmethod
+    def to_response(entry: Dict) -> requests.Response:
+        """Rebuild a requests.Response from a cache entry"""
+        response = requests.Response()
+        response.status_code = entry.get('status_code', 200)
+        response._content = entry['body']
+        response.url = entry['url']
+        response.encoding = 'utf-8'
+        if entry.get('content_type'):
+            response.headers['Content-Type'] = entry['content_type']
+        if entry.get('etag'):
+            response.headers['ETag'] = entry['etag']
+        if entry.get('last_modified'):
+            response.headers['Last-Modified'] = entry['last_modified']
+        return response
+
+
 class JANAFScraper:
     """Scraper for NIST JANAF Thermochemical Tables"""
     
-    def __init__(self, base_url: str = "https://janaf.nist.gov/tables/"):
+    def __init__(self, base_url: str = "https://janaf.nist.gov/tables/",
+                 requests_per_second: float = 2.0, max_retries: int = 4,
+                 backoff_base: float = 1.0, timeout: float = 10,
+                 cache: Optional[ResponseCache] = None):
+        """
+        Args:
+            base_url: Root of the JANAF tables (point at a local server to run offline)
+            requests_per_second: Token-bucket rate shared by all workers (<= 0 disables)
+            max_retries: Retries per request on connection errors / retryable statuses
+            backoff_base: Base delay in seconds for exponential backoff with jitter
+            timeout: Per-request timeout in seconds
+            cache: Optional on-disk response cache (revalidating or offline replay)
+        """
         self.base_url = base_url
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.session.headers.update({'User-Agent': USER_AGENT})
         self.compounds_data = {}
+        self.rate_limiter = TokenBucket(requests_per_second)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+        self.cache = cache
+        self._local = threading.local()
+    
+    def _get_session(self) -> requests.Session:
+        """Per-thread session (requests.Session is not safe to share across threads)"""
+        if threading.current_thread() is threading.main_thread():
+            return self.session
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.session.headers)
+            self._local.session = session
+        return session
+    
+    def cache_key(self, url: str) -> str:
+        """Response cache key: the path and query below the tables root, independent of host and port"""
+        if url.startswith(self.base_url):
+            return url[len(self.base_url):]
+        parts = urlsplit(url)
+        return parts.path + (f"?{parts.query}" if parts.query else '')
+    
+    def _fetch(self, url: str) -> Optional[requests.Response]:
+        """
+        Rate-limited GET with retries and exponential backoff.
+        
+        With a response cache, cached pages are revalidated conditionally
+        (a 304 reuses the stored body) or, in offline mode, replayed without
+        any network access.
+        
+        Returns:
+            The final response (any status), or None if every attempt failed
+            with a connection error / retryable status
+        """
+        key = self.cache_key(url)
+        entry = self.cache.get(key) if self.cache else None
+        
+        if self.cache and self.cache.mode == 'offline':
+            if entry is None:
+                self.cache._count('misses')
+                logger.warning(f"Offline replay: {url} is not cached")
+                return None
+            self.cache._count('hits')
+            return ResponseCache.to_response(entry)
+        
+        headers = self.cache.conditional_headers(entry) if entry else None
+        session = self._get_session()
+        
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = session.get(url, timeout=self.timeout, headers=headers)
+                if response.status_code == 304 and entry:
+                    self.cache._count('revalidated')
+                    return ResponseCache.to_response(entry)
+                if response.status_code not in RETRY_STATUSES:
+                    if self.cache:
+                        self.cache._count('misses')
+                        if response.status_code == 200:
+                            self.cache.put(key, response)
+                    return response
+                reason = f"HTTP {response.status_code}"
+                retry_after = response.headers.get('Retry-After')
+            except requests.RequestException as e:
+                reason = str(e)
+                retry_after = None
+            
+            if attempt == self.max_retries:
+                if entry:
+                    logger.warning(f"Serving stale cached copy of {url} after {attempt + 1} attempts: {reason}")
+                    self.cache._count('hits')
+                    return ResponseCache.to_response(entry)
+                logger.error(f"Giving up on {url} after {attempt + 1} attempts: {reason}")
+                return None
+            
+            delay = self.backoff_base * (2 ** attempt) * (0.5 + random.random())
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            logger.warning(f"Retrying {url} in {delay:.1f}s ({reason})")
+            time.sleep(delay)
+        
+        return None
         
     def get_element_compounds(self, element: str) -> List[Dict]:
         """Get list of compounds for a given element"""
         try:
             url = f"{self.base_url}{element}-index.html"
-            response = self.session.get(url, timeout=10)
+            response = self._fetch(url)
             
-            if response.status_code != 200:
-                logger.warning(f"Could not access {element} index: {response.status_code}")
+            if response is None or response.status_code != 200:
+                status = response.status_code if response is not None else 'no response'
+                logger.warning(f"Could not access {element} index: {status}")
                 return []
                 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -87,15 +390,25 @@ class JANAFScraper:
         """Extract thermodynamic data for a specific compound"""
         try:
             url = f"{self.base_url}{compound_info['url']}"
-            print(f"Extracting data for {compound_info['name']} from {url}")
+            logger.debug(f"Extracting data for {compound_info['name']} from {url}")
             
-            response = self.session.get(url, timeout=10)
+            response = self._fetch(url)
             
-            if response.status_code != 200:
-                logger.warning(f"Could not access {compound_info['url']}: {response.status_code}")
+            if response is None or response.status_code != 200:
+                status = response.status_code if response is not None else 'no response'
+                logger.warning(f"Could not access {compound_info['url']}: {status}")
                 return None
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
+            
+            return self._parse_compound_page(compound_info, response.content)
+            
+        except Exception as e:
+            logger.error(f"Error extracting data for {compound_info['name']}: {e}")
+            return None
+    
+    def _parse_compound_page(self, compound_info: Dict, content: bytes) -> Optional[Dict]:
+        """Extract the thermodynamic table from a compound page"""
+        try:
+            soup = BeautifulSoup(content, 'html.parser')
             
             # Look for thermodynamic data table
             tables = soup.find_all('table')
@@ -106,7 +419,7 @@ class JANAFScraper:
                 if headers:
                     header_text = ' '.join([h.get_text().strip() for h in headers])
                     if any(keyword in header_text.lower() for keyword in ['t(k)', 'cp°', 's°', 'g°', 'h°', 'fh°', 'fg°']):
-                        print(f"Found thermodynamic table for {compound_info['name']}")
+                        logger.debug(f"Found thermodynamic table for {compound_info['name']}")
                         
                         # Extract data rows
                         rows = table.find_all('tr')[1:]  # Skip header row
@@ -131,18 +444,18 @@ class JANAFScraper:
                                     data.append(row_data)
                         
                         if data:
-                            print(f"Extracted {len(data)} data points for {compound_info['name']}")
+                            logger.debug(f"Extracted {len(data)} data points for {compound_info['name']}")
                             return {
                                 'compound': compound_info,
                                 'data': data,
                                 'headers': [h.get_text().strip() for h in headers]
                             }
             
-            print(f"No thermodynamic data found for {compound_info['name']}")
+            logger.warning(f"No thermodynamic data found for {compound_info['name']}")
             return None
             
         except Exception as e:
-            print(f"Error extracting data for {compound_info['name']}: {e}")
+            logger.error(f"Error parsing data for {compound_info['name']}: {e}")
             return None
     
     def _parse_thermodynamic_data(self, data_lines: List[str]) -> List[Dict]:
@@ -172,12 +485,27 @@ class JANAFScraper:
                     
         return parsed_data
     
-    def scrape_all_compounds(self, elements: List[str] = None) -> Dict:
-        """Scrape thermodynamic data for all compounds"""
+    def scrape_all_compounds(self, elements: List[str] = None, max_workers: int = 1,
+                             journal_file: Optional[str] = None,
+                             progress_file: Optional[str] = None) -> Dict:
+        """
+        Scrape thermodynamic data for all compounds
+        
+        Args:
+            elements: Element symbols to scrape (defaults to the core set)
+            max_workers: Number of concurrent fetch workers; > 1 enables concurrent mode
+            journal_file: Optional checkpoint journal; finished compounds are appended
+                as they complete and skipped when the scrape is restarted
+            progress_file: Optional append-only progress manifest (see scrape_progress)
+        """
         if elements is None:
             elements = ['Ti', 'C', 'N', 'Al', 'Si', 'Zr', 'Nb', 'Ta', 'Mo', 'W', 'V', 'Hf']
         
+        if max_workers > 1 or journal_file:
+            return self.scrape_all_compounds_concurrent(elements, max_workers, journal_file, progress_file)
+        
         logger.info(f"Starting scrape for elements: {elements}")
+        progress = ProgressManifest(progress_file, elements) if progress_file else None
         
         all_compounds = {}
         successful_elements = 0
@@ -193,31 +521,173 @@ class JANAFScraper:
                 if not compounds:
                     logger.warning(f"No compounds found for {element}")
                     failed_elements.append(element)
+                    if progress:
+                        progress.element_done(element, failed=True)
                     continue
                 
+                if progress:
+                    progress.add_total(element, len(compounds))
+                
                 element_data = []
                 for j, compound in enumerate(compounds, 1):
                     logger.info(f"  Extracting data for {j}/{len(compounds)}: {compound['name']}")
                     
-                    compound_data = self.extract_compound_data(compound)
-                    if compound_data and compound_data.get('data'):
+                    # Requests are paced by the shared token bucket
+                    status, compound_data = self._scrape_compound(compound)
+                    if compound_data:
                         element_data.append(compound_data)
-                    
-                    # Be respectful to the server
-                    time.sleep(0.5)
+                    if progress:
+                        progress.compound_done(element, status)
                 
                 all_compounds[element] = element_data
                 successful_elements += 1
+                if progress:
+                    progress.element_done(element)
                 logger.info(f"Completed {element}: {len(element_data)} compounds with data")
                 
             except Exception as e:
                 logger.error(f"Error processing element {element}: {e}")
                 failed_elements.append(element)
+                if progress:
+                    progress.element_done(element, failed=True)
                 continue
         
         logger.info(f"Scraping complete: {successful_elements}/{len(elements)} elements successful")
         if failed_elements:
             logger.warning(f"Failed elements: {failed_elements}")
+        if progress:
+            progress.finish()
+        
+        return all_compounds
+    
+    def _scrape_compound(self, compound_info: Dict) -> Tuple[str, Optional[Dict]]:
+        """
+        Fetch and parse one compound page for the concurrent scraper.
+        
+        Returns:
+            (status, record) where status is 'ok', 'empty' (page has no usable
+            table) or 'failed' (page could not be fetched; not journaled)
+        """
+        url = f"{self.base_url}{compound_info['url']}"
+        response = self._fetch(url)
+        if response is None or response.status_code != 200:
+            return 'failed', None
+        
+        record = self._parse_compound_page(compound_info, response.content)
+        if record and record.get('data'):
+            return 'ok', record
+        return 'empty', None
+    
+    def scrape_all_compounds_concurrent(self, elements: List[str], max_workers: int = 8,
+                                        journal_file: Optional[str] = "janaf_scrape_journal.jsonl",
+                                        progress_file: Optional[str] = None) -> Dict:
+        """
+        Scrape compounds with a bounded worker pool.
+        
+        All workers share the token-bucket rate limiter, failed requests are
+        retried with backoff, and every finished compound is appended to the
+        checkpoint journal so a restart only fetches what is still missing.
+        
+        Args:
+            elements: Element symbols to scrape
+            max_workers: Size of the worker pool
+            journal_file: Checkpoint journal path (None disables checkpointing)
+            progress_file: Optional append-only progress manifest (see scrape_progress)
+        
+        Returns:
+            Dictionary of element -> list of compound records (index-page order)
+        """
+        journal = CheckpointJournal(journal_file) if journal_file else None
+        progress = ProgressManifest(progress_file, elements) if progress_file else None
+        logger.info(f"Starting concurrent scrape ({max_workers} workers, "
+                    f"{self.rate_limiter.rate:g} req/s) for elements: {elements}")
+        
+        # Index pages first so the compound work queue can be built up front
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            indexes = dict(zip(elements, pool.map(self.get_element_compounds, elements)))
+        
+        failed_elements = [element for element, compounds in indexes.items() if not compounds]
+        for element in failed_elements:
+            logger.warning(f"No compounds found for {element}")
+            if progress:
+                progress.element_done(element, failed=True)
+        
+        pending = []
+        remaining = {}
+        for element, compounds in indexes.items():
+            if progress and compounds:
+                progress.add_total(element, len(compounds))
+            for compound in compounds:
+                if journal and journal.is_done(compound['url']):
+                    if progress:
+                        progress.compound_done(element, 'skipped')
+                    continue
+                pending.append(compound)
+                remaining[element] = remaining.get(element, 0) + 1
+        
+        if progress:
+            for element, compounds in indexes.items():
+                if compounds and not remaining.get(element):
+                    progress.element_done(element)
+        
+        total = sum(len(compounds) for compounds in indexes.values())
+        logger.info(f"{total} compounds listed, {total - len(pending)} already journaled, "
+                    f"{len(pending)} to fetch")
+        
+        results: Dict[str, Dict] = {}
+        failed_urls = []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self._scrape_compound, compound): compound for compound in pending}
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                compound = futures[future]
+                try:
+                    status, record = future.result()
+                except Exception as e:
+                    logger.error(f"Error extracting {compound['name']}: {e}")
+                    status, record = 'failed', None
+                
+                if status == 'failed':
+                    failed_urls.append(compound['url'])
+                else:
+                    results[compound['url']] = record
+                    if journal:
+                        journal.append(compound['url'], compound['element'], record)
+                
+                logger.info(f"  [{done}/{len(pending)}] {compound['element']} {compound['name']}: {status}")
+                
+                if progress:
+                    progress.compound_done(compound['element'], status)
+                    remaining[compound['element']] -= 1
+                    if remaining[compound['element']] == 0:
+                        progress.element_done(compound['element'])
+        
+        # Reassemble per element in index order, merging journaled results
+        all_compounds = {}
+        for element, compounds in indexes.items():
+            if not compounds:
+                continue
+            element_data = []
+            for compound in compounds:
+                if compound['url'] in results:
+                    record = results[compound['url']]
+                elif journal and journal.is_done(compound['url']):
+                    record = journal.entries[compound['url']]['record']
+                else:
+                    record = None
+                if record:
+                    element_data.append(record)
+            all_compounds[element] = element_data
+            logger.info(f"Completed {element}: {len(element_data)} compounds with data")
+        
+        logger.info(f"Scraping complete: {len(all_compounds)}/{len(elements)} elements successful")
+        if failed_elements:
+            logger.warning(f"Failed elements: {failed_elements}")
+        if failed_urls:
+            logger.warning(f"{len(failed_urls)} compound pages failed and will be retried on the next run")
+        if progress:
+            progress.finish()
         
         return all_compounds
     
@@ -241,9 +711,40 @@ class JANAFScraper:
             logger.error(f"Error loading data: {e}")
             return {}
 
+def serve_saved_pages(directory: str, port: int = 0):
+    """
+    Serve a directory of saved JANAF pages over HTTP for offline scraping.
+    
+    The directory should mirror the site layout below /tables/
+    (e.g. Ti-index.html, O-064.html). The server runs in a daemon thread.
+    
+    Args:
+        directory: Directory containing the saved pages
+        port: Port to bind on localhost (0 picks a free port)
+    
+    Returns:
+        Tuple of (server, base_url); call server.shutdown() when done
+    """
+    from functools import partial
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+    
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+    
+    handler = partial(QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    logger.info(f"Serving saved JANAF pages from {directory} at {base_url}")
+    return server, base_url
+
+
 def main():
     """Main function to run the scraper"""
-    scraper = JANAFScraper()
+    import argparse
     
     # All available elements in JANAF database
     all_elements = [
@@ -253,13 +754,49 @@ def main():
         'Co', 'Mn'
     ]
     
+    parser = argparse.ArgumentParser(description="Scrape the NIST JANAF Thermochemical Tables")
+    parser.add_argument('--elements', nargs='+', default=all_elements, help="Element symbols to scrape")
+    parser.add_argument('--workers', type=int, default=1, help="Concurrent fetch workers (1 = serial)")
+    parser.add_argument('--rate', type=float, default=2.0, help="Requests per second across all workers")
+    parser.add_argument('--retries', type=int, default=4, help="Retries per request")
+    parser.add_argument('--journal', default=None, help="Checkpoint journal (JSON lines) for resumable scrapes")
+    parser.add_argument('--base-url', default="https://janaf.nist.gov/tables/", help="Tables root URL")
+    parser.add_argument('--serve-dir', default=None, help="Serve saved pages from this directory and scrape them offline")
+    parser.add_argument('--cache-dir', default=None, help="On-disk HTTP response cache directory")
+    parser.add_argument('--offline', action='store_true', help="Replay responses from --cache-dir without network access")
+    parser.add_argument('--progress', default="janaf_scrape_progress.jsonl", help="Progress manifest read by monitor_scraper.py")
+    parser.add_argument('--output', default="janaf_full_database.pkl", help="Output pickle file")
+    args = parser.parse_args()
+    
+    server = None
+    base_url = args.base_url
+    if args.serve_dir:
+        server, base_url = serve_saved_pages(args.serve_dir)
+    
+    cache = None
+    if args.cache_dir or args.offline:
+        cache = ResponseCache(args.cache_dir or "janaf_http_cache",
+                              mode='offline' if args.offline else 'revalidate')
+    
+    scraper = JANAFScraper(base_url=base_url, requests_per_second=args.rate,
+                           max_retries=args.retries, cache=cache)
+    all_elements = args.elements
+    
     logger.info("Starting FULL JANAF data extraction...")
     logger.info(f"Processing {len(all_elements)} elements: {all_elements}")
     
-    data = scraper.scrape_all_compounds(all_elements)
+    try:
+        data = scraper.scrape_all_compounds(all_elements, max_workers=args.workers,
+                                            journal_file=args.journal, progress_file=args.progress)
+    finally:
+        if server:
+            server.shutdown()
     
     # Save the data
-    scraper.save_data(data, "janaf_full_database.pkl")
+    scraper.save_data(data, args.output)
+    
+    if cache:
+        logger.info(f"HTTP cache ({cache.mode}): {cache.stats}")
     
     # Print summary
     total_compounds = sum(len(compounds) for compounds in data.values())
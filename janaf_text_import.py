@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+JANAF Text Table Importer
+Bulk-imports the tab-delimited JANAF text tables (e.g. Ti-001.txt) from a
+directory or tarball into the same database format produced by the scraper,
+without any HTML parsing.
+"""
+
+import os
+import re
+import pickle
+import tarfile
+import time
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from compound_index import parse_formula
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TEXT_EXTENSIONS = ('.txt',)
+
+# Batches submitted per worker before waiting for the oldest one; bounds how
+# much of a tarball is read into memory ahead of the parsers
+IN_FLIGHT_PER_WORKER = 2
+
+# Column names used by the HTML tables, so the preprocessors see identical headers
+JANAF_COLUMNS = ['T/K', 'Cp°', 'S°', '-[G°-H°(Tr)]/T', 'H-H°(Tr)', 'fH°', 'fG°', 'log Kf']
+
+_STATE_SUFFIX = re.compile(r'\(([^)]*)\)\s*$')
+_UNIT_COUNT = re.compile(r'(?<=[A-Za-z])1(?![\d.])')
+
+
+def _normalize_formula(formula: str) -> Tuple[str, str]:
+    """Split 'O2Ti1(cr)' into ('O2Ti', 'cr') to match the HTML index formulas"""
+    formula = formula.strip()
+    state = ''
+    match = _STATE_SUFFIX.search(formula)
+    if match:
+        state = match.group(1)
+        formula = formula[:match.start()]
+    return _UNIT_COUNT.sub('', formula), state
+
+
+def _parse_value(text: str):
+    """Same cell conversion as the HTML scraper: float, None for blanks, else the raw string"""
+    text = text.strip()
+    if not text or text == '-':
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def parse_janaf_text(text: str, source: str = '') -> Optional[Dict]:
+    """
+    Parse one JANAF tab-delimited table.
+
+    The first line holds the compound name and formula/state, the second the
+    column headers, and every following line one temperature row.
+
+    Args:
+        text: File contents
+        source: File name, stored as the compound 'url' for traceability
+
+    Returns:
+        Record with 'compound', 'data' (header row first) and 'headers', or
+        None if the file has no usable rows
+    """
+    lines = text.splitlines()
+    if len(lines) < 3:
+        return None
+
+    title = lines[0].split('\t')
+    name = re.sub(r'\s*\([^)]*\)\s*$', '', title[0]).strip()
+    formula, state = _normalize_formula(title[-1] if len(title) > 1 else '')
+    if not formula:
+        return None
+
+    data = [list(JANAF_COLUMNS)]
+    for line in lines[2:]:
+        cells = line.rstrip('\n').split('\t')
+        if len(cells) < 7:
+            continue
+        data.append([_parse_value(cell) for cell in cells])
+
+    if len(data) < 2:
+        return None
+
+    return {
+        'compound': {
+            'cas_number': '',
+            'formula': formula,
+            'name': name,
+            'state': state,
+            'url': os.path.basename(source),
+            'element': None
+        },
+        'data': data,
+        'headers': list(JANAF_COLUMNS)
+    }
+
+
+def _parse_file(path: str) -> Optional[Dict]:
+    """Worker: read and parse a table file from disk"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return parse_janaf_text(f.read(), path)
+    except OSError as e:
+        logger.warning(f"Could not read {path}: {e}")
+        return None
+
+
+def _parse_member(item: Tuple[str, bytes]) -> Optional[Dict]:
+    """Worker: parse a table already read from a tarball"""
+    name, payload = item
+    return parse_janaf_text(payload.decode('utf-8', errors='replace'), name)
+
+
+def _parse_batch(worker: Callable, batch: List) -> List[Optional[Dict]]:
+    """Worker: parse one batch of files or tarball members"""
+    return [worker(item) for item in batch]
+
+
+def _batches(items: Iterator, size: int) -> Iterator[List]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _parse_streaming(pool: ProcessPoolExecutor, worker: Callable, items: Iterator, chunksize: int,
+                     in_flight: int) -> Iterator[Optional[Dict]]:
+    """
+    Parse items in batches with at most in_flight batches submitted at once.
+
+    Unlike pool.map, which consumes the whole input up front, the next batch
+    is only read once the oldest one has been collected. Results keep the
+    input order.
+    """
+    window = deque()
+    for batch in _batches(items, chunksize):
+        window.append(pool.submit(_parse_batch, worker, batch))
+        if len(window) >= in_flight:
+            yield from window.popleft().result()
+    while window:
+        yield from window.popleft().result()
+
+
+def _iter_directory(directory: str) -> Iterator[str]:
+    for root, _, files in os.walk(directory):
+        for filename in sorted(files):
+            if filename.lower().endswith(TEXT_EXTENSIONS):
+                yield os.path.join(root, filename)
+
+
+def _iter_tarball(path: str) -> Iterator[Tuple[str, bytes]]:
+    # Stream mode: members are read once, in archive order
+    with tarfile.open(path, 'r|*') as archive:
+        for member in archive:
+            if member.isfile() and member.name.lower().endswith(TEXT_EXTENSIONS):
+                handle = archive.extractfile(member)
+                if handle is not None:
+                    yield member.name, handle.read()
+
+
+def import_text_tables(source: str, elements: Optional[List[str]] = None,
+                       max_workers: Optional[int] = None, chunksize: int = 16) -> Dict[str, List[Dict]]:
+    """
+    Import a directory or tarball of JANAF text tables in one parallel pass.
+    
+    Tables are read and parsed in a bounded window of batches, so a tarball
+    is streamed rather than read into memory as a whole.
+
+    Like the element index pages on the JANAF site, each compound is listed
+    under every element in its formula.
+
+    Args:
+        source: Directory of .txt tables or a (compressed) tarball of them
+        elements: Optional element symbols to keep (defaults to all)
+        max_workers: Parser processes (defaults to the CPU count)
+        chunksize: Files handed to a worker at a time
+
+    Returns:
+        Dictionary of element -> list of compound records (scraper format)
+    """
+    start = time.time()
+
+    if os.path.isdir(source):
+        items, worker = _iter_directory(source), _parse_file
+    elif tarfile.is_tarfile(source):
+        items, worker = _iter_tarball(source), _parse_member
+    else:
+        raise ValueError(f"{source} is neither a directory nor a tarball")
+
+    wanted = set(elements) if elements else None
+    database: Dict[str, List[Dict]] = {element: [] for element in elements} if elements else {}
+    parsed = skipped = 0
+
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for record in _parse_streaming(pool, worker, items, chunksize, workers * IN_FLIGHT_PER_WORKER):
+            if record is None:
+                skipped += 1
+                continue
+            parsed += 1
+
+            for symbol in parse_formula(record['compound']['formula']):
+                if wanted is not None and symbol not in wanted:
+                    continue
+                compound = dict(record['compound'], element=symbol)
+                database.setdefault(symbol, []).append(dict(record, compound=compound))
+
+    total = sum(len(compounds) for compounds in database.values())
+    logger.info(f"Imported {parsed} tables ({skipped} skipped) into {len(database)} elements, "
+                f"{total} element entries in {time.time() - start:.2f}s")
+    return database
+
+
+def main():
+    """Import text tables and save them in the scraper's database format"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Import JANAF tab-delimited text tables")
+    parser.add_argument('source', help="Directory or tarball of JANAF .txt tables")
+    parser.add_argument('--elements', nargs='+', default=None, help="Element symbols to keep (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument('--output', default="janaf_full_database.pkl", help="Output pickle file")
+    args = parser.parse_args()
+
+    data = import_text_tables(args.source, args.elements, args.workers)
+
+    with open(args.output, 'wb') as f:
+        pickle.dump(data, f)
+    logger.info(f"Data saved to {args.output}")
+
+    for element, compounds in sorted(data.items()):
+        logger.info(f"{element}: {len(compounds)} compounds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,573 @@
+"""
+Concurrent-user load test for the Dash app.
+
+Simulates browser sessions the way the Dash renderer drives the server: each
+virtual user loads the page (/, /_dash-layout, /_dash-dependencies), fires
+the initial callbacks, then performs a random mix of actions with think time
+in between:
+
+- pick:   type a search prefix (sometimes) and pick a new set of materials
+- drag:   move a slider (every intermediate value if the slider updates on drag)
+- tab:    switch the material category tab
+- export: click "Export Data"
+
+Every property change fires the server-side callbacks that take it as an
+input, and callback outputs fire their dependents in turn, so the request
+sequence matches what a browser would send (clientside callbacks run in the
+browser and are skipped). The report gives per-callback p50/p95/p99 latency,
+throughput and error rate.
+
+By default the app runs in-process (fully offline): each virtual user drives
+app.server through its own Flask test client in a thread, which approximates
+one gthread worker with as many threads as users, and signs in with the
+app's own configured credentials. Pass --url to load a running server (e.g.
+gunicorn with the production config) instead, with --auth or LOAD_TEST_AUTH
+set to one of its users.
+
+    python load_test.py --users 20 --duration 60
+    python load_test.py --users 50 --think 0.5 --mix pick=1,drag=6,tab=1,export=1
+    python load_test.py --url http://localhost:8050 --auth user:password --users 40 --json results.json
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import random
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 'user:password' for basic auth against --url (the in-process app uses its own credentials)
+LOAD_TEST_AUTH = os.getenv('LOAD_TEST_AUTH', '')
+
+# Relative frequency of each user action
+DEFAULT_MIX = {'pick': 3, 'drag': 4, 'tab': 2, 'export': 1}
+
+# Sliders users drag, and the pause between intermediate values while dragging
+DRAG_SLIDERS = ('field-slider', 'temp-range-slider', 'entry-temp-slider')
+DRAG_STEP_SECONDS = 0.05
+
+# Follow callback outputs into dependent callbacks this many levels deep
+MAX_CHAIN_DEPTH = 4
+
+SESSION_ACTIONS = 20  # Actions per session before the user reloads the page
+REQUEST_TIMEOUT = 60.0
+
+
+# ----------------------------------------------------------------------
+# Transports
+
+
+def _basic_auth(auth: str) -> str:
+    return 'Basic ' + base64.b64encode(auth.encode('utf-8')).decode('ascii')
+
+
+class InProcessTransport:
+    """Requests against app.server through one Flask test client per thread."""
+
+    def __init__(self, headers: Dict[str, str]):
+        import app
+        self.app = app
+        self.headers = dict(headers)
+        if app.AUTH_AVAILABLE and 'Authorization' not in self.headers:
+            # Sign in as any configured user
+            self.headers['Authorization'] = _basic_auth(':'.join(next(iter(app.USERNAME_PASSWORD_PAIRS.items()))))
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, payload=None) -> Tuple[int, bytes]:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.app.server.test_client()
+        response = client.open(path, method=method, json=payload, headers=self.headers)
+        return response.status_code, response.get_data()
+
+    def callback_names(self) -> Dict[str, str]:
+        """Output spec -> callback function name."""
+        names = {}
+        for output, spec in self.app.app.callback_map.items():
+            func = spec.get('callback')
+            if func is not None:
+                names[output] = getattr(func, '__name__', output)
+        return names
+
+
+class HttpTransport:
+    """Requests against a running server."""
+
+    def __init__(self, base_url: str, headers: Dict[str, str]):
+        self.base_url = base_url.rstrip('/')
+        self.headers = headers
+
+    def request(self, method: str, path: str, payload=None) -> Tuple[int, bytes]:
+        from urllib.request import Request, urlopen
+        from urllib.error import HTTPError
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = dict(self.headers, **({'Content-Type': 'application/json'} if data is not None else {}))
+        request = Request(self.base_url + path, data=data, headers=headers, method=method)
+        try:
+            with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+                return response.status, response.read()
+        except HTTPError as e:
+            return e.code, e.read()
+
+    def callback_names(self) -> Dict[str, str]:
+        return {}
+
+
+# ----------------------------------------------------------------------
+# Results
+
+
+class Results:
+    """Latencies and errors per request label (thread-safe)."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Counter = Counter()
+        self.statuses: Dict[str, Counter] = {}
+        self.samples: Dict[str, str] = {}
+        self.actions: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, label: str, seconds: float, status: int, detail: Optional[str] = None):
+        with self._lock:
+            self.latencies.setdefault(label, []).append(seconds)
+            self.statuses.setdefault(label, Counter())[status] += 1
+            if status >= 400 or status == 0:
+                self.errors[label] += 1
+                if detail and label not in self.samples:
+                    self.samples[label] = detail[:300]
+
+    def action(self, name: str):
+        with self._lock:
+            self.actions[name] += 1
+
+    def summary(self, elapsed: float) -> Dict:
+        rows = {}
+        for label, values in sorted(self.latencies.items()):
+            latencies = np.array(values) * 1000.0
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            rows[label] = {
+                'requests': len(values),
+                'errors': self.errors[label],
+                'error_rate': self.errors[label] / len(values),
+                'throughput_rps': len(values) / elapsed,
+                'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99),
+                'max_ms': float(latencies.max()),
+                'statuses': dict(self.statuses[label])
+            }
+        total = sum(row['requests'] for row in rows.values())
+        errors = sum(row['errors'] for row in rows.values())
+        all_ms = np.concatenate([np.array(v) for v in self.latencies.values()]) * 1000.0 if total else np.zeros(1)
+        return {
+            'elapsed_s': elapsed,
+            'requests': total,
+            'errors': errors,
+            'error_rate': errors / total if total else 0.0,
+            'throughput_rps': total / elapsed if elapsed else 0.0,
+            'p50_ms': float(np.percentile(all_ms, 50)),
+            'p95_ms': float(np.percentile(all_ms, 95)),
+            'p99_ms': float(np.percentile(all_ms, 99)),
+            'actions': dict(self.actions),
+            'callbacks': rows,
+            'error_samples': dict(self.samples)
+        }
+
+
+# ----------------------------------------------------------------------
+# Layout and callback graph
+
+
+def _key(component_id, prop: str) -> str:
+    prop = prop.split('@', 1)[0]  # allow_duplicate outputs carry an '@<hash>' suffix
+    return f"{component_id}.{prop}"
+
+
+def _parse_outputs(output: str) -> List[Dict[str, str]]:
+    """Split a Dash output spec ('a.b' or '..a.b...c.d..') into id/property pairs."""
+    specs = output[2:-2].split('...') if output.startswith('..') else [output]
+    outputs = []
+    for spec in specs:
+        component_id, prop = spec.rsplit('.', 1)
+        outputs.append({'id': component_id, 'property': prop})
+    return outputs
+
+
+def _walk(node, visit):
+    """Visit every component in a serialized layout."""
+    if isinstance(node, list):
+        for item in node:
+            _walk(item, visit)
+    elif isinstance(node, dict):
+        if 'props' in node and 'type' in node:
+            visit(node)
+            for value in node['props'].values():
+                _walk(value, visit)
+        else:
+            for value in node.values():
+                _walk(value, visit)
+
+
+class AppModel:
+    """Initial property values and the server-side callback graph of the app."""
+
+    def __init__(self, layout: Dict, dependencies: List[Dict], names: Dict[str, str]):
+        self.initial: Dict[str, object] = {}
+        self.components: Dict[str, Dict] = {}
+        self.tabs: Dict[str, List[str]] = {}
+
+        def visit(component):
+            props = component['props']
+            component_id = props.get('id')
+            if isinstance(component_id, str):
+                self.components[component_id] = component
+                for prop, value in props.items():
+                    if prop not in ('id', 'children'):
+                        self.initial[_key(component_id, prop)] = value
+                if component['type'] == 'Tabs':
+                    tab_ids = []
+                    _walk(props.get('children'), lambda c: tab_ids.append(c['props'].get('tab_id'))
+                          if c['type'] == 'Tab' and c['props'].get('tab_id') else None)
+                    self.tabs[component_id] = tab_ids
+
+        _walk(layout, visit)
+
+        self.callbacks = []
+        self.triggers: Dict[str, List[Dict]] = {}
+        for dependency in dependencies:
+            if dependency.get('clientside_function'):
+                continue
+            output = dependency['output']
+            outputs = _parse_outputs(output)
+            label = names.get(output) or ' + '.join(_key(o['id'], o['property']) for o in outputs)
+            callback = {'output': output, 'outputs': outputs, 'label': label,
+                        'inputs': dependency['inputs'], 'state': dependency.get('state', []),
+                        'prevent_initial_call': dependency.get('prevent_initial_call', False)}
+            self.callbacks.append(callback)
+            for item in callback['inputs']:
+                self.triggers.setdefault(_key(item['id'], item['property']), []).append(callback)
+
+    def slider(self, component_id: str) -> Optional[Dict]:
+        component = self.components.get(component_id)
+        return component['props'] if component else None
+
+
+def check_access(transport):
+    """
+    Fetch the layout once before the users start.
+
+    Raises:
+        RuntimeError: If the server refuses the request (e.g. missing credentials)
+    """
+    status, _ = transport.request('GET', '/_dash-layout')
+    if status != 200:
+        hint = " (pass --auth or set LOAD_TEST_AUTH)" if status in (401, 403) else ""
+        raise RuntimeError(f"GET /_dash-layout returned {status}{hint}")
+
+
+# ----------------------------------------------------------------------
+# Virtual users
+
+
+class VirtualUser:
+    """One simulated browser session loop."""
+
+    def __init__(self, transport, results: Results, rng: random.Random, think: float,
+                 mix: Dict[str, float], session_actions: int = SESSION_ACTIONS):
+        self.transport = transport
+        self.results = results
+        self.rng = rng
+        self.think = think
+        self.mix = mix
+        self.session_actions = session_actions
+        self.model: Optional[AppModel] = None
+        self.state: Dict[str, object] = {}
+
+    # -- requests --------------------------------------------------------
+
+    def _request(self, label: str, method: str, path: str, payload=None):
+        start = time.perf_counter()
+        try:
+            status, body = self.transport.request(method, path, payload)
+        except Exception as e:
+            self.results.record(label, time.perf_counter() - start, 0, repr(e))
+            return 0, b''
+        self.results.record(label, time.perf_counter() - start, status,
+                            body.decode('utf-8', 'replace') if status >= 400 else None)
+        return status, body
+
+    def _get_json(self, label: str, path: str):
+        status, body = self._request(label, 'GET', path)
+        if status != 200:
+            raise RuntimeError(f"GET {path} returned {status}")
+        return json.loads(body)
+
+    def load_page(self):
+        """Load the page like a browser and fire the initial callbacks."""
+        self._request('page: /', 'GET', '/')
+        layout = self._get_json('page: _dash-layout', '/_dash-layout')
+        dependencies = self._get_json('page: _dash-dependencies', '/_dash-dependencies')
+        self.model = AppModel(layout, dependencies, self.transport.callback_names())
+        self.state = dict(self.model.initial)
+        initial = [cb for cb in self.model.callbacks if not cb['prevent_initial_call']]
+        self._fire(initial, changed=set(), depth=0)
+
+    def _fire(self, callbacks: List[Dict], changed: set, depth: int):
+        changed_next = set()
+        for callback in callbacks:
+            changed_next |= self._call(callback, changed)
+        if changed_next and depth < MAX_CHAIN_DEPTH:
+            self._fire(self._triggered_by(changed_next), changed_next, depth + 1)
+
+    def _triggered_by(self, changed: set) -> List[Dict]:
+        seen, callbacks = set(), []
+        for key in changed:
+            for callback in self.model.triggers.get(key, []):
+                if id(callback) not in seen:
+                    seen.add(id(callback))
+                    callbacks.append(callback)
+        return callbacks
+
+    def _call(self, callback: Dict, changed: set) -> set:
+        """POST one callback; apply its outputs to the state and return the changed keys."""
+        def values(items):
+            return [dict(item, value=self.state.get(_key(item['id'], item['property'])))
+                    for item in items]
+
+        outputs = callback['outputs']
+        payload = {
+            'output': callback['output'],
+            'outputs': outputs if callback['output'].startswith('..') else outputs[0],
+            'inputs': values(callback['inputs']),
+            'state': values(callback['state']),
+            'changedPropIds': sorted(key for key in changed
+                                     if any(_key(i['id'], i['property']) == key for i in callback['inputs']))
+        }
+        status, body = self._request(callback['label'], 'POST', '/_dash-update-component', payload)
+        if status != 200:
+            return set()  # 204: PreventUpdate
+        try:
+            response = json.loads(body).get('response', {})
+        except ValueError:
+            return set()
+        updated = set()
+        for component_id, props in response.items():
+            for prop, value in props.items():
+                key = _key(component_id, prop)
+                if self.state.get(key) != value:
+                    self.state[key] = value
+                    updated.add(key)
+        return updated
+
+    def set_props(self, props: Dict[str, object]):
+        """Change properties as the user would and fire the callbacks they trigger."""
+        changed = set()
+        for key, value in props.items():
+            if self.state.get(key) != value:
+                self.state[key] = value
+                changed.add(key)
+        if changed:
+            self._fire(self._triggered_by(changed), changed, depth=0)
+
+    # -- actions ---------------------------------------------------------
+
+    def _options(self) -> List[str]:
+        options = self.state.get('material-dropdown.options') or []
+        return [option['value'] for option in options if isinstance(option, dict) and 'value' in option]
+
+    def action_pick(self):
+        options = self._options()
+        if options and self.rng.random() < 0.5:
+            # Type a few letters of a material name (one request per keystroke)
+            prefix = self.rng.choice(options)[:self.rng.randint(2, 4)]
+            for i in range(1, len(prefix) + 1):
+                self.set_props({'material-dropdown.search_value': prefix[:i]})
+            options = self._options() or options
+            self.set_props({'material-dropdown.search_value': ''})
+        if not options:
+            return
+        picked = self.rng.sample(options, min(len(options), self.rng.randint(1, 8)))
+        self.set_props({'material-dropdown.value': picked})
+
+    def action_drag(self):
+        component_id = self.rng.choice([s for s in DRAG_SLIDERS if self.model.slider(s)] or [None])
+        if component_id is None:
+            return
+        props = self.model.slider(component_id)
+        low, high = float(props.get('min', 0)), float(props.get('max', 1))
+        step = float(props.get('step') or (high - low) / 100)
+        key = _key(component_id, 'value')
+        current = self.state.get(key)
+        is_range = isinstance(current, list)
+        start = float(current[-1] if is_range else current if current is not None else low)
+        floor = float(current[0]) + step if is_range else low
+        target = low + step * self.rng.randint(0, int(round((high - low) / step)))
+        target = min(max(target, floor), high)
+        if props.get('updatemode') == 'drag':
+            count = max(1, int(abs(target - start) / step))
+            path = np.linspace(start, target, min(count, 12) + 1)[1:]
+        else:
+            path = [target]  # 'mouseup': one update when the handle is released
+        for value in path:
+            value = round(round(value / step) * step, 10)
+            self.set_props({key: [current[0], value] if is_range else value})
+            if len(path) > 1:
+                time.sleep(DRAG_STEP_SECONDS)
+
+    def action_tab(self):
+        tabs = self.model.tabs.get('material-category-tabs') or []
+        if tabs:
+            self.set_props({'material-category-tabs.active_tab': self.rng.choice(tabs)})
+
+    def action_export(self):
+        key = 'export-btn.n_clicks'
+        self.set_props({key: (self.state.get(key) or 0) + 1})
+
+    # -- loop ------------------------------------------------------------
+
+    def run(self, deadline: float, start_delay: float = 0.0):
+        time.sleep(start_delay)
+        actions, weights = zip(*self.mix.items())
+        while time.monotonic() < deadline:
+            try:
+                self.load_page()
+            except Exception as e:
+                self.results.record('page: load failed', 0.0, 0, repr(e))
+                time.sleep(1.0)
+                continue
+            for _ in range(self.session_actions):
+                pause = self.rng.expovariate(1.0 / self.think) if self.think > 0 else 0.0
+                if time.monotonic() + pause >= deadline:
+                    return
+                time.sleep(pause)
+                name = self.rng.choices(actions, weights)[0]
+                self.results.action(name)
+                try:
+                    getattr(self, f'action_{name}')()
+                except Exception as e:
+                    self.results.record(f'action: {name}', 0.0, 0, repr(e))
+
+
+# ----------------------------------------------------------------------
+# Runner
+
+
+def parse_mix(text: Optional[str]) -> Dict[str, float]:
+    """'pick=3,drag=4' -> {'pick': 3.0, 'drag': 4.0} (unknown actions raise ValueError)."""
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"unknown action {name!r} (choose from {', '.join(DEFAULT_MIX)})")
+        mix[name] = float(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def run_load_test(users: int = 10, duration: float = 60.0, think: float = 2.0, ramp: float = 5.0,
+                  mix: Optional[Dict[str, float]] = None, url: Optional[str] = None,
+                  auth: str = LOAD_TEST_AUTH, seed: Optional[int] = None,
+                  session_actions: int = SESSION_ACTIONS) -> Dict:
+    """
+    Run virtual users for `duration` seconds and summarize the results.
+
+    Args:
+        users: Concurrent virtual users
+        duration: Test length in seconds (including the ramp-up)
+        think: Mean think time between actions in seconds (exponentially distributed)
+        ramp: Seconds over which user start times are spread
+        mix: Action name -> relative weight
+        url: Running server to load; None runs the app in-process
+        auth: 'user:password' for basic auth ('' for none, or the app's own credentials in-process)
+        seed: Random seed for reproducible action sequences
+        session_actions: Actions per session before a page reload
+
+    Returns:
+        Summary dict (see Results.summary)
+
+    Raises:
+        RuntimeError: If the server refuses the layout request (e.g. missing credentials)
+    """
+    headers = {'Authorization': _basic_auth(auth)} if auth else {}
+    transport = HttpTransport(url, headers) if url else InProcessTransport(headers)
+    check_access(transport)
+
+    results = Results()
+    master = random.Random(seed)
+    start = time.monotonic()
+    deadline = start + duration
+    threads = []
+    for i in range(users):
+        user = VirtualUser(transport, results, random.Random(master.random()), think,
+                           mix or dict(DEFAULT_MIX), session_actions)
+        delay = ramp * i / users if users > 1 else 0.0
+        thread = threading.Thread(target=user.run, args=(deadline, delay), name=f'vu-{i}', daemon=True)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        # Requests in flight at the deadline are allowed to finish
+        thread.join(max(0.0, deadline - time.monotonic()) + REQUEST_TIMEOUT)
+    return results.summary(time.monotonic() - start)
+
+
+def print_summary(summary: Dict, users: int):
+    print(f"\n{users} users, {summary['elapsed_s']:.1f}s, {summary['requests']} requests, "
+          f"{summary['throughput_rps']:.1f} req/s, error rate {summary['error_rate']:.2%}")
+    print("Actions: " + ', '.join(f"{name}={count}" for name, count in sorted(summary['actions'].items())))
+    print(f"\n{'request':42s} {'count':>7s} {'req/s':>7s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'errors':>8s}")
+    for label, row in summary['callbacks'].items():
+        print(f"{label[:42]:42s} {row['requests']:7d} {row['throughput_rps']:7.2f} {row['p50_ms']:7.1f}ms "
+              f"{row['p95_ms']:7.1f}ms {row['p99_ms']:7.1f}ms {row['error_rate']:7.1%}")
+    print(f"{'all':42s} {summary['requests']:7d} {summary['throughput_rps']:7.2f} {summary['p50_ms']:7.1f}ms "
+          f"{summary['p95_ms']:7.1f}ms {summary['p99_ms']:7.1f}ms {summary['error_rate']:7.1%}")
+    for label, sample in summary['error_samples'].items():
+        print(f"⚠️ {label}: {sample}")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulate concurrent users of the Dash app")
+    parser.add_argument('--users', type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument('--duration', type=float, default=60.0, help="Test length in seconds")
+    parser.add_argument('--think', type=float, default=2.0, help="Mean think time between actions (s)")
+    parser.add_argument('--ramp', type=float, default=5.0, help="Spread user start times over this many seconds")
+    parser.add_argument('--mix', help="Action weights, e.g. pick=3,drag=4,tab=2,export=1 (default)")
+    parser.add_argument('--session-actions', type=int, default=SESSION_ACTIONS,
+                        help="Actions per session before the user reloads the page")
+    parser.add_argument('--url', help="Load a running server instead of the in-process app")
+    parser.add_argument('--auth', default=LOAD_TEST_AUTH,
+                        help="user:password for basic auth against --url (default: LOAD_TEST_AUTH)")
+    parser.add_argument('--seed', type=int, help="Random seed")
+    parser.add_argument('--json', dest='json_file', help="Write the summary to this file")
+    parser.add_argument('--max-error-rate', type=float, default=0.01,
+                        help="Exit with status 1 if the overall error rate exceeds this")
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"🚀 {args.users} users for {args.duration:.0f}s against {args.url or 'app.server (in-process)'}")
+    try:
+        summary = run_load_test(args.users, args.duration, args.think, args.ramp, mix, args.url,
+                                args.auth, args.seed, args.session_actions)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print_summary(summary, args.users)
+
+    if args.json_file:
+        with open(args.json_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        print(f"\n✅ Summary written to {args.json_file}")
+    if summary['error_rate'] > args.max_error_rate:
+        print(f"\n❌ Error rate {summary['error_rate']:.2%} exceeds {args.max_error_rate:.2%}")
+        sys.exit(1)
@@ -0,0 +1,181 @@
+"""
+Material Search Index for the material dropdown typeahead.
+
+Indexes every compound by name, formula, element symbols and aliases
+(display name, metal names, category) using a sorted token list for prefix
+lookups and a trigram inverted index for fuzzy substring matches, so the
+dropdown can request the top-k matches per keystroke instead of receiving
+every material up front.
+"""
+
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from compound_index import parse_formula
+
+_SUBSCRIPTS = str.maketrans('₀₁₂₃₄₅₆₇₈₉', '0123456789')
+_TOKEN_SPLIT = re.compile(r'[^0-9a-z.+-]+')
+
+
+def normalize(text: str) -> str:
+    """Lowercase, map subscript digits to ASCII and collapse separators."""
+    return ' '.join(_TOKEN_SPLIT.split(text.translate(_SUBSCRIPTS).lower())).strip()
+
+
+def _trigrams(text: str) -> Iterable[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class MaterialSearchIndex:
+    """Prefix + trigram search over material names, formulas, elements and aliases."""
+
+    def __init__(self, entries: List[Dict]):
+        """
+        Args:
+            entries: One dict per material with 'name', 'formula', 'label' and
+                optional 'aliases' (list of extra searchable strings)
+        """
+        self.names: List[str] = []
+        self.labels: List[str] = []
+        self._texts: List[str] = []
+        self._name_texts: List[str] = []
+        token_rows: Dict[str, set] = {}
+        trigram_rows: Dict[str, List[int]] = {}
+
+        for row, entry in enumerate(entries):
+            name = entry['name']
+            text = normalize(' '.join([name, entry.get('formula', '')] + list(entry.get('aliases', []))))
+            # Drop repeated words so the per-option search string stays small
+            text = ' '.join(dict.fromkeys(text.split()))
+            self.names.append(name)
+            self.labels.append(entry.get('label', name))
+            self._texts.append(text)
+            self._name_texts.append(normalize(name))
+
+            for token in set(text.split()):
+                token_rows.setdefault(token, set()).add(row)
+            for gram in _trigrams(text):
+                trigram_rows.setdefault(gram, []).append(row)
+
+        self._tokens = sorted(token_rows)
+        self._token_rows = [np.fromiter(sorted(token_rows[token]), dtype=np.int32) for token in self._tokens]
+        self._trigram_rows = {gram: np.asarray(rows, dtype=np.int32) for gram, rows in trigram_rows.items()}
+        self._row_of = {name: row for row, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._row_of
+
+    def _prefix_rows(self, prefix: str) -> np.ndarray:
+        """Rows having any token that starts with prefix (binary search on sorted tokens)."""
+        start = bisect.bisect_left(self._tokens, prefix)
+        end = bisect.bisect_left(self._tokens, prefix + '\uffff')
+        if start == end:
+            return np.zeros(0, dtype=np.int32)
+        return np.unique(np.concatenate(self._token_rows[start:end]))
+
+    def search(self, query: str, k: int = 50, restrict: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Return up to k material names ranked by match quality.
+
+        Ranking: exact name, name prefix, every query word matching a token
+        prefix, then trigram overlap; ties go to shorter names.
+
+        Args:
+            query: Free-text query (name fragment, formula, element, alias)
+            k: Maximum number of results
+            restrict: Optional subset of names to search within
+        """
+        q = normalize(query or '')
+        if not q:
+            return []
+
+        words = q.split()
+        n_rows = len(self.names)
+        score = np.zeros(n_rows, dtype=np.float32)
+
+        # Every query word must prefix-match some token for the strong bonus
+        prefix_hits = np.ones(n_rows, dtype=bool)
+        for word in words:
+            hit = np.zeros(n_rows, dtype=bool)
+            hit[self._prefix_rows(word)] = True
+            prefix_hits &= hit
+        score += prefix_hits * 10.0
+
+        # Fuzzy part: fraction of query trigrams present
+        grams = [gram for word in words for gram in _trigrams(word)]
+        postings = [self._trigram_rows[gram] for gram in grams if gram in self._trigram_rows]
+        if postings:
+            counts = np.bincount(np.concatenate(postings), minlength=n_rows)
+            score += counts / max(len(grams), 1) * 5.0
+
+        candidates = np.flatnonzero(score >= 2.5)
+        if restrict is not None:
+            allowed = np.zeros(n_rows, dtype=bool)
+            allowed[[self._row_of[name] for name in restrict if name in self._row_of]] = True
+            candidates = candidates[allowed[candidates]]
+
+        def rank(row: int):
+            name_text = self._name_texts[row]
+            return (
+                -(name_text == q),
+                -name_text.startswith(q),
+                -score[row],
+                len(name_text),
+                name_text
+            )
+
+        ranked = sorted(candidates.tolist(), key=rank)
+        return [self.names[row] for row in ranked[:k]]
+
+    def option(self, name: str) -> Dict:
+        """Dropdown option dictionary for a material."""
+        row = self._row_of.get(name)
+        if row is None:
+            return {"label": name, "value": name, "search": name.lower()}
+        return {"label": self.labels[row], "value": name, "search": self._texts[row]}
+
+    def options(self, names: Iterable[str]) -> List[Dict]:
+        return [self.option(name) for name in names]
+
+
+def build_material_search_index(raw_data: Dict, categories: Iterable[str],
+                                label_for=None, metal_names: Optional[Dict[str, str]] = None) -> MaterialSearchIndex:
+    """
+    Build the search index from the loaded Ellingham tables.
+
+    Args:
+        raw_data: Loaded tables (category -> name -> entry)
+        categories: Category names to index, in display order
+        label_for: Optional callable name -> display label (e.g. get_material_display_name)
+        metal_names: Optional element symbol -> metal name mapping used as aliases
+
+    Returns:
+        MaterialSearchIndex
+    """
+    metal_names = metal_names or {}
+    entries = []
+    seen = set()
+
+    for category in categories:
+        for name, entry in raw_data.get(category, {}).items():
+            if name in seen:
+                continue
+            seen.add(name)
+
+            formula = entry.get('formula', '')
+            symbols = list(parse_formula(formula))
+            label = label_for(name) if label_for else name
+            aliases = [label, category.rstrip('s').replace('_', ' ')]
+            aliases += symbols
+            aliases += [metal_names[symbol] for symbol in symbols if symbol in metal_names]
+
+            entries.append({'name': name, 'formula': formula, 'label': label, 'aliases': aliases})
+
+    return MaterialSearchIndex(entries)
@@ -5,10 +5,84 @@ Provides category-based material selection with tabs and searchable dropdown
 to handle the large number of JANAF compounds efficiently.
 """
 
+import logging
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 from typing import Dict, List, Optional
 
+from compound_index import lookup_names, metal_symbols
+
+logger = logging.getLogger(__name__)
+
+
+# Common metal names and their variations (last variation is the element symbol)
+METAL_MAPPINGS = {
+    'titanium': ['titanium', 'ti'],
+    'aluminum': ['aluminum', 'aluminium', 'al'],
+    'iron': ['iron', 'fe'],
+    'copper': ['copper', 'cu'],
+    'nickel': ['nickel', 'ni'],
+    'chromium': ['chromium', 'cr'],
+    'manganese': ['manganese', 'mn'],
+    'vanadium': ['vanadium', 'v'],
+    'molybdenum': ['molybdenum', 'mo'],
+    'tungsten': ['tungsten', 'w'],
+    'zirconium': ['zirconium', 'zr'],
+    'hafnium': ['hafnium', 'hf'],
+    'tantalum': ['tantalum', 'ta'],
+    'niobium': ['niobium', 'nb'],
+    'magnesium': ['magnesium', 'mg'],
+    'calcium': ['calcium', 'ca'],
+    'strontium': ['strontium', 'sr'],
+    'barium': ['barium', 'ba'],
+    'silicon': ['silicon', 'si'],
+    'germanium': ['germanium', 'ge'],
+    'tin': ['tin', 'sn'],
+    'lead': ['lead', 'pb'],
+    'zinc': ['zinc', 'zn'],
+    'cadmium': ['cadmium', 'cd'],
+    'mercury': ['mercury', 'hg'],
+    'cobalt': ['cobalt', 'co'],
+    'rhodium': ['rhodium', 'rh'],
+    'palladium': ['palladium', 'pd'],
+    'platinum': ['platinum', 'pt'],
+    'gold': ['gold', 'au'],
+    'silver': ['silver', 'ag'],
+    'ruthenium': ['ruthenium', 'ru'],
+    'osmium': ['osmium', 'os'],
+    'iridium': ['iridium', 'ir'],
+    'uranium': ['uranium', 'u'],
+    'thorium': ['thorium', 'th'],
+    'cerium': ['cerium', 'ce'],
+    'lanthanum': ['lanthanum', 'la'],
+    'yttrium': ['yttrium', 'y'],
+    'scandium': ['scandium', 'sc'],
+    'lutetium': ['lutetium', 'lu'],
+    'ytterbium': ['ytterbium', 'yb'],
+    'thulium': ['thulium', 'tm'],
+    'erbium': ['erbium', 'er'],
+    'holmium': ['holmium', 'ho'],
+    'dysprosium': ['dysprosium', 'dy'],
+    'terbium': ['terbium', 'tb'],
+    'gadolinium': ['gadolinium', 'gd'],
+    'europium': ['europium', 'eu'],
+    'samarium': ['samarium', 'sm'],
+    'promethium': ['promethium', 'pm'],
+    'neodymium': ['neodymium', 'nd'],
+    'praseodymium': ['praseodymium', 'pr'],
+    'lithium': ['lithium', 'li'],
+    'sodium': ['sodium', 'na'],
+    'potassium': ['potassium', 'k'],
+    'rubidium': ['rubidium', 'rb'],
+    'cesium': ['cesium', 'cs']
+}
+
+# Element symbol -> display name (e.g. 'Ti' -> 'Titanium')
+METAL_NAMES_BY_SYMBOL = {
+    variations[-1].capitalize(): metal.capitalize() for metal, variations in METAL_MAPPINGS.items()
+}
+METAL_SYMBOLS_BY_NAME = {name.lower(): symbol for symbol, name in METAL_NAMES_BY_SYMBOL.items()}
+
 
 def create_material_selector(categories_data: Dict[str, List], default_materials: List[str]) -> html.Div:
     """
@@ -181,16 +255,21 @@ def get_category_summary(categories_data: Dict[str, List]) -> str:
     return " | ".join(summary_parts)
 
 
-def get_available_metals(categories_data: Dict[str, List]) -> List[str]:
+def get_available_metals(categories_data: Dict[str, List], compound_index: Optional[Dict] = None) -> List[str]:
     """
     Extract all unique metals from the materials database
     
     Args:
         categories_data: Dictionary with category names and material lists
+        compound_index: Optional composition index; when given, metals are
+            read from parsed formulas instead of matched in names
     
     Returns:
         List of unique metal names
     """
+    if compound_index is not None:
+        return sorted({METAL_NAMES_BY_SYMBOL.get(symbol, symbol) for symbol in metal_symbols(compound_index)})
+    
     metals = set()
     
     for category, materials in categories_data.items():
@@ -220,72 +299,10 @@ def extract_metal_from_material(material_name: str) -> Optional[str]:
     Returns:
         Metal name (e.g., "Titanium") or None if not found
     """
-    # Common metal names and their variations
-    metal_mappings = {
-        'titanium': ['titanium', 'ti'],
-        'aluminum': ['aluminum', 'aluminium', 'al'],
-        'iron': ['iron', 'fe'],
-        'copper': ['copper', 'cu'],
-        'nickel': ['nickel', 'ni'],
-        'chromium': ['chromium', 'cr'],
-        'manganese': ['manganese', 'mn'],
-        'vanadium': ['vanadium', 'v'],
-        'molybdenum': ['molybdenum', 'mo'],
-        'tungsten': ['tungsten', 'w'],
-        'zirconium': ['zirconium', 'zr'],
-        'hafnium': ['hafnium', 'hf'],
-        'tantalum': ['tantalum', 'ta'],
-        'niobium': ['niobium', 'nb'],
-        'magnesium': ['magnesium', 'mg'],
-        'calcium': ['calcium', 'ca'],
-        'strontium': ['strontium', 'sr'],
-        'barium': ['barium', 'ba'],
-        'silicon': ['silicon', 'si'],
-        'germanium': ['germanium', 'ge'],
-        'tin': ['tin', 'sn'],
-        'lead': ['lead', 'pb'],
-        'zinc': ['zinc', 'zn'],
-        'cadmium': ['cadmium', 'cd'],
-        'mercury': ['mercury', 'hg'],
-        'cobalt': ['cobalt', 'co'],
-        'rhodium': ['rhodium', 'rh'],
-        'palladium': ['palladium', 'pd'],
-        'platinum': ['platinum', 'pt'],
-        'gold': ['gold', 'au'],
-        'silver': ['silver', 'ag'],
-        'ruthenium': ['ruthenium', 'ru'],
-        'osmium': ['osmium', 'os'],
-        'iridium': ['iridium', 'ir'],
-        'uranium': ['uranium', 'u'],
-        'thorium': ['thorium', 'th'],
-        'cerium': ['cerium', 'ce'],
-        'lanthanum': ['lanthanum', 'la'],
-        'yttrium': ['yttrium', 'y'],
-        'scandium': ['scandium', 'sc'],
-        'lutetium': ['lutetium', 'lu'],
-        'ytterbium': ['ytterbium', 'yb'],
-        'thulium': ['thulium', 'tm'],
-        'erbium': ['erbium', 'er'],
-        'holmium': ['holmium', 'ho'],
-        'dysprosium': ['dysprosium', 'dy'],
-        'terbium': ['terbium', 'tb'],
-        'gadolinium': ['gadolinium', 'gd'],
-        'europium': ['europium', 'eu'],
-        'samarium': ['samarium', 'sm'],
-        'promethium': ['promethium', 'pm'],
-        'neodymium': ['neodymium', 'nd'],
-        'praseodymium': ['praseodymium', 'pr'],
-        'lithium': ['lithium', 'li'],
-        'sodium': ['sodium', 'na'],
-        'potassium': ['potassium', 'k'],
-        'rubidium': ['rubidium', 'rb'],
-        'cesium': ['cesium', 'cs']
-    }
-    
     material_lower = material_name.lower()
     
     # Check for exact matches first (longest matches first)
-    sorted_metals = sorted(metal_mappings.items(), key=lambda x: len(x[0]), reverse=True)
+    sorted_metals = sorted(METAL_MAPPINGS.items(), key=lambda x: len(x[0]), reverse=True)
     
     for metal, variations in sorted_metals:
         for variation in variations:
@@ -295,17 +312,23 @@ def extract_metal_from_material(material_name: str) -> Optional[str]:
     return None
 
 
-def get_materials_by_metal(categories_data: Dict[str, List], metal: str) -> List[str]:
+def get_materials_by_metal(categories_data: Dict[str, List], metal: str,
+                           compound_index: Optional[Dict] = None) -> List[str]:
     """
     Get all materials containing a specific metal
     
     Args:
         categories_data: Dictionary with category names and material lists
-        metal: Name of the metal to filter by
+        metal: Name (or element symbol) of the metal to filter by
+        compound_index: Optional composition index for an array lookup
     
     Returns:
         List of material names containing the specified metal
     """
+    if compound_index is not None:
+        symbol = METAL_SYMBOLS_BY_NAME.get(metal.lower(), metal)
+        return sorted(lookup_names(compound_index, compound_index['by_element'].get(symbol)))
+    
     materials = []
     metal_lower = metal.lower()
     
@@ -324,22 +347,24 @@ def get_materials_by_metal(categories_data: Dict[str, List], metal: str) -> List
     return sorted(materials)
 
 
-def create_metal_group_options(categories_data: Dict[str, List]) -> List[Dict]:
+def create_metal_group_options(categories_data: Dict[str, List],
+                               compound_index: Optional[Dict] = None) -> List[Dict]:
     """
     Create dropdown options for metal grouping
     
     Args:
         categories_data: Dictionary with category names and material lists
+        compound_index: Optional composition index for array lookups
     
     Returns:
         List of dropdown option dictionaries for metals
     """
-    metals = get_available_metals(categories_data)
+    metals = get_available_metals(categories_data, compound_index)
     options = []
     
     for metal in metals:
         # Count materials for this metal
-        metal_materials = get_materials_by_metal(categories_data, metal)
+        metal_materials = get_materials_by_metal(categories_data, metal, compound_index)
         count = len(metal_materials)
         
         options.append({
@@ -350,3 +375,91 @@ def create_metal_group_options(categories_data: Dict[str, List]) -> List[Dict]:
     
     return options
 
+
+
+class MaterialOptionSets:
+    """
+    Precomputed dropdown option sets, built once per data load.
+
+    Holds the option list for every category tab and every metal group,
+    the metal-group dropdown options and the display label of every
+    material. Each set is also kept as a serialized JSON blob that can be
+    served as-is. Everything is rebuilt only when the data loader reloads
+    (its generation changes) or the custom compound database changes.
+    """
+
+    def __init__(self, data_loader, custom_compound_manager=None, browse_limit: Optional[int] = None):
+        self.data_loader = data_loader
+        self.custom_compound_manager = custom_compound_manager
+        self.browse_limit = browse_limit
+        self._key = None
+        self.category_options: Dict[str, List[Dict]] = {}
+        self.metal_options: Dict[str, List[Dict]] = {}
+        self.metal_group_options: List[Dict] = []
+        self.labels: Dict[str, str] = {}
+        self.blobs: Dict[str, bytes] = {}
+
+    def _current_key(self):
+        custom_version = getattr(self.custom_compound_manager, 'version', 0)
+        return (self.data_loader.generation, custom_version)
+
+    def invalidate(self):
+        self._key = None
+
+    def refresh(self) -> 'MaterialOptionSets':
+        """Rebuild the option sets if the underlying data changed."""
+        key = self._current_key()
+        if key == self._key:
+            return self
+
+        import json
+        from compound_index import CATEGORY_ORDER
+
+        loader = self.data_loader
+        compound_index = loader.get_compound_index()
+        search_index = loader.get_search_index()
+        limit = self.browse_limit
+
+        category_options = {
+            category: search_index.options(loader.get_available_materials(category=category)[:limit])
+            for category in CATEGORY_ORDER
+        }
+        metal_options = {}
+        metal_group_options = []
+        for metal in get_available_metals({}, compound_index):
+            materials = get_materials_by_metal({}, metal, compound_index)
+            metal_options[metal] = search_index.options(materials[:limit])
+            metal_group_options.append({
+                "label": f"{metal} ({len(materials)} compounds)",
+                "value": metal,
+                "search": metal.lower()
+            })
+
+        blobs = {f"category/{category}": json.dumps(options).encode('utf-8')
+                 for category, options in category_options.items()}
+        blobs.update({f"metal/{metal}": json.dumps(options).encode('utf-8')
+                      for metal, options in metal_options.items()})
+        blobs['metals'] = json.dumps(metal_group_options).encode('utf-8')
+
+        self.category_options = category_options
+        self.metal_options = metal_options
+        self.metal_group_options = metal_group_options
+        self.labels = dict(zip(search_index.names, search_index.labels))
+        self.blobs = blobs
+        self._key = key
+
+        logger.info("Precomputed %d category and %d metal option sets", len(category_options), len(metal_options))
+        return self
+
+    def for_category(self, category: str) -> List[Dict]:
+        return self.refresh().category_options.get(category, [])
+
+    def for_metal(self, metal: str) -> List[Dict]:
+        return self.refresh().metal_options.get(metal, [])
+
+    def metal_groups(self) -> List[Dict]:
+        return self.refresh().metal_group_options
+
+    def blob(self, key: str) -> Optional[bytes]:
+        """Serialized option set ('category/<name>', 'metal/<name>' or 'metals')."""
+        return self.refresh().blobs.get(key)
@@ -0,0 +1,165 @@
+"""
+Memory accounting and allocation tracing.
+
+memory_report() measures the retained size of the app's long-lived
+structures (loaded tables, derived indexes, caches, custom compounds) next
+to the process RSS, so cache bounds and worker recycling thresholds
+(GUNICORN_MAX_REQUESTS) can be set from data. AllocationTracer wraps
+tracemalloc: take labelled snapshots at two points in time and diff them to
+see the top allocation sites in between. Tracing slows allocations down, so
+it only runs between start() and stop().
+"""
+
+import gc
+import sys
+import time
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Snapshots held at once (each can be several MB)
+MAX_SNAPSHOTS = 4
+
+
+def deep_sizeof(obj, _seen: Optional[set] = None) -> int:
+    """
+    Approximate retained size of an object graph in bytes.
+
+    Follows dicts, lists, tuples, sets and instance __dict__s; NumPy arrays
+    count their buffer only if they own it (memory-mapped pages are shared).
+    Objects reachable twice are counted once.
+    """
+    seen = set() if _seen is None else _seen
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, np.ndarray):
+            # Includes the buffer only if the array owns it (not for views or memmaps)
+            total += sys.getsizeof(item)
+            continue
+        total += sys.getsizeof(item, 0)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__dict__') and not isinstance(item, type):
+            stack.append(item.__dict__)
+    return total
+
+
+def process_memory() -> Dict[str, Optional[int]]:
+    """Current and peak resident set size in bytes (Linux /proc, else getrusage peak)."""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+        return {'rss_bytes': int(fields['VmRSS'].split()[0]) * 1024,
+                'peak_rss_bytes': int(fields['VmHWM'].split()[0]) * 1024}
+    except (OSError, KeyError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kB on Linux, bytes on macOS
+        return {'rss_bytes': None, 'peak_rss_bytes': peak if sys.platform == 'darwin' else peak * 1024}
+
+
+def memory_report(components: Dict[str, object]) -> Dict:
+    """
+    Sizes of the given components, largest first, with the process RSS.
+
+    Args:
+        components: Name -> object (or list of objects) to measure; objects
+            shared between components are counted in the first one only
+    """
+    start = time.perf_counter()
+    seen: set = set()
+    sizes = {name: deep_sizeof(obj, seen) for name, obj in components.items()}
+    accounted = sum(sizes.values())
+    return {
+        'process': process_memory(),
+        'components_bytes': dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True)),
+        'accounted_bytes': accounted,
+        'gc_objects': len(gc.get_objects()),
+        'measure_seconds': round(time.perf_counter() - start, 3)
+    }
+
+
+class AllocationTracer:
+    """tracemalloc snapshots with labelled diffs."""
+
+    def __init__(self):
+        self._snapshots: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        import tracemalloc
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 10) -> Dict:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(max(1, min(int(frames), 50)))
+        return self.status()
+
+    def stop(self) -> Dict:
+        import tracemalloc
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+        return self.status()
+
+    def snapshot(self, label: Optional[str] = None) -> str:
+        """Take a snapshot (tracing must be started); returns its label."""
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing; start it first")
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>')
+        ])
+        label = label or time.strftime('%H%M%S')
+        with self._lock:
+            self._snapshots[label] = snapshot
+            while len(self._snapshots) > MAX_SNAPSHOTS:
+                self._snapshots.pop(next(iter(self._snapshots)))
+        return label
+
+    def diff(self, before: str, after: str, limit: int = 25, group_by: str = 'lineno') -> List[Dict]:
+        """
+        Top allocation sites by size growth between two snapshots.
+
+        Args:
+            before, after: Snapshot labels
+            limit: Number of sites
+            group_by: 'lineno', 'filename' or 'traceback'
+        """
+        with self._lock:
+            try:
+                old, new = self._snapshots[before], self._snapshots[after]
+            except KeyError as e:
+                raise KeyError(f"unknown snapshot {e}") from e
+        stats = new.compare_to(old, group_by)
+        return [{
+            'site': [str(frame) for frame in stat.traceback.format()[-6:]] if group_by == 'traceback'
+            else str(stat.traceback),
+            'size_diff_bytes': stat.size_diff,
+            'size_bytes': stat.size,
+            'count_diff': stat.count_diff
+        } for stat in stats[:limit]]
+
+    def status(self) -> Dict:
+        import tracemalloc
+        status = {'tracing': tracemalloc.is_tracing(), 'snapshots': list(self._snapshots)}
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            status.update(traced_bytes=current, traced_peak_bytes=peak,
+                          overhead_bytes=tracemalloc.get_tracemalloc_memory())
+        return status
+
+
+allocation_tracer = AllocationTracer()
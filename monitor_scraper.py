@@ -6,38 +6,32 @@ Monitors the progress of the full JANAF database extraction
 
 import time
 import os
-import pickle
 from datetime import datetime
 
-def check_progress():
-    """Check the progress of the scraper"""
+from scrape_progress import PROGRESS_FILE, read_latest, format_duration
+
+def check_progress(progress_file: str = PROGRESS_FILE):
+    """Check the progress of the scraper from its progress manifest"""
     print("="*80)
     print("JANAF SCRAPER PROGRESS MONITOR")
     print("="*80)
     print(f"Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
-    # Check if the scraper is still running
-    scraper_processes = []
-    try:
-        import subprocess
-        result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-        for line in result.stdout.split('\n'):
-            if 'janaf_scraper.py' in line and 'python3' in line:
-                scraper_processes.append(line.strip())
-    except:
-        pass
+    # Only the last manifest line is read, so each poll is O(1)
+    snapshot = read_latest(progress_file)
     
-    if scraper_processes:
-        print("✓ Scraper is running")
-        for process in scraper_processes:
-            print(f"  Process: {process}")
+    if snapshot is None:
+        print(f"✗ No progress manifest found ({progress_file})")
+    elif snapshot['alive']:
+        print(f"✓ Scraper is running (pid {snapshot['pid']}, last update {snapshot['age_seconds']:.0f}s ago)")
     else:
-        print("✗ Scraper is not running")
+        print(f"✗ Scraper is not running (last status: {snapshot.get('status')}, "
+              f"last update {format_duration(snapshot['age_seconds'])} ago)")
     
     print()
     
-    # Check for output files
+    # Check for output files (size and time only; nothing is unpickled)
     files_to_check = [
         'janaf_full_database.pkl',
         'janaf_test_database.pkl',
@@ -50,58 +44,36 @@ def check_progress():
             size = os.path.getsize(filename)
             mod_time = datetime.fromtimestamp(os.path.getmtime(filename))
             print(f"✓ {filename}: {size:,} bytes (modified: {mod_time.strftime('%H:%M:%S')})")
-            
-            # Try to load and analyze the data
-            try:
-                with open(filename, 'rb') as f:
-                    data = pickle.load(f)
-                
-                if isinstance(data, dict):
-                    total_compounds = sum(len(compounds) for compounds in data.values())
-                    print(f"  Elements: {len(data)}")
-                    print(f"  Total compounds: {total_compounds}")
-                    
-                    # Show breakdown by element
-                    print("  Breakdown by element:")
-                    for element, compounds in sorted(data.items()):
-                        print(f"    {element}: {len(compounds)} compounds")
-                else:
-                    print(f"  Data type: {type(data)}")
-                    
-            except Exception as e:
-                print(f"  Error loading data: {e}")
         else:
             print(f"✗ {filename}: Not found")
     
     print()
     
-    # Estimate progress
-    expected_elements = 38
-    expected_compounds = 4459
+    if snapshot is None:
+        return
     
-    if os.path.exists('janaf_full_database.pkl'):
-        try:
-            with open('janaf_full_database.pkl', 'rb') as f:
-                data = pickle.load(f)
-            
-            elements_done = len(data)
-            compounds_done = sum(len(compounds) for compounds in data.values())
-            
-            element_progress = (elements_done / expected_elements) * 100
-            compound_progress = (compounds_done / expected_compounds) * 100
-            
-            print("Progress Estimation:")
-            print(f"Elements: {elements_done}/{expected_elements} ({element_progress:.1f}%)")
-            print(f"Compounds: {compounds_done:,}/{expected_compounds:,} ({compound_progress:.1f}%)")
-            
-            if elements_done > 0:
-                avg_compounds_per_element = compounds_done / elements_done
-                remaining_elements = expected_elements - elements_done
-                estimated_remaining_compounds = remaining_elements * avg_compounds_per_element
-                print(f"Estimated remaining compounds: {estimated_remaining_compounds:.0f}")
-                
-        except Exception as e:
-            print(f"Error analyzing progress: {e}")
+    elements_total = snapshot['elements_total'] or 1
+    compounds_total = snapshot['compounds_total'] or 1
+    element_progress = snapshot['elements_done'] / elements_total * 100
+    compound_progress = snapshot['compounds_done'] / compounds_total * 100
+    
+    print("Progress:")
+    print(f"Elements: {snapshot['elements_done']}/{snapshot['elements_total']} ({element_progress:.1f}%)")
+    print(f"Compounds: {snapshot['compounds_done']:,}/{snapshot['compounds_total']:,} listed so far ({compound_progress:.1f}%)")
+    print(f"  With data: {snapshot['compounds_ok']:,}  Failed: {snapshot['compounds_failed']:,}")
+    
+    rate = snapshot.get('rate_per_second')
+    print(f"Throughput: {rate:.2f} compounds/s" if rate else "Throughput: n/a")
+    print(f"Elapsed: {format_duration(snapshot['elapsed'])}  ETA: {format_duration(snapshot.get('eta_seconds'))}")
+    
+    if snapshot['failed_elements']:
+        print(f"Failed elements: {', '.join(snapshot['failed_elements'])}")
+    
+    print("  Breakdown by element:")
+    for element, counts in sorted(snapshot['per_element'].items()):
+        timing = f", {counts['elapsed']:.1f}s" if counts.get('elapsed') is not None else ""
+        print(f"    {element}: {counts['done']}/{counts['total']} done, "
+              f"{counts['ok']} with data, {counts['failed']} failed{timing}")
 
 def main():
     """Main monitoring function"""
@@ -10,6 +10,7 @@ import numpy as np
 from typing import Dict, List, Set, Tuple, Optional
 import re
 from collections import defaultdict
+from compound_index import categorize_formula, build_compound_index
 
 class JANAFPreprocessor:
     """Preprocesses JANAF data for the Ellingham diagram application"""
@@ -47,28 +48,10 @@ class JANAFPreprocessor:
         for element, compounds in self.data.items():
             for compound_data in compounds:
                 compound_info = compound_data['compound']
-                name = compound_info['name'].lower()
-                formula = compound_info['formula'].lower()
                 
-                # Enhanced categorization logic
-                if self._is_oxide(name, formula):
-                    categories['oxides'].append(compound_data)
-                elif self._is_carbide(name, formula):
-                    categories['carbides'].append(compound_data)
-                elif self._is_nitride(name, formula):
-                    categories['nitrides'].append(compound_data)
-                elif self._is_halide(name, formula):
-                    categories['halides'].append(compound_data)
-                elif self._is_hydride(name, formula):
-                    categories['hydrides'].append(compound_data)
-                elif self._is_sulfide(name, formula):
-                    categories['sulfides'].append(compound_data)
-                elif self._is_phosphide(name, formula):
-                    categories['phosphides'].append(compound_data)
-                elif self._is_pure_element(name, formula, element):
-                    categories['pure_elements'].append(compound_data)
-                else:
-                    categories['other'].append(compound_data)
+                # Categorize from the parsed composition (cached per formula)
+                category = categorize_formula(compound_info['formula'], compound_info['name'])
+                categories[category].append(compound_data)
         
         # Print categorization summary
         print("\nCompound Categorization Summary:")
@@ -77,42 +60,6 @@ class JANAFPreprocessor:
         
         return categories
     
-    def _is_oxide(self, name: str, formula: str) -> bool:
-        """Check if compound is an oxide"""
-        return ('oxide' in name or 
-                'o' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k']))
-    
-    def _is_carbide(self, name: str, formula: str) -> bool:
-        """Check if compound is a carbide"""
-        return ('carbide' in name or 
-                ('c' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k'])))
-    
-    def _is_nitride(self, name: str, formula: str) -> bool:
-        """Check if compound is a nitride"""
-        return ('nitride' in name or 
-                ('n' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k'])))
-    
-    def _is_halide(self, name: str, formula: str) -> bool:
-        """Check if compound is a halide"""
-        return any(halide in name for halide in ['fluoride', 'chloride', 'bromide', 'iodide']) or \
-               any(halide in formula for halide in ['f', 'cl', 'br', 'i'])
-    
-    def _is_hydride(self, name: str, formula: str) -> bool:
-        """Check if compound is a hydride"""
-        return 'hydride' in name or ('h' in formula and len(formula) > 1)
-    
-    def _is_sulfide(self, name: str, formula: str) -> bool:
-        """Check if compound is a sulfide"""
-        return 'sulfide' in name or ('s' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k']))
-    
-    def _is_phosphide(self, name: str, formula: str) -> bool:
-        """Check if compound is a phosphide"""
-        return 'phosphide' in name or ('p' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k']))
-    
-    def _is_pure_element(self, name: str, formula: str, element: str) -> bool:
-        """Check if compound is a pure element"""
-        return element.lower() in name and len(name.split()) == 1
-    
     def extract_thermodynamic_data(self, compound_data: Dict) -> Optional[Dict]:
         """Extract thermodynamic data in the format expected by the app"""
         if not compound_data.get('data'):
@@ -349,6 +296,7 @@ class JANAFPreprocessor:
             'categories': categories,
             'lookup_tables': lookup_tables,
             'ellingham_data': ellingham_data,
+            'compound_index': build_compound_index(ellingham_data),
             'metadata': {
                 'total_elements': len(self.data),
                 'total_compounds': sum(len(compounds) for compounds in self.data.values()),
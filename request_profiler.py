@@ -0,0 +1,287 @@
+"""
+On-demand profiling of live callback invocations.
+
+Profiling is off until an admin arms it (POST /api/profiling), which
+profiles the next N invocations (optionally of one callback only), or a
+single Dash request asks for it with an 'X-Profile: 1' header or a
+'?profile=1' query flag and carries admin credentials. Each profile is
+stored with the callback's inputs and can be downloaded for offline
+analysis:
+
+- 'deterministic': cProfile, saved as .pstats (snakeviz, pstats)
+- 'sampling': stack samples of the serving thread every PROFILE_SAMPLE_INTERVAL
+  seconds, saved as collapsed stacks (.folded, for flamegraph.pl / speedscope)
+
+Both report the share of time spent in the thermo engine, the data loader
+and figure building. Stored profiles are capped at PROFILE_KEEP, and only
+one deterministic profile runs at a time.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import logging
+import tempfile
+import functools
+import threading
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = os.getenv('PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'ellingham_profiles'))
+PROFILE_KEEP = int(os.getenv('PROFILE_KEEP', 50))
+PROFILE_SAMPLE_INTERVAL = float(os.getenv('PROFILE_SAMPLE_INTERVAL', 0.002))
+
+# Upper bound on one arming request
+MAX_ARMED_CALLS = 100
+
+PROFILE_MODES = ('deterministic', 'sampling')
+
+# Source files attributed to each subsystem in the profile summary
+SUBSYSTEMS = {
+    'thermo_engine': ('thermo_calcs.py', 'shared_tables.py', 'curve_sampling.py'),
+    'loader': ('data_loader.py', 'compound_index.py', 'material_search.py'),
+    'figure': ('plotly', 'figure_payload.py', 'animation_frames.py')
+}
+
+_MAX_INPUT_CHARS = 20000
+
+
+def _subsystem(filename: str) -> Optional[str]:
+    for name, markers in SUBSYSTEMS.items():
+        if any(marker in filename for marker in markers):
+            return name
+    return None
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a background thread."""
+
+    def __init__(self, thread_id: int, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+class RequestProfiler:
+    """Arming state, profile capture and storage."""
+
+    def __init__(self, directory: str = PROFILE_DIR, keep: int = PROFILE_KEEP):
+        self.directory = directory
+        self.keep = keep
+        self.authorize: Callable[[], bool] = lambda: False
+        self._lock = threading.Lock()
+        self._deterministic = threading.Lock()
+        self._armed = {'remaining': 0, 'mode': 'sampling', 'callback': None}
+
+    # ------------------------------------------------------------------
+    # Arming
+
+    def arm(self, count: int, mode: str = 'sampling', callback: Optional[str] = None) -> Dict:
+        """Profile the next `count` invocations (of `callback`, if given)."""
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"mode must be one of {PROFILE_MODES}")
+        with self._lock:
+            self._armed = {'remaining': max(0, min(int(count), MAX_ARMED_CALLS)), 'mode': mode, 'callback': callback}
+            return dict(self._armed)
+
+    def armed(self) -> Dict:
+        with self._lock:
+            return dict(self._armed)
+
+    def _take(self, callback_name: str) -> Optional[str]:
+        """Mode to profile this invocation with, or None."""
+        armed = self._armed
+        if armed['remaining'] > 0:
+            with self._lock:
+                armed = self._armed
+                if armed['remaining'] > 0 and armed['callback'] in (None, callback_name):
+                    armed['remaining'] -= 1
+                    return armed['mode']
+        return self._requested()
+
+    def _requested(self) -> Optional[str]:
+        """Mode requested by the current HTTP request's header or query flag (admins only)."""
+        try:
+            from flask import request, has_request_context
+            if not has_request_context():
+                return None
+            flag = request.headers.get('X-Profile') or request.args.get('profile')
+        except ImportError:
+            return None
+        if not flag or flag in ('0', 'false') or not self.authorize():
+            return None
+        return flag if flag in PROFILE_MODES else 'sampling'
+
+    # ------------------------------------------------------------------
+    # Capture
+
+    def profiled(self, func, name: Optional[str] = None):
+        """Wrap a callback so armed invocations run under the profiler."""
+        callback_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            mode = self._take(callback_name)
+            if mode is None:
+                return func(*args, **kwargs)
+            return self._run(mode, callback_name, func, args, kwargs)
+
+        return wrapper
+
+    def _run(self, mode: str, callback_name: str, func, args, kwargs):
+        if mode == 'deterministic' and not self._deterministic.acquire(blocking=False):
+            # cProfile is already running for another request; sample this one instead
+            mode = 'sampling'
+        elif mode == 'deterministic':
+            import cProfile
+            profile = cProfile.Profile()
+
+        error = None
+        start = time.perf_counter()
+        if mode == 'deterministic':
+            try:
+                profile.enable()
+                try:
+                    return func(*args, **kwargs)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    profile.disable()
+                    self._store(mode, callback_name, args, kwargs, time.perf_counter() - start, error, profile=profile)
+            finally:
+                self._deterministic.release()
+
+        sampler = StackSampler(threading.get_ident()).start()
+        try:
+            return func(*args, **kwargs)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            stacks = sampler.stop()
+            self._store(mode, callback_name, args, kwargs, time.perf_counter() - start, error, stacks=stacks)
+
+    # ------------------------------------------------------------------
+    # Storage
+
+    def _store(self, mode, callback_name, args, kwargs, seconds, error, profile=None, stacks=None):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{callback_name}-{uuid.uuid4().hex[:6]}"
+            if profile is not None:
+                import pstats
+                data_file = f"{profile_id}.pstats"
+                profile.dump_stats(os.path.join(self.directory, data_file))
+                stats = pstats.Stats(profile)
+                shares = Counter()
+                for (filename, _, _), (_, _, tottime, _, _) in stats.stats.items():
+                    shares[_subsystem(filename) or 'other'] += tottime
+                total = sum(shares.values()) or 1.0
+                top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:25]
+                top = [{'function': f"{os.path.basename(f)}:{line}({fn})", 'cumtime': round(v[3], 6),
+                        'tottime': round(v[2], 6), 'calls': v[1]} for (f, line, fn), v in top]
+            else:
+                data_file = f"{profile_id}.folded"
+                with open(os.path.join(self.directory, data_file), 'w', encoding='utf-8') as f:
+                    for stack, count in stacks.most_common():
+                        f.write(f"{stack} {count}\n")
+                shares = Counter()
+                for stack, count in stacks.items():
+                    frames = stack.split(';')
+                    # Attribute each sample to the innermost subsystem on the stack
+                    owner = next((s for s in map(_subsystem, reversed(frames)) if s), 'other')
+                    shares[owner] += count
+                total = sum(shares.values()) or 1.0
+                top = [{'stack': stack.split(';')[-3:], 'samples': count} for stack, count in stacks.most_common(10)]
+
+            from structured_logging import current_request_id
+            inputs = json.dumps({'args': args, 'kwargs': kwargs}, default=repr)
+            meta = {
+                'id': profile_id,
+                'callback': callback_name,
+                'mode': mode,
+                'created': time.time(),
+                'seconds': round(seconds, 6),
+                'error': repr(error) if error is not None else None,
+                'request_id': current_request_id(),
+                'file': data_file,
+                'shares': {name: round(value / total, 4) for name, value in shares.most_common()},
+                'top': top,
+                'inputs': inputs if len(inputs) <= _MAX_INPUT_CHARS else inputs[:_MAX_INPUT_CHARS] + '...'
+            }
+            with open(os.path.join(self.directory, f"{profile_id}.json"), 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            self._prune()
+            logger.info("Profiled %s (%s, %.0f ms) -> %s", callback_name, mode, seconds * 1000, profile_id)
+        except Exception as e:
+            # Profiling must never break the request
+            logger.warning("Could not store profile for %s: %s", callback_name, e)
+
+    def _prune(self):
+        metas = sorted(entry for entry in os.listdir(self.directory) if entry.endswith('.json'))
+        for entry in metas[:-self.keep] if len(metas) > self.keep else []:
+            stem = entry[:-len('.json')]
+            for suffix in ('.json', '.pstats', '.folded'):
+                try:
+                    os.remove(os.path.join(self.directory, stem + suffix))
+                except OSError:
+                    pass
+
+    def list_profiles(self) -> List[Dict]:
+        """Stored profile metadata, newest first (without inputs)."""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for entry in sorted(os.listdir(self.directory), reverse=True):
+            if entry.endswith('.json'):
+                try:
+                    with open(os.path.join(self.directory, entry), 'r', encoding='utf-8') as f:
+                        meta = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                meta.pop('inputs', None)
+                profiles.append(meta)
+        return profiles
+
+    def path_of(self, profile_id: str, kind: str = 'data') -> Optional[str]:
+        """Path of a stored profile's data file or ('meta') its metadata, if it exists."""
+        if not profile_id or os.path.basename(profile_id) != profile_id or profile_id.startswith('.'):
+            return None
+        meta_path = os.path.join(self.directory, f"{profile_id}.json")
+        if kind == 'meta':
+            return meta_path if os.path.exists(meta_path) else None
+        for suffix in ('.pstats', '.folded'):
+            path = os.path.join(self.directory, profile_id + suffix)
+            if os.path.exists(path):
+                return path
+        return None
+
+
+request_profiler = RequestProfiler()
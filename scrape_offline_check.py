@@ -0,0 +1,196 @@
+"""
+Offline check of the concurrent JANAF scraper.
+
+Writes a small set of saved JANAF pages (element index pages and compound
+tables) to a temporary directory, serves them on a local HTTP server with
+janaf_scraper.serve_saved_pages() and scrapes them concurrently. No network
+access is needed. The run fails (exit status 1) when:
+
+- the concurrent scrape does not return exactly the compounds on the saved
+  pages, in index-page order, or differs from a serial scrape
+- a missing index page or compound page is not reported as failed
+- a restart with the same checkpoint journal fetches anything but the pages
+  that failed before
+- an unreachable index page is not logged as 'no response'
+- a response cache filled through one local server does not replay (offline)
+  or revalidate for a server on another port
+
+    python scrape_offline_check.py
+    python scrape_offline_check.py --compounds 40 --workers 8
+"""
+
+import os
+import sys
+import logging
+import tempfile
+from typing import Dict, List
+
+from janaf_scraper import JANAFScraper, ResponseCache, serve_saved_pages
+
+ELEMENTS = ['Ti', 'Zr']
+MISSING_ELEMENT = 'Hf'  # Listed for scraping but has no saved index page
+TEMPERATURES_K = [298.15, 500.0, 1000.0, 1500.0, 2000.0]
+
+
+def _compound_page(name: str, offset: float) -> str:
+    header = ''.join(f"<th>{h}</th>" for h in ['T(K)', 'Cp°', 'S°', '-[G°-H°(Tr)]/T', 'H-H°(Tr)',
+                                               'ΔfH°', 'ΔfG°', 'log Kf'])
+    rows = ''.join(
+        "<tr>" + ''.join(f"<td>{v:.3f}</td>" for v in
+                         [T, 50.0 + offset, 60.0 + T / 100, 40.0, T / 1000, -900.0 - offset,
+                          -800.0 - offset + 0.17 * T, 40.0 - T / 100]) + "</tr>"
+        for T in TEMPERATURES_K
+    )
+    return f"<html><body><h1>{name}</h1><table><tr>{header}</tr>{rows}</table></body></html>"
+
+
+def write_saved_pages(directory: str, compounds_per_element: int = 12) -> Dict[str, List[Dict]]:
+    """
+    Write index and compound pages mirroring the layout below /tables/.
+
+    Each element's index also links one compound page that is not saved
+    (it must be reported as failed).
+
+    Returns:
+        Element -> expected compounds in index order ({'url', 'name', 'first_row'})
+    """
+    expected = {}
+    for element in ELEMENTS:
+        rows = []
+        compounds = []
+        for i in range(compounds_per_element):
+            url = f"{element}-{i:03d}.html"
+            name = f"{element} Oxide {i}"
+            offset = ELEMENTS.index(element) * 100 + i
+            with open(os.path.join(directory, url), 'w', encoding='utf-8') as f:
+                f.write(_compound_page(name, offset))
+            rows.append((url, name))
+            compounds.append({'url': url, 'name': name, 'first_row': 50.0 + offset})
+        rows.append((f"{element}-missing.html", f"{element} Missing"))
+        table = ''.join(
+            f"<tr><td>0000-00-{i}</td><td>{element}O{i}</td><td>{name}</td><td>cr</td>"
+            f"<td><a href=\"{url}\">view</a></td><td>ref</td></tr>"
+            for i, (url, name) in enumerate(rows)
+        )
+        with open(os.path.join(directory, f"{element}-index.html"), 'w', encoding='utf-8') as f:
+            f.write("<html><body><table><tr><th>CAS</th><th>Formula</th><th>Name</th><th>State</th>"
+                    f"<th>JANAF Table</th><th>Ref</th></tr>{table}</table></body></html>")
+        expected[element] = compounds
+    return expected
+
+
+class _RecordingScraper(JANAFScraper):
+    """Scraper that remembers every URL it fetched."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fetched: List[str] = []
+
+    def _fetch(self, url):
+        self.fetched.append(url)
+        return super()._fetch(url)
+
+
+def _summary(data: Dict) -> Dict[str, List]:
+    return {element: [(record['compound']['url'], record['data'][0][1]) for record in records]
+            for element, records in data.items()}
+
+
+def run_check(compounds_per_element: int = 12, workers: int = 4) -> List[str]:
+    """
+    Scrape saved pages from a local server.
+
+    Returns:
+        Descriptions of the failed checks (empty when everything passed)
+    """
+    failures = []
+    with tempfile.TemporaryDirectory(prefix='janaf_offline_') as tmp:
+        pages = os.path.join(tmp, 'pages')
+        os.makedirs(pages)
+        expected = write_saved_pages(pages, compounds_per_element)
+        expected_summary = {element: [(c['url'], c['first_row']) for c in compounds]
+                            for element, compounds in expected.items()}
+        journal = os.path.join(tmp, 'journal.jsonl')
+        elements = ELEMENTS + [MISSING_ELEMENT]
+
+        cache_dir = os.path.join(tmp, 'cache')
+        server, base_url = serve_saved_pages(pages)
+        try:
+            scraper = _RecordingScraper(base_url=base_url, requests_per_second=0, max_retries=0,
+                                        cache=ResponseCache(cache_dir))
+            data = scraper.scrape_all_compounds(elements, max_workers=workers, journal_file=journal,
+                                                progress_file=os.path.join(tmp, 'progress.jsonl'))
+            if _summary(data) != expected_summary:
+                failures.append(f"concurrent scrape returned {_summary(data)}, expected {expected_summary}")
+            if MISSING_ELEMENT in data:
+                failures.append(f"{MISSING_ELEMENT} has no index page but was reported as scraped")
+
+            serial = JANAFScraper(base_url=base_url, requests_per_second=0, max_retries=0)
+            if _summary(serial.scrape_all_compounds(elements)) != _summary(data):
+                failures.append("serial and concurrent scrapes differ")
+
+            # A restart only refetches the index pages and the pages that failed
+            restarted = _RecordingScraper(base_url=base_url, requests_per_second=0, max_retries=0)
+            data = restarted.scrape_all_compounds(elements, max_workers=workers, journal_file=journal)
+            refetched = sorted(url[len(base_url):] for url in restarted.fetched if 'index' not in url)
+            missing = sorted(f"{element}-missing.html" for element in ELEMENTS)
+            if refetched != missing:
+                failures.append(f"restart fetched {refetched}, expected only {missing}")
+            if _summary(data) != expected_summary:
+                failures.append("restart from the journal lost compounds")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # The replay server binds another free port; cached pages must still be found
+        pages_cached = len(ELEMENTS) * (compounds_per_element + 1)
+        for mode, stat in (('offline', 'hits'), ('revalidate', 'revalidated')):
+            replay_server, replay_url = serve_saved_pages(pages)
+            try:
+                cache = ResponseCache(cache_dir, mode=mode)
+                replay = JANAFScraper(base_url=replay_url, requests_per_second=0, max_retries=0, cache=cache)
+                data = replay.scrape_all_compounds(ELEMENTS)
+            finally:
+                replay_server.shutdown()
+                replay_server.server_close()
+            if replay_url == base_url:
+                failures.append("replay server reused the original port; the cache key was not exercised")
+            if cache.stats[stat] != pages_cached or _summary(data) != expected_summary:
+                failures.append(f"{mode} replay on another port: {cache.stats}, expected {pages_cached} {stat}")
+
+        # The server is gone: the index request gets no response at all
+        messages = []
+
+        class Capture(logging.Handler):
+            def emit(self, record):
+                messages.append(record.getMessage())
+
+        capture = Capture()
+        logger = logging.getLogger('janaf_scraper')
+        logger.addHandler(capture)
+        try:
+            unreachable = JANAFScraper(base_url=base_url, requests_per_second=0, max_retries=0, timeout=2)
+            if unreachable.get_element_compounds(ELEMENTS[0]) != []:
+                failures.append("unreachable index page returned compounds")
+        finally:
+            logger.removeHandler(capture)
+        if not any('no response' in message for message in messages):
+            failures.append(f"unreachable index page not logged as 'no response': {messages}")
+    return failures
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check the concurrent JANAF scraper against saved pages")
+    parser.add_argument('--compounds', type=int, default=12, help="Saved compound pages per element")
+    parser.add_argument('--workers', type=int, default=4, help="Concurrent fetch workers")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    failures = run_check(args.compounds, args.workers)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"✅ Concurrent scrape of {len(ELEMENTS)} elements × {args.compounds} saved pages matches")
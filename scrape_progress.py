@@ -0,0 +1,220 @@
+"""
+Scrape Progress Manifest
+Small append-only JSON-lines manifest written by the JANAF scraper.
+
+Finished compounds are appended as one-line deltas (element, status, time,
+throughput). A full snapshot (per-element counts, timings, failures,
+throughput and ETA) is written as a checkpoint when the run starts, an
+element is listed or finished, the run ends, and at least every
+CHECKPOINT_EVERY compounds. Readers seek from the end of the file to the
+last checkpoint and apply the deltas after it, so a read costs at most one
+checkpoint plus CHECKPOINT_EVERY short lines however long the run is.
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Dict, List, Optional
+
+PROGRESS_FILE = os.getenv('SCRAPE_PROGRESS_FILE', 'janaf_scrape_progress.jsonl')
+
+# Snapshots older than this are treated as a stalled / dead scraper
+STALE_AFTER_SECONDS = 120
+
+# Compound deltas between two full snapshots
+CHECKPOINT_EVERY = 100
+
+
+class RateEstimator:
+    """Exponentially weighted throughput estimate (items per second)"""
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.rate = None
+        self._last = None
+
+    def update(self, now: float, items: int = 1) -> Optional[float]:
+        if self._last is not None and now > self._last:
+            instant = items / (now - self._last)
+            self.rate = instant if self.rate is None else self.alpha * instant + (1 - self.alpha) * self.rate
+        self._last = now
+        return self.rate
+
+
+def _new_element(now: float) -> Dict:
+    return {'total': 0, 'done': 0, 'ok': 0, 'failed': 0, 'started': now, 'elapsed': None}
+
+
+def _apply_compound(state: Dict, element: str, status: str, now: float):
+    """Count one finished compound in a snapshot state (writer and reader)"""
+    entry = state['per_element'].setdefault(element, _new_element(now))
+    entry['done'] += 1
+    state['compounds_done'] += 1
+    if status == 'ok':
+        entry['ok'] += 1
+        state['compounds_ok'] += 1
+    elif status == 'failed':
+        entry['failed'] += 1
+        state['compounds_failed'] += 1
+
+
+def _eta(state: Dict, rate: Optional[float]) -> Optional[float]:
+    remaining = max(state['compounds_total'] - state['compounds_done'], 0)
+    return (remaining / rate) if rate else None
+
+
+class ProgressManifest:
+    """Append-only progress manifest for a single scrape run"""
+
+    def __init__(self, filename: str = PROGRESS_FILE, elements: Optional[List[str]] = None):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._rate = RateEstimator()
+        self._since_checkpoint = 0
+        self.started = time.time()
+        self.state = {
+            'pid': os.getpid(),
+            'started': self.started,
+            'status': 'running',
+            'elements_total': len(elements) if elements else 0,
+            'elements_done': 0,
+            'compounds_total': 0,
+            'compounds_done': 0,
+            'compounds_ok': 0,
+            'compounds_failed': 0,
+            'per_element': {},
+            'failed_elements': []
+        }
+        self._write('start')
+
+    def _element(self, element: str) -> Dict:
+        return self.state['per_element'].setdefault(element, _new_element(time.time()))
+
+    def _append(self, record: Dict):
+        with open(self.filename, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+    def _write(self, event: str, **extra):
+        """Append a full snapshot (checkpoint)"""
+        now = time.time()
+        rate = self._rate.rate
+        self._append(dict(self.state, event=event, time=now, elapsed=now - self.started,
+                          rate_per_second=rate, eta_seconds=_eta(self.state, rate), **extra))
+        self._since_checkpoint = 0
+
+    def add_total(self, element: str, count: int):
+        """Register the number of compounds listed for an element"""
+        with self._lock:
+            self._element(element)['total'] += count
+            self.state['compounds_total'] += count
+            self._write('listed', element=element)
+
+    def compound_done(self, element: str, status: str):
+        """Record one finished compound ('ok', 'empty', 'failed' or 'skipped')"""
+        with self._lock:
+            now = time.time()
+            _apply_compound(self.state, element, status, now)
+            if status != 'skipped':
+                self._rate.update(now)
+            self._since_checkpoint += 1
+            if self._since_checkpoint >= CHECKPOINT_EVERY:
+                self._write('compound', element=element, compound_status=status)
+            else:
+                self._append({'event': 'compound', 'element': element, 'compound_status': status,
+                              'time': now, 'rate_per_second': self._rate.rate})
+
+    def element_done(self, element: str, failed: bool = False):
+        """Record the end of an element (failed = index could not be read)"""
+        with self._lock:
+            entry = self._element(element)
+            entry['elapsed'] = time.time() - entry['started']
+            self.state['elements_done'] += 1
+            if failed:
+                self.state['failed_elements'].append(element)
+            self._write('element', element=element)
+
+    def finish(self, status: str = 'complete'):
+        with self._lock:
+            self.state['status'] = status
+            self._write('finish')
+
+
+def read_latest(filename: str = PROGRESS_FILE, block_size: int = 65536) -> Optional[Dict]:
+    """
+    Read the current progress from a progress manifest.
+
+    Seeks to the end of the file and reads backwards one block at a time
+    until the last checkpoint is found, then applies the compound deltas
+    written after it, so the cost does not grow with the file.
+
+    Returns:
+        Latest snapshot dictionary with 'age_seconds' and 'alive' added,
+        or None if the manifest does not exist / is empty
+    """
+    try:
+        with open(filename, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            buffer = b''
+            while position > 0:
+                step = min(block_size, position)
+                position -= step
+                f.seek(position)
+                buffer = f.read(step) + buffer
+                # Whole lines only: the first may be cut off unless the file
+                # start was reached, the last is empty or still being written
+                complete = buffer.split(b'\n')[0 if position == 0 else 1:-1]
+                if any(b'"per_element"' in line for line in complete):
+                    break
+    except OSError:
+        return None
+
+    snapshot = None
+    deltas = []
+    for line in reversed(buffer.split(b'\n')[0 if position == 0 else 1:-1]):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if 'per_element' in record:
+            snapshot = record
+            break
+        deltas.append(record)
+    if snapshot is None:
+        return None
+
+    for delta in reversed(deltas):
+        _apply_compound(snapshot, delta['element'], delta['compound_status'], delta['time'])
+        snapshot.update(event='compound', element=delta['element'], compound_status=delta['compound_status'],
+                        time=delta['time'], elapsed=delta['time'] - snapshot['started'],
+                        rate_per_second=delta['rate_per_second'],
+                        eta_seconds=_eta(snapshot, delta['rate_per_second']))
+
+    snapshot['age_seconds'] = time.time() - snapshot.get('time', 0)
+    snapshot['alive'] = (snapshot.get('status') == 'running'
+                         and snapshot['age_seconds'] < STALE_AFTER_SECONDS
+                         and _pid_alive(snapshot.get('pid')))
+    return snapshot
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Format seconds as H:MM:SS (or '?' when unknown)"""
+    if seconds is None:
+        return '?'
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
@@ -0,0 +1,236 @@
+"""
+Cross-worker shared coefficient and grid tables.
+
+The derived arrays every worker needs (ΔG fit coefficients, off-equilibrium
+parameters, ΔG° on a standard temperature grid and the compound index) are
+published once as .npy files in a generation directory, ideally on a tmpfs
+such as /dev/shm. Workers attach read-only memory-mapped views, so the
+pages are shared through the page cache instead of copied per process.
+
+Layout:
+    <root>/CURRENT          generation number of the active tables
+    <root>/gen-<n>/*.npy    one file per array
+    <root>/gen-<n>/meta.json
+
+Publishing writes a new generation directory and then atomically replaces
+CURRENT; attached views notice the new generation on their next lookup.
+"""
+
+import os
+import json
+import time
+import shutil
+import logging
+import tempfile
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config import DEFAULT_TEMP_RANGE
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+SHARED_TABLES_DIR = os.getenv('SHARED_TABLES_DIR', os.path.join(_DEFAULT_ROOT, 'ellingham_tables'))
+
+# Columns of the 'coefficients' table
+COEFFICIENT_COLUMNS = ['A', 'B', 'C', 'n_electrons', 'nF_kJ', 'W_ph']
+
+GRID_STEP_K = 10.0  # Spacing of the standard ΔG° temperature grid
+
+# Generations kept on disk (older views may still be attached to the previous one)
+KEEP_GENERATIONS = 2
+
+
+def build_tables(data_loader, thermo_engine, grid_step_K: float = GRID_STEP_K) -> Dict[str, np.ndarray]:
+    """
+    Build the arrays to publish from the loaded Ellingham tables.
+
+    Args:
+        data_loader: JANAFDataLoader with data loaded
+        thermo_engine: ThermodynamicEngine (source of the coefficient records)
+        grid_step_K: Spacing of the ΔG° grid table
+
+    Returns:
+        Dictionary of array name -> array
+    """
+    index = data_loader.get_compound_index()
+    names: List[str] = index['names']
+
+    coefficients = np.full((len(names), len(COEFFICIENT_COLUMNS)), np.nan)
+    for row, name in enumerate(names):
+        record = thermo_engine.compute_off_equilibrium_coefficients(name)
+        if record:
+            coefficients[row] = [record[column] for column in COEFFICIENT_COLUMNS]
+
+    T_grid = np.arange(DEFAULT_TEMP_RANGE[0], DEFAULT_TEMP_RANGE[1] + grid_step_K / 2, grid_step_K)
+    A, B, C = coefficients[:, 0:1], coefficients[:, 1:2], coefficients[:, 2:3]
+    DG_grid = A + B * T_grid + C * T_grid**2
+
+    encoded = [name.encode('utf-8') for name in names]
+    name_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    name_offsets[1:] = np.cumsum([len(item) for item in encoded])
+
+    return {
+        'coefficients': coefficients,
+        'T_grid': T_grid,
+        'DG_grid': DG_grid,
+        'names_blob': np.frombuffer(b''.join(encoded), dtype=np.uint8),
+        'name_offsets': name_offsets,
+        'category_codes': np.asarray(index['category_codes'], dtype=np.int8),
+        'composition_ptr': np.asarray(index['composition_ptr']),
+        'composition_codes': np.asarray(index['composition_codes']),
+        'composition_counts': np.asarray(index['composition_counts'])
+    }
+
+
+class TableView:
+    """Read-only, memory-mapped view of one published generation."""
+
+    def __init__(self, directory: str, generation: int):
+        self.generation = generation
+        self.directory = directory
+        with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+            for name in self.meta['arrays']
+        }
+        self._names: Optional[List[str]] = None
+        self._row_of: Optional[Dict[str, int]] = None
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    @property
+    def names(self) -> List[str]:
+        if self._names is None:
+            blob = self.arrays['names_blob'].tobytes()
+            offsets = self.arrays['name_offsets']
+            self._names = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+        return self._names
+
+    def row(self, name: str) -> Optional[int]:
+        if self._row_of is None:
+            row_of = {}
+            for row, item in enumerate(self.names):
+                row_of.setdefault(item, row)
+            self._row_of = row_of
+        return self._row_of.get(name)
+
+    def coefficients(self, name: str) -> Optional[Dict]:
+        """Coefficient record for a material (same keys as get_off_equilibrium_coefficients)."""
+        row = self.row(name)
+        if row is None:
+            return None
+        values = self.arrays['coefficients'][row]
+        if np.isnan(values[0]):
+            return None
+        record = {column: float(value) for column, value in zip(COEFFICIENT_COLUMNS, values)}
+        record['n_electrons'] = int(record['n_electrons'])
+        return record
+
+
+class SharedTables:
+    """Publisher / attacher for the shared tables directory."""
+
+    def __init__(self, root: str = SHARED_TABLES_DIR, check_interval: float = 1.0):
+        """
+        Args:
+            root: Directory holding the generations
+            check_interval: Minimum seconds between checks for a new generation
+        """
+        self.root = root
+        self.check_interval = check_interval
+        self._view: Optional[TableView] = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def _current_file(self) -> str:
+        return os.path.join(self.root, 'CURRENT')
+
+    def generation(self) -> int:
+        """Active generation number (0 if nothing was published)."""
+        try:
+            with open(self._current_file, 'r', encoding='utf-8') as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def publish(self, arrays: Dict[str, np.ndarray], meta: Optional[Dict] = None) -> int:
+        """
+        Write a new generation and make it the active one.
+
+        Args:
+            arrays: Array name -> array
+            meta: Extra JSON-serializable metadata stored with the tables
+
+        Returns:
+            The new generation number
+        """
+        import fcntl
+
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, '.lock'), 'w') as lock:
+            # Serialize publishers (e.g. several workers reloading at once)
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            generation = self.generation() + 1
+            final_dir = os.path.join(self.root, f"gen-{generation}")
+            tmp_dir = tempfile.mkdtemp(prefix=f".gen-{generation}-", dir=self.root)
+            for name, array in arrays.items():
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), np.ascontiguousarray(array))
+            with open(os.path.join(tmp_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump(dict(meta or {}, arrays=sorted(arrays), generation=generation,
+                               published=time.time(), pid=os.getpid()), f)
+            if os.path.exists(final_dir):
+                # Left over from a run whose CURRENT was reset
+                shutil.rmtree(final_dir, ignore_errors=True)
+            os.replace(tmp_dir, final_dir)
+
+            tmp_current = f"{self._current_file}.{os.getpid()}"
+            with open(tmp_current, 'w', encoding='utf-8') as f:
+                f.write(str(generation))
+            os.replace(tmp_current, self._current_file)
+
+            self._prune(generation)
+
+        self._checked = 0.0
+        logger.info("Published shared tables generation %d to %s", generation, final_dir)
+        return generation
+
+    def _prune(self, generation: int):
+        for entry in os.listdir(self.root):
+            if entry.startswith('gen-'):
+                try:
+                    number = int(entry[4:])
+                except ValueError:
+                    continue
+                if number <= generation - KEEP_GENERATIONS:
+                    # Mapped pages stay valid for views still attached to it
+                    shutil.rmtree(os.path.join(self.root, entry), ignore_errors=True)
+
+    def view(self) -> Optional[TableView]:
+        """
+        Current view, re-attached when a newer generation was published.
+
+        Returns:
+            TableView, or None if no tables were published
+        """
+        now = time.monotonic()
+        if self._view is not None and now - self._checked < self.check_interval:
+            return self._view
+
+        with self._lock:
+            self._checked = now
+            generation = self.generation()
+            if generation == 0:
+                self._view = None
+            elif self._view is None or self._view.generation != generation:
+                try:
+                    self._view = TableView(os.path.join(self.root, f"gen-{generation}"), generation)
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning("Could not attach shared tables generation %d: %s", generation, e)
+            return self._view
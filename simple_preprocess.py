@@ -8,6 +8,7 @@ import pickle
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
+from compound_index import categorize_formula, build_compound_index
 
 def load_janaf_data(filename: str = "janaf_full_database.pkl"):
     """Load the full JANAF database"""
@@ -38,28 +39,10 @@ def categorize_compounds(data: Dict) -> Dict[str, List]:
     for element, compounds in data.items():
         for compound_data in compounds:
             compound_info = compound_data['compound']
-            name = compound_info['name'].lower()
-            formula = compound_info['formula'].lower()
             
-            # Categorize based on name and formula
-            if 'oxide' in name or ('o' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k'])):
-                categories['oxides'].append(compound_data)
-            elif 'carbide' in name or ('c' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k'])):
-                categories['carbides'].append(compound_data)
-            elif 'nitride' in name or ('n' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k'])):
-                categories['nitrides'].append(compound_data)
-            elif any(halide in name for halide in ['fluoride', 'chloride', 'bromide', 'iodide']):
-                categories['halides'].append(compound_data)
-            elif 'hydride' in name or ('h' in formula and len(formula) > 1):
-                categories['hydrides'].append(compound_data)
-            elif 'sulfide' in name or ('s' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k'])):
-                categories['sulfides'].append(compound_data)
-            elif 'phosphide' in name or ('p' in formula and any(metal in formula for metal in ['ti', 'al', 'fe', 'ni', 'cr', 'mo', 'w', 'v', 'nb', 'ta', 'zr', 'hf', 'si', 'mg', 'ca', 'sr', 'ba', 'be', 'cu', 'zn', 'hg', 'pb', 'co', 'mn', 'li', 'na', 'k'])):
-                categories['phosphides'].append(compound_data)
-            elif element.lower() in name and len(name.split()) == 1:
-                categories['pure_elements'].append(compound_data)
-            else:
-                categories['other'].append(compound_data)
+            # Categorize from the parsed composition (cached per formula)
+            category = categorize_formula(compound_info['formula'], compound_info['name'])
+            categories[category].append(compound_data)
     
     # Print categorization summary
     print("\nCompound Categorization Summary:")
@@ -349,7 +332,10 @@ def create_ellingham_tables(categories: Dict[str, List]) -> Dict:
     
     # Correct the total count to match actual processed compounds
     ellingham_tables['metadata']['total_compounds'] = len(ellingham_tables['compound_lookup'])
-    
+
+    # Integer-coded element/category/non-metal indexes for fast UI filtering
+    ellingham_tables['compound_index'] = build_compound_index(ellingham_tables)
+
     return ellingham_tables
 
 def main():
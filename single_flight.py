@@ -0,0 +1,221 @@
+"""
+Single-flight request coalescing for expensive callbacks.
+
+When many users open the same view at once, identical callback invocations
+arrive together. Within a worker, only the first call with a given key is
+computed; concurrent callers with the same key wait for it and share the
+result. Optionally, workers also coordinate through lock files in a shared
+directory: the first worker computes and leaves the pickled result behind
+for a few seconds, the others wait on the lock and read it.
+
+Results are read back with pickle, so the shared directory must only be
+writable by the user the workers run as: it is created with mode 0700 and
+ignored (per-worker coalescing only) if another user owns it.
+"""
+
+import os
+import json
+import time
+import pickle
+import hashlib
+import logging
+import functools
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from callback_metrics import record_cache_event
+
+logger = logging.getLogger(__name__)
+
+# Directory for cross-worker coordination (unset = per-worker coalescing only)
+SINGLE_FLIGHT_DIR = os.getenv('SINGLE_FLIGHT_DIR')
+
+# How long a result left by another worker may be reused
+SINGLE_FLIGHT_RESULT_TTL = float(os.getenv('SINGLE_FLIGHT_RESULT_TTL', 5.0))
+
+
+def _normalize(value):
+    # The browser may send 1 for a value the server wrote as 1.0
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, int):
+        return float(value)
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    return value
+
+
+def canonical_key(*parts) -> str:
+    """Stable hash of JSON-serializable callback inputs."""
+    payload = json.dumps(_normalize(parts), sort_keys=True, default=repr, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def private_directory(path: str) -> bool:
+    """
+    Create path with mode 0700, or make sure an existing one is private.
+
+    Returns:
+        False if the directory is owned by another user or is not a directory
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    import stat
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        return False
+    if info.st_mode & 0o077:
+        os.chmod(path, 0o700)
+    return True
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key."""
+
+    def __init__(self, directory: Optional[str] = SINGLE_FLIGHT_DIR,
+                 result_ttl: float = SINGLE_FLIGHT_RESULT_TTL):
+        self.directory = directory
+        self.result_ttl = result_ttl
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.stats = {'calls': 0, 'computed': 0, 'shared': 0, 'shared_across_workers': 0}
+        if directory and not private_directory(directory):
+            logger.warning("SINGLE_FLIGHT_DIR %s is owned by another user or is not a directory; "
+                           "coalescing within each worker only", directory)
+            self.directory = None
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Run func once per key among concurrent callers.
+
+        Args:
+            key: Canonical key of the computation
+            func: Zero-argument callable producing the result
+
+        Returns:
+            The (possibly shared) result; exceptions are re-raised in every caller
+        """
+        with self._lock:
+            self.stats['calls'] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.stats['shared'] += 1
+
+        if not leader:
+            record_cache_event('shared')
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run(key, func)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def _run(self, key: str, func: Callable[[], Any]) -> Any:
+        if not self.directory:
+            self._count('computed')
+            return func()
+
+        if self.stats['calls'] % 256 == 0:
+            self._prune()
+
+        import fcntl
+
+        lock_path = os.path.join(self.directory, f"{key}.lock")
+        result_path = os.path.join(self.directory, f"{key}.pkl")
+        with open(lock_path, 'w') as lock:
+            # Blocks while another worker computes the same key
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if time.time() - os.path.getmtime(result_path) < self.result_ttl:
+                    with open(result_path, 'rb') as f:
+                        result = pickle.load(f)
+                    self._count('shared_across_workers')
+                    record_cache_event('shared')
+                    return result
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+
+            self._count('computed')
+            result = func()
+            try:
+                tmp_path = f"{result_path}.{os.getpid()}"
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, result_path)
+            except (OSError, pickle.PicklingError, TypeError, AttributeError):
+                # Unpicklable results are simply not shared across workers
+                pass
+            return result
+
+    def _prune(self):
+        """Remove coordination files well past their TTL."""
+        cutoff = time.time() - max(self.result_ttl * 10, 60)
+        for entry in os.listdir(self.directory):
+            path = os.path.join(self.directory, entry)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+
+_default = SingleFlight()
+
+
+def coalesce(name: Optional[str] = None, key_func: Optional[Callable] = None,
+             flight: Optional[SingleFlight] = None):
+    """
+    Decorator coalescing identical concurrent calls of a callback.
+
+    Args:
+        name: Key namespace (defaults to the function name)
+        key_func: Optional callable(*args, **kwargs) returning the key material,
+            for callbacks whose result depends on less (or more, e.g. the
+            triggering inputs) than their arguments
+        flight: SingleFlight instance (defaults to the module-wide one)
+    """
+    def decorator(func):
+        namespace = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            material = key_func(*args, **kwargs) if key_func else (args, kwargs)
+            key = canonical_key(namespace, material)
+            return (flight or _default).do(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+    return decorator
+
+
+def single_flight_stats() -> Dict[str, int]:
+    """Counters of the module-wide SingleFlight."""
+    with _default._lock:
+        return dict(_default.stats)
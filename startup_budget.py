@@ -0,0 +1,91 @@
+"""
+Cold-start budget check for app.py.
+
+Imports the app in fresh interpreters a few times and fails (exit status 1)
+when the median import time exceeds the budget or when a module that is
+meant to be deferred to first use is imported at startup. Run it before
+deploying or in CI:
+
+    python startup_budget.py              # default budget
+    python startup_budget.py --budget 1.5 --runs 5
+"""
+
+import os
+import sys
+import json
+import statistics
+import subprocess
+from typing import Dict, List
+
+# Median cold import time of app.py allowed on the reference container (seconds)
+STARTUP_BUDGET_SECONDS = float(os.getenv('STARTUP_BUDGET_SECONDS', 2.0))
+
+# Heavy or rarely used modules that must only be imported on first use
+# (custom_compounds and custom_compound_ui stay eager: the layout needs them)
+DEFERRED_MODULES = ['pandas', 'plotly.express', 'kaleido', 'documentation', 'commodity_prices',
+                    'validation_module']
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(json.dumps({'import_seconds': elapsed, 'phases': app.startup_phases,
+                  'deferred_loaded': [m for m in json.loads(sys.argv[1]) if m in sys.modules]}))
+"""
+
+
+def measure_cold_start(runs: int = 3) -> List[Dict]:
+    """
+    Import app.py in `runs` fresh interpreters.
+
+    Returns:
+        One dictionary per run (import_seconds, phases, deferred_loaded)
+    """
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, IMPORT_PROFILE='0')
+    results = []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-c', _CHILD, json.dumps(DEFERRED_MODULES)],
+                              cwd=app_dir, env=env, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"importing app failed:\n{proc.stderr[-2000:]}")
+        # The app prints during import; the measurement is the last line
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def check_startup_budget(budget: float = STARTUP_BUDGET_SECONDS, runs: int = 3) -> bool:
+    """
+    Print a cold-start report and return whether it is within budget.
+    """
+    results = measure_cold_start(runs)
+    median = statistics.median(r['import_seconds'] for r in results)
+    deferred = sorted({m for r in results for m in r['deferred_loaded']})
+
+    print(f"Cold import of app.py over {runs} runs: median {median:.2f}s "
+          f"(min {min(r['import_seconds'] for r in results):.2f}s), budget {budget:.2f}s")
+    for phase, seconds in results[-1]['phases'].items():
+        print(f"  {phase:15s} {seconds:6.3f}s")
+
+    ok = True
+    if median > budget:
+        print(f"❌ Startup over budget by {median - budget:.2f}s "
+              f"(run with IMPORT_PROFILE=1 to see the import-time tree)")
+        ok = False
+    if deferred:
+        print(f"❌ Deferred modules imported at startup: {', '.join(deferred)}")
+        ok = False
+    if ok:
+        print("✅ Startup within budget")
+    return ok
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check app.py cold-start time against a budget")
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET_SECONDS, help="Allowed median seconds")
+    parser.add_argument('--runs', type=int, default=3, help="Number of fresh interpreters")
+    args = parser.parse_args()
+    sys.exit(0 if check_startup_budget(args.budget, args.runs) else 1)
@@ -0,0 +1,126 @@
+"""
+Startup profiling: import-time tree and boot phase timings.
+
+Set IMPORT_PROFILE=1 to record every first-time import made while app.py
+loads, nested by the import that triggered it, and print the tree once the
+app module finished importing (imports below IMPORT_PROFILE_MIN_MS are
+folded into their parent). Set IMPORT_PROFILE_FILE to also write it to a
+file. Boot phases (imports, data load, layout, ...) are always timed with
+mark() and reported on /ready.
+"""
+
+import os
+import sys
+import time
+import builtins
+import threading
+from typing import Dict, List, Optional
+
+IMPORT_PROFILE = os.getenv('IMPORT_PROFILE', '').lower() in ('1', 'true', 'yes')
+IMPORT_PROFILE_MIN_MS = float(os.getenv('IMPORT_PROFILE_MIN_MS', 5.0))
+IMPORT_PROFILE_FILE = os.getenv('IMPORT_PROFILE_FILE')
+
+_phase_started = time.perf_counter()
+startup_phases: Dict[str, float] = {}
+
+
+def mark(phase: str):
+    """Record the time since the previous mark under a phase name (seconds)."""
+    global _phase_started
+    now = time.perf_counter()
+    startup_phases[phase] = round(now - _phase_started, 3)
+    _phase_started = now
+
+
+class _Node:
+    __slots__ = ('name', 'seconds', 'children')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.children: List['_Node'] = []
+
+
+class ImportProfiler:
+    """Wraps builtins.__import__ to time first-time imports as a tree."""
+
+    def __init__(self):
+        self.root = _Node('<startup>')
+        self._stack = [self.root]
+        self._original = None
+        self._thread = None
+        self._started = 0.0
+
+    def install(self):
+        self._original = builtins.__import__
+        self._thread = threading.get_ident()
+        self._started = time.perf_counter()
+        builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self.root.seconds = time.perf_counter() - self._started
+            self._original = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Only the importing (main) thread is profiled, and only imports that load something
+        if threading.get_ident() != self._thread or (level == 0 and name in sys.modules):
+            return self._original(name, globals, locals, fromlist, level)
+
+        node = _Node(name if level == 0 else f"{'.' * level}{name}")
+        self._stack.append(node)
+        start = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            node.seconds = time.perf_counter() - start
+            self._stack.pop()
+            self._stack[-1].children.append(node)
+
+    def format_tree(self, min_ms: float = IMPORT_PROFILE_MIN_MS) -> str:
+        """Indented tree of cumulative import times, slowest first."""
+        lines = []
+
+        def walk(node: _Node, depth: int):
+            children = sorted(node.children, key=lambda child: child.seconds, reverse=True)
+            shown = [child for child in children if child.seconds * 1000 >= min_ms]
+            for child in shown:
+                lines.append(f"{child.seconds * 1000:9.1f} ms  {'  ' * depth}{child.name}")
+                walk(child, depth + 1)
+            folded = len(children) - len(shown)
+            if folded:
+                rest = sum(child.seconds for child in children) - sum(child.seconds for child in shown)
+                lines.append(f"{rest * 1000:9.1f} ms  {'  ' * depth}({folded} smaller imports)")
+
+        lines.append(f"{self.root.seconds * 1000:9.1f} ms  {self.root.name}")
+        walk(self.root, 1)
+        return '\n'.join(lines)
+
+
+_profiler: Optional[ImportProfiler] = None
+
+
+def start_import_profile():
+    """Start the import profiler if IMPORT_PROFILE is set."""
+    global _profiler
+    if IMPORT_PROFILE and _profiler is None:
+        _profiler = ImportProfiler()
+        _profiler.install()
+
+
+def finish_import_profile():
+    """Stop the import profiler and dump its tree (no-op when not profiling)."""
+    global _profiler
+    if _profiler is None:
+        return
+    _profiler.uninstall()
+    tree = _profiler.format_tree()
+    _profiler = None
+    print(f"📦 Import-time tree (imports under {IMPORT_PROFILE_MIN_MS:g} ms folded):\n{tree}", file=sys.stderr)
+    if IMPORT_PROFILE_FILE:
+        try:
+            with open(IMPORT_PROFILE_FILE, 'w', encoding='utf-8') as f:
+                f.write(tree + '\n')
+        except OSError as e:
+            print(f"⚠️ Could not write import profile to {IMPORT_PROFILE_FILE}: {e}", file=sys.stderr)
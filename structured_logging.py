@@ -0,0 +1,219 @@
+"""
+Structured, queued logging with rate limiting and request correlation IDs.
+
+Modules log through `logging.getLogger(__name__)` with lazy %-style
+arguments, so a message below the configured level costs one level check.
+configure_logging() installs a single root handler that only enqueues
+records; a listener thread formats and writes them, so request threads never
+block on stdout. On top of that:
+
+- repeated warnings (same call site and message template) are emitted at
+  most once per LOG_RATE_LIMIT_SECONDS, with a count of the suppressed ones
+- every record carries the request ID of the HTTP request that produced it
+  (taken from an incoming X-Request-ID header or generated, and echoed in
+  the response), see init_request_ids()
+- LOG_FORMAT=json writes one JSON object per line for log aggregation
+
+The queue is bounded (LOG_QUEUE_SIZE); records arriving while it is full
+are dropped and counted rather than blocking the request.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import queue
+import atexit
+import logging
+import threading
+import contextvars
+import logging.handlers
+from typing import Dict
+
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()  # 'text' or 'json'
+LOG_RATE_LIMIT_SECONDS = float(os.getenv('LOG_RATE_LIMIT_SECONDS', 60))
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+
+# Distinct call sites tracked by the rate limiter
+MAX_RATE_LIMIT_KEYS = 1024
+
+_VALID_REQUEST_ID = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+_request_id: contextvars.ContextVar = contextvars.ContextVar('request_id', default='-')
+
+_stats = {'dropped': 0, 'suppressed': 0}
+
+
+def current_request_id() -> str:
+    """Correlation ID of the request being served ('-' outside requests)."""
+    return _request_id.get()
+
+
+def log_stats() -> Dict[str, int]:
+    """Records dropped on a full queue and warnings suppressed by rate limiting."""
+    return dict(_stats)
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamps records with the current request ID (runs in the calling thread, before queuing)."""
+
+    def filter(self, record):
+        record.request_id = _request_id.get()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets a repeated warning through at most once per interval."""
+
+    def __init__(self, interval: float = LOG_RATE_LIMIT_SECONDS, min_level: int = logging.WARNING):
+        super().__init__()
+        self.interval = interval
+        self.min_level = min_level
+        self._seen: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno < self.min_level or self.interval <= 0:
+            return True
+        # The unformatted template, so the same warning with other arguments counts as a repeat
+        key = (record.name, record.pathname, record.lineno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._seen.get(key)
+            if entry is not None and now - entry[0] < self.interval:
+                entry[1] += 1
+                _stats['suppressed'] += 1
+                return False
+            if entry is None and len(self._seen) >= MAX_RATE_LIMIT_KEYS:
+                self._seen.pop(next(iter(self._seen)))
+            self._seen[key] = [now, 0]
+        if entry is not None and entry[1]:
+            record.suppressed = entry[1]
+        return True
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _stats['dropped'] += 1
+
+
+def _suffix(record) -> str:
+    suppressed = getattr(record, 'suppressed', 0)
+    return f" ({suppressed} similar messages suppressed)" if suppressed else ''
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)-7s [%(request_id)s] %(name)s: %(message)s')
+
+    def format(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = '-'
+        return super().format(record) + _suffix(record)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage() + _suffix(record),
+            'request_id': getattr(record, 'request_id', '-'),
+            'pid': record.process,
+            'thread': record.threadName
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def make_queue_handler(stream=None, fmt: str = LOG_FORMAT,
+                       rate_limit: float = LOG_RATE_LIMIT_SECONDS, maxsize: int = LOG_QUEUE_SIZE):
+    """
+    A queue handler (with request ID and rate limit filters) and its started listener.
+
+    Args:
+        stream: Where the listener writes (default stdout)
+        fmt: 'text' or 'json'
+        rate_limit: Seconds between repeats of the same warning (0 disables)
+        maxsize: Queue bound
+
+    Returns:
+        (handler, listener)
+    """
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == 'json' else TextFormatter())
+
+    handler = _DroppingQueueHandler(queue.Queue(maxsize))
+    handler.addFilter(RequestIdFilter())
+    handler.addFilter(RateLimitFilter(rate_limit))
+    listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=False)
+    listener.start()
+    return handler, listener
+
+
+_configured = {'handler': None, 'listener': None}
+_configure_lock = threading.Lock()
+
+
+def configure_logging(level: str = LOG_LEVEL, fmt: str = LOG_FORMAT, stream=None):
+    """
+    Install the queued root handler once per process (later calls only set the level).
+
+    The listener thread does not survive fork, so a new queue and listener
+    are started in forked children (gunicorn workers with preload_app).
+    """
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, str(level).upper(), logging.INFO))
+    with _configure_lock:
+        if _configured['handler'] is not None:
+            return
+        handler, listener = make_queue_handler(stream, fmt)
+        root.addHandler(handler)
+        _configured.update(handler=handler, listener=listener)
+
+    def restart_after_fork():
+        # The parent's queue may have been locked mid-put at fork time
+        handler.queue = queue.Queue(handler.queue.maxsize)
+        new_listener = logging.handlers.QueueListener(handler.queue, *_configured['listener'].handlers,
+                                                      respect_handler_level=False)
+        new_listener.start()
+        _configured['listener'] = new_listener
+
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=restart_after_fork)
+    # Flush what is still queued on exit
+    atexit.register(lambda: _configured['listener'].stop())
+
+
+def init_request_ids(server):
+    """Assign each Flask request a correlation ID (X-Request-ID in and out)."""
+    from flask import request, g
+
+    @server.before_request
+    def _assign_request_id():
+        incoming = request.headers.get('X-Request-ID', '')
+        request_id = incoming if _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex[:16]
+        g.request_id_token = _request_id.set(request_id)
+
+    @server.after_request
+    def _echo_request_id(response):
+        response.headers['X-Request-ID'] = _request_id.get()
+        return response
+
+    @server.teardown_request
+    def _reset_request_id(exc=None):
+        token = g.pop('request_id_token', None)
+        if token is not None:
+            _request_id.reset(token)
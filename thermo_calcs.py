@@ -3,17 +3,32 @@ Thermodynamic calculations for equilibrium and off-equilibrium Ellingham diagram
 Implements the plasma flash reactor model for electric field-enhanced reduction.
 """
 
+import logging
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from data_loader import JANAFDataLoader
 from config import FARADAY_CONSTANT, W_PH_CONSTANTS, GAS_RATIO_TEMPS
+from curve_sampling import adaptive_grid
+
+logger = logging.getLogger(__name__)
 
 
 class ThermodynamicEngine:
     """Handles thermodynamic calculations for Ellingham diagrams."""
     
-    def __init__(self, data_loader: JANAFDataLoader):
+    def __init__(self, data_loader: JANAFDataLoader, shared_tables=None):
         self.data_loader = data_loader
+        # Optional shared_tables.SharedTables with precomputed coefficient/grid tables
+        self.shared_tables = shared_tables
+        # Dataset version the tables must have been published for (set by the dataset registry)
+        self.dataset_version = None
+    
+    def _table_view(self):
+        view = self.shared_tables.view() if self.shared_tables is not None else None
+        if view is not None and self.dataset_version and view.meta.get('dataset_version') != self.dataset_version:
+            # Tables of another version (mid hot swap): fall back to in-process data
+            return None
+        return view
         
     def calc_equilibrium_DG(self, oxide_key: str, T_K: np.ndarray) -> np.ndarray:
         """
@@ -66,6 +81,128 @@ class ThermodynamicEngine:
         
         return DG_eff
     
+    def get_off_equilibrium_coefficients(self, oxide_key: str) -> Optional[Dict]:
+        """
+        Get the closed-form parameters behind calc_off_equilibrium_DG.
+        
+        ΔG_eff(T,E,r) = A + B*T + C*T² - n*F*E*r/1000 - W_ph, so these few
+        numbers are enough to re-evaluate a curve for any E and r (used by
+        the clientside slider mode). Read from the shared tables when they
+        are attached, otherwise computed from the loaded data.
+        
+        Args:
+            oxide_key: Oxide identifier
+            
+        Returns:
+            Dictionary with A, B, C, n_electrons, nF_kJ (n*F/1000) and W_ph,
+            or None if the material is unknown
+        """
+        view = self._table_view()
+        if view is not None:
+            record = view.coefficients(oxide_key)
+            if record is not None:
+                return record
+        return self.compute_off_equilibrium_coefficients(oxide_key)
+    
+    def compute_off_equilibrium_coefficients(self, oxide_key: str) -> Optional[Dict]:
+        """Coefficient record for get_off_equilibrium_coefficients, computed from the loaded data."""
+        material_data = self.data_loader.get_material_data(oxide_key)
+        oxide_data = self.data_loader.get_oxide_data(oxide_key)
+        if not material_data or oxide_data is None:
+            return None
+        
+        gibbs_data = material_data.get('thermo_data', {}).get('gibbs_data', {})
+        fit_coeffs = gibbs_data.get('fit_coefficients')
+        if fit_coeffs:
+            A, B, C = fit_coeffs['A'], fit_coeffs['B'], fit_coeffs['C']
+        else:
+            # Same constant fallback as interpolate_DG
+            A, B, C = gibbs_data.get('min_gibbs', 0.0), 0.0, 0.0
+        
+        n_electrons = oxide_data['n_electrons']
+        return {
+            'A': float(A),
+            'B': float(B),
+            'C': float(C),
+            'n_electrons': n_electrons,
+            'nF_kJ': n_electrons * FARADAY_CONSTANT / 1000,
+            'W_ph': float(self._get_W_ph(oxide_key))
+        }
+    
+    def get_DG_breakpoints(self, oxide_key: str) -> List[float]:
+        """
+        Temperatures where ΔG°(T) may change character and must be sampled.
+        
+        Includes the limits of the fitted data range and, for piecewise fits,
+        segment boundaries / phase transitions ('breakpoints' in gibbs_data).
+        
+        Args:
+            oxide_key: Material identifier
+            
+        Returns:
+            Sorted list of temperatures in Kelvin
+        """
+        material_data = self.data_loader.get_material_data(oxide_key)
+        if not material_data:
+            return []
+        
+        gibbs_data = material_data.get('thermo_data', {}).get('gibbs_data', {})
+        points = list(gibbs_data.get('breakpoints', []))
+        for key in ('min_temp', 'max_temp'):
+            if gibbs_data.get(key) is not None:
+                points.append(gibbs_data[key])
+        return sorted(float(t) for t in points)
+    
+    def sample_temperatures(self, oxide_key: str, T_min: float, T_max: float, **kwargs) -> np.ndarray:
+        """
+        Adaptive temperature grid for a material's ΔG curves.
+        
+        ΔG_eff differs from ΔG° by a temperature-independent shift, so the same
+        grid serves the equilibrium and off-equilibrium curves.
+        
+        Args:
+            oxide_key: Material identifier
+            T_min, T_max: Temperature range in Kelvin
+            **kwargs: Passed to curve_sampling.adaptive_grid (tol, max_points, ...)
+            
+        Returns:
+            Sorted temperature array in Kelvin
+        """
+        return adaptive_grid(lambda T: self.calc_equilibrium_DG(oxide_key, T), T_min, T_max,
+                             breakpoints=self.get_DG_breakpoints(oxide_key), **kwargs)
+    
+    def calc_off_equilibrium_DG_frames(self, oxide_keys: List[str], T_K: np.ndarray,
+                                       E_values: np.ndarray, r_values: np.ndarray) -> np.ndarray:
+        """
+        Evaluate ΔG_eff for several materials over a grid of fields and radii at once.
+        
+        Args:
+            oxide_keys: Material identifiers
+            T_K: Temperature array in Kelvin (n_T)
+            E_values: Electric fields in V/m (n_E)
+            r_values: Particle radii in m (n_r)
+            
+        Returns:
+            Array of shape (n_materials, n_r, n_E, n_T) in kJ/mol O₂
+            (NaN rows for unknown materials)
+        """
+        T_K = np.asarray(T_K, dtype=float)
+        E_values = np.asarray(E_values, dtype=float)
+        r_values = np.asarray(r_values, dtype=float)
+        
+        records = [self.get_off_equilibrium_coefficients(key) for key in oxide_keys]
+        nan = float('nan')
+        A = np.array([rec['A'] if rec else nan for rec in records])
+        B = np.array([rec['B'] if rec else nan for rec in records])
+        C = np.array([rec['C'] if rec else nan for rec in records])
+        nF_kJ = np.array([rec['nF_kJ'] if rec else nan for rec in records])
+        W_ph = np.array([rec['W_ph'] if rec else nan for rec in records])
+        
+        DG_eq = A[:, None] + B[:, None] * T_K[None, :] + C[:, None] * T_K[None, :]**2
+        shift = nF_kJ[:, None, None] * r_values[None, :, None] * E_values[None, None, :] + W_ph[:, None, None]
+        
+        return DG_eq[:, None, None, :] - shift[..., None]
+    
     def calc_off_equilibrium_DG_with_validation(self, oxide_key: str, T_K: np.ndarray, 
                                                E: float, r: float) -> Tuple[np.ndarray, Dict]:
         """
@@ -407,11 +544,19 @@ class ThermodynamicEngine:
         Returns:
             Crossover temperature in Kelvin, or None if no crossover
         """
-        # Create temperature range for root finding
-        T_range = np.linspace(300, 2400, 1000)
-        
-        # Calculate off-equilibrium Gibbs free energy
-        DG_eff = self.calc_off_equilibrium_DG(oxide_key, T_range, E, r)
+        # Use the shared ΔG° grid table when available
+        view = self._table_view()
+        row = view.row(oxide_key) if view is not None else None
+        if row is not None and not np.isnan(view['coefficients'][row, 0]):
+            nF_kJ, W_ph = view['coefficients'][row, 4:6]
+            T_range = np.asarray(view['T_grid'])
+            DG_eff = view['DG_grid'][row] - nF_kJ * E * r - W_ph
+        else:
+            # Create temperature range for root finding
+            T_range = np.linspace(300, 2400, 1000)
+            
+            # Calculate off-equilibrium Gibbs free energy
+            DG_eff = self.calc_off_equilibrium_DG(oxide_key, T_range, E, r)
         
         # Find where DG_eff crosses zero
         zero_crossings = np.where(np.diff(np.sign(DG_eff)))[0]
@@ -525,7 +670,8 @@ class ThermodynamicEngine:
             return K_H
             
         except Exception as e:
-            print(f"Warning: Could not calculate K_H from JANAF data: {e}")
+            # Rate-limited by the logging setup: this runs on every info panel update
+            logger.warning("Could not calculate K_H from JANAF data: %r", e)
             return self._calc_h2_h2o_constant_standard(T_K)
     
     def _calc_h2_h2o_constant_standard(self, T_K: np.ndarray) -> np.ndarray:
@@ -237,11 +237,22 @@ def export_data_to_csv(oxide_data: Dict, filename: str) -> str:
 
 
 def create_info_text(validation_results: List[Dict], gas_composition: str = 'N2_H2_25', 
-                    entry_temp_K: float = 300, h2_pressure: float = 0.25, target_conversion: float = 0.95) -> str:
-    """Create formatted info text for display with confidence levels and validation."""
+                    entry_temp_K: float = 300, h2_pressure: float = 0.25, target_conversion: float = 0.95,
+                    thermo_engine=None) -> str:
+    """Create formatted info text for display with confidence levels and validation.
+
+    thermo_engine is the engine of the dataset version being reported on (the
+    app passes its request-pinned proxy); the JANAF data is loaded from disk
+    only when it is omitted.
+    """
     if not validation_results:
         return "No data to display"
     
+    if thermo_engine is None:
+        from thermo_calcs import ThermodynamicEngine
+        from data_loader import load_janaf_data
+        thermo_engine = ThermodynamicEngine(load_janaf_data())
+    
     # Import required modules
     from config import GAS_COMPOSITION_PRESETS, VALIDATION_SETTINGS
     from documentation import get_confidence_indicator, format_validation_warning
@@ -415,13 +426,6 @@ def create_info_text(validation_results: List[Dict], gas_composition: str = 'N2_
         
         # Calculate kinetic parameters with flash state
         try:
-            from thermo_calcs import ThermodynamicEngine
-            from data_loader import load_janaf_data
-            
-            # Initialize thermodynamic engine
-            data_loader = load_janaf_data()
-            thermo_engine = ThermodynamicEngine(data_loader)
-            
             kinetic_analysis = thermo_engine.calc_kinetic_analysis(
                 material_key, np.array([T_K]), E_V_m, r_m, h2_fraction, flash_state=True
             )
@@ -480,14 +484,8 @@ def create_info_text(validation_results: List[Dict], gas_composition: str = 'N2_
         
         # Calculate residence time analysis for this material
         try:
-            from thermo_calcs import ThermodynamicEngine
-            from data_loader import load_janaf_data
             from config import TUBE_LENGTH, TUBE_DIAMETER, GAS_VELOCITY
             
-            # Initialize thermodynamic engine
-            data_loader = load_janaf_data()
-            thermo_engine = ThermodynamicEngine(data_loader)
-            
             residence_analysis = thermo_engine.calc_residence_time_analysis(
                 material_key, T_K, E_V_m, r_m, h2_fraction, 
                 TUBE_LENGTH, TUBE_DIAMETER, GAS_VELOCITY
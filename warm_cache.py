@@ -0,0 +1,182 @@
+"""
+Warm cache of precomputed callback results with on-disk snapshots.
+
+At boot the app precomputes the default views (default materials at the
+preset fields and radii) into a WarmCache. The cache is saved as a
+versioned snapshot; on the next boot a snapshot whose version matches the
+current code, data and configuration is memory-mapped and loaded instead of
+recomputing. Only results recorded during warm-up are kept, so the cache
+stays bounded.
+
+Snapshot format: one JSON header line ({'version', 'created', 'entries'})
+followed by the pickled {key: result} dictionary.
+"""
+
+import os
+import json
+import mmap
+import logging
+import time
+import pickle
+import hashlib
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+from single_flight import canonical_key
+from callback_metrics import record_cache_event
+
+WARM_CACHE_FILE = os.getenv('WARM_CACHE_FILE', 'warm_cache.snapshot')
+
+# Bump when the snapshot layout changes
+SNAPSHOT_FORMAT = 1
+
+_MISSING = object()
+
+
+def snapshot_version(source_files: Iterable[str], data_file: Optional[str] = None, extra: Any = None) -> str:
+    """
+    Version string for a snapshot.
+
+    Changes whenever any of the given source files, the data file (size and
+    mtime) or the extra material (e.g. app version, config values) change.
+    """
+    digest = hashlib.sha1(f"format={SNAPSHOT_FORMAT}".encode())
+    for path in source_files:
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(f"missing:{path}".encode())
+    if data_file:
+        try:
+            stat = os.stat(data_file)
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        except OSError:
+            digest.update(b'no-data')
+    digest.update(json.dumps(extra, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()[:16]
+
+
+class WarmCache:
+    """Bounded cache of warm-up results, persisted as a versioned snapshot."""
+
+    def __init__(self, path: str = WARM_CACHE_FILE, version: str = ''):
+        self.path = path
+        self.version = version
+        self._entries: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        # Recording is per thread, so concurrent requests never store entries
+        self._local = threading.local()
+        self.stats = {'hits': 0, 'misses': 0, 'entries': 0, 'snapshot': None}
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        value = self._entries.get(key, _MISSING)
+        with self._lock:
+            self.stats['hits' if value is not _MISSING else 'misses'] += 1
+        return (value is not _MISSING), (None if value is _MISSING else value)
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self.stats['entries'] = len(self._entries)
+
+    @property
+    def recording(self) -> bool:
+        return getattr(self._local, 'recording', False)
+
+    @contextmanager
+    def record(self):
+        """Within this block, results of @warm_cached callbacks called by this thread are stored."""
+        self._local.recording = True
+        try:
+            yield self
+        finally:
+            self._local.recording = False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.stats['entries'] = 0
+
+    def load_snapshot(self) -> bool:
+        """
+        Load the snapshot if its version matches.
+
+        Returns:
+            True if entries were loaded
+        """
+        try:
+            with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header_end = mm.find(b'\n')
+                header = json.loads(mm[:header_end])
+                if header.get('version') != self.version:
+                    self.stats['snapshot'] = 'stale'
+                    return False
+                view = memoryview(mm)
+                try:
+                    entries = pickle.loads(view[header_end + 1:])
+                finally:
+                    view.release()
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError) as e:
+            self.stats['snapshot'] = 'missing' if isinstance(e, FileNotFoundError) else f'unreadable: {e}'
+            return False
+
+        with self._lock:
+            self._entries.update(entries)
+            self.stats['entries'] = len(self._entries)
+        self.stats['snapshot'] = 'loaded'
+        return True
+
+    def save_snapshot(self) -> bool:
+        """Atomically write the current entries as a snapshot."""
+        with self._lock:
+            entries = dict(self._entries)
+        header = {'version': self.version, 'created': time.time(), 'entries': len(entries)}
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b'\n')
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning("Could not save warm cache snapshot: %s", e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        self.stats['snapshot'] = 'saved'
+        return True
+
+
+def warm_cached(cache: WarmCache, name: Optional[str] = None, key_func: Optional[Callable] = None):
+    """
+    Decorator serving a callback from the warm cache.
+
+    Args:
+        cache: WarmCache to consult (results are stored only while recording)
+        name: Key namespace (defaults to the function name)
+        key_func: Optional callable(*args, **kwargs) returning the key material
+    """
+    def decorator(func):
+        namespace = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            material = key_func(*args, **kwargs) if key_func else (args, kwargs)
+            key = canonical_key(namespace, material)
+            hit, value = cache.get(key)
+            record_cache_event('hit' if hit else 'miss')
+            if hit:
+                return value
+            value = func(*args, **kwargs)
+            if cache.recording:
+                cache.put(key, value)
+            return value
+
+        return wrapper
+    return decorator
@@ -0,0 +1,41 @@
+"""
+WSGI entry point for production serving.
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+gunicorn.conf.py sets preload_app, so create_app() runs once in the master:
+the JANAF tables are loaded and the default views warmed before workers are
+forked, and every worker shares those pages copy-on-write instead of
+loading its own copy.
+"""
+
+import gc
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def create_app():
+    """
+    Load data, warm caches and return the Flask server behind the Dash app.
+
+    Returns:
+        Flask application (the WSGI callable)
+    """
+    start = time.time()
+    import app as dash_app
+
+    dash_app.warm_up()
+
+    # Move everything allocated so far out of the collector's reach, so
+    # garbage collection in the workers does not touch (and copy) the
+    # shared pages
+    gc.collect()
+    gc.freeze()
+
+    logger.info("WSGI app ready in %.2fs (preloaded before fork)", time.time() - start)
+    return dash_app.app.server
+
+
+application = create_app()